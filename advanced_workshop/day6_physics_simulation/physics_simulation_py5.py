@@ -22,10 +22,11 @@ Run with: python physics_simulation_py5.py
 
 import py5
 import math
+import numpy as np
 
 # Simulation objects
-objects = []
-springs = []
+world = None  # World, built by reset_simulation()
+springs = None  # SpringNetwork, built by reset_simulation()
 mode = 0
 modes = [
     "Newton's 1st Law (Inertia)",
@@ -36,42 +37,95 @@ modes = [
     "Kinetic Sculpture"
 ]
 
+# Number keys 1-6 select a mode
+KEY_MODES = {str(i + 1): i for i in range(len(modes))}
+
 # Physics constants
 GRAVITY = 0.3
 FRICTION = 0.99
 BOUNCE = 0.8
+FIXED_MASS = 100  # Objects at least this heavy are pinned in place
+
+# Random generator for per-frame noise (one NumPy call instead of one
+# py5.random call per object)
+rng = np.random.default_rng()
+
+
+class World:
+    """All physics objects in the scene, stored as parallel NumPy arrays.
+
+    Object i has position (x[i], y[i]), velocity (vx[i], vy[i]),
+    acceleration (ax[i], ay[i]), mass[i] and radius[i]. Forces are
+    accumulated with apply_force() and step() advances every object
+    in one pass.
+    """
+
+    __slots__ = ('x', 'y', 'vx', 'vy', 'ax', 'ay', 'mass', 'radius',
+                 'rgb', 'trail', 'trail_len', 'max_trail')
+
+    def __init__(self, max_trail=50):
+        self.x = np.empty(0, dtype=np.float32)
+        self.y = np.empty(0, dtype=np.float32)
+        self.vx = np.empty(0, dtype=np.float32)
+        self.vy = np.empty(0, dtype=np.float32)
+        self.ax = np.empty(0, dtype=np.float32)
+        self.ay = np.empty(0, dtype=np.float32)
+        self.mass = np.empty(0, dtype=np.float32)
+        self.radius = np.empty(0, dtype=np.float32)
+        self.rgb = np.empty((0, 3), dtype=np.uint8)
+        self.max_trail = max_trail
+        self.trail = np.empty((0, max_trail, 2), dtype=np.float32)
+        self.trail_len = np.empty(0, dtype=int)
+
+    def __len__(self):
+        return len(self.x)
+
+    def add(self, x, y, mass=1.0, vx=0.0, vy=0.0):
+        """Add objects and return the index of the first one.
+
+        Arguments may be scalars (one object) or equal-length arrays
+        (one object per element).
+        """
+        x, y, mass, vx, vy = np.broadcast_arrays(
+            *(np.asarray(v, dtype=np.float32) for v in (x, y, mass, vx, vy)))
+        n = x.size
+        first = len(self)
+        self.x = np.append(self.x, x)
+        self.y = np.append(self.y, y)
+        self.vx = np.append(self.vx, vx)
+        self.vy = np.append(self.vy, vy)
+        self.ax = np.append(self.ax, np.zeros(n, dtype=np.float32))
+        self.ay = np.append(self.ay, np.zeros(n, dtype=np.float32))
+        self.mass = np.append(self.mass, mass)
+        self.radius = np.append(self.radius, mass * 10)
+        col = rng.integers(100, 256, (n, 3), dtype=np.uint8)
+        self.rgb = np.vstack((self.rgb, col))
+        trail = np.zeros((n, self.max_trail, 2), dtype=np.float32)
+        self.trail = np.concatenate((self.trail, trail))
+        self.trail_len = np.append(self.trail_len, np.zeros(n, dtype=int))
+        return first
+
+    def movable(self):
+        """Boolean mask of the objects that are not pinned in place."""
+        return self.mass < FIXED_MASS
+
+    def apply_force(self, fx, fy, index=slice(None)):
+        """Apply a force to the selected objects (F = ma, so a = F/m)."""
+        self.ax[index] += fx / self.mass[index]
+        self.ay[index] += fy / self.mass[index]
+
+    def step(self, gravity=0.0, bounded=True):
+        """Update physics: velocity += acceleration, position += velocity.
+
+        gravity is a downward acceleration shared by every movable
+        object; bounded makes objects bounce off the canvas edges.
+        """
+        moving = self.movable()
 
-
-class PhysicsObject:
-    """A physics-enabled object with mass, position, velocity, and acceleration."""
-
-    def __init__(self, x, y, mass=1.0):
-        self.x = x
-        self.y = y
-        self.vx = 0
-        self.vy = 0
-        self.ax = 0
-        self.ay = 0
-        self.mass = mass
-        self.radius = mass * 10
-        self.col = py5.color(
-            py5.random(100, 255),
-            py5.random(100, 255),
-            py5.random(100, 255)
-        )
-        self.trail = []
-        self.max_trail = 50
-
-    def apply_force(self, fx, fy):
-        """Apply a force to this object (F = ma, so a = F/m)."""
-        self.ax += fx / self.mass
-        self.ay += fy / self.mass
-
-    def update(self):
-        """Update physics: velocity += acceleration, position += velocity."""
         # Newton's 2nd Law: acceleration changes velocity
-        self.vx += self.ax
-        self.vy += self.ay
+        # (pinned objects ignore forces, so their velocity stays zero)
+        self.vx += np.where(moving, self.ax, 0.0)
+        self.vy += np.where(moving, self.ay + gravity, 0.0)
 
         # Apply friction
         self.vx *= FRICTION
@@ -82,94 +136,129 @@ class PhysicsObject:
         self.y += self.vy
 
         # Reset acceleration each frame
-        self.ax = 0
-        self.ay = 0
+        self.ax[:] = 0
+        self.ay[:] = 0
 
-        # Store trail
-        self.trail.append((self.x, self.y))
-        if len(self.trail) > self.max_trail:
-            self.trail.pop(0)
+        if bounded:
+            self.check_boundaries()
+
+        # Store trail: shift every trail back one slot, newest point last
+        self.trail[:, :-1] = self.trail[:, 1:]
+        self.trail[:, -1, 0] = self.x
+        self.trail[:, -1, 1] = self.y
+        self.trail_len[moving] = np.minimum(self.trail_len[moving] + 1, self.max_trail)
 
     def check_boundaries(self):
-        """Bounce off screen edges."""
-        if self.x - self.radius < 0:
-            self.x = self.radius
-            self.vx *= -BOUNCE
-        elif self.x + self.radius > py5.width:
-            self.x = py5.width - self.radius
-            self.vx *= -BOUNCE
-
-        if self.y - self.radius < 0:
-            self.y = self.radius
-            self.vy *= -BOUNCE
-        elif self.y + self.radius > py5.height:
-            self.y = py5.height - self.radius
-            self.vy *= -BOUNCE
+        """Bounce off screen edges.
+
+        Branch-free: objects past an edge have their velocity flipped
+        and damped by BOUNCE, then every position is clamped so the
+        object sits inside the canvas.
+        """
+        w, h = py5.width, py5.height
+        r = self.radius
+
+        hit_x = (self.x < r) | (self.x > w - r)
+        hit_y = (self.y < r) | (self.y > h - r)
+        self.vx *= np.where(hit_x, -BOUNCE, 1.0)
+        self.vy *= np.where(hit_y, -BOUNCE, 1.0)
+        np.clip(self.x, r, w - r, out=self.x)
+        np.clip(self.y, r, h - r, out=self.y)
 
     def display(self, show_trail=True):
-        """Draw the object and its trail."""
-        # Draw trail
-        if show_trail and len(self.trail) > 1:
-            py5.no_fill()
-            py5.stroke(py5.red(self.col), py5.green(self.col), py5.blue(self.col), 100)
+        """Draw the objects, their trails and their velocity vectors."""
+        if len(self) == 0:
+            return
+
+        xs, ys, radii = self.x.tolist(), self.y.tolist(), self.radius.tolist()
+        for i, (r, g, b) in enumerate(self.rgb.tolist()):
+            # Draw trail
+            n = self.trail_len[i]
+            if show_trail and n > 1:
+                py5.no_fill()
+                py5.stroke(r, g, b, 100)
+                py5.stroke_weight(2)
+                py5.begin_shape()
+                py5.vertices(self.trail[i, -n:])
+                py5.end_shape()
+
+            # Draw object
+            py5.fill(r, g, b)
+            py5.stroke(255)
             py5.stroke_weight(2)
-            py5.begin_shape()
-            for tx, ty in self.trail:
-                py5.vertex(tx, ty)
-            py5.end_shape()
-
-        # Draw object
-        py5.fill(self.col)
-        py5.stroke(255)
-        py5.stroke_weight(2)
-        py5.ellipse(self.x, self.y, self.radius * 2, self.radius * 2)
+            py5.ellipse(xs[i], ys[i], radii[i] * 2, radii[i] * 2)
 
-        # Draw velocity vector
+        # Draw velocity vectors
         py5.stroke(255, 255, 0)
         py5.stroke_weight(2)
-        py5.line(self.x, self.y, self.x + self.vx * 5, self.y + self.vy * 5)
-
+        py5.lines(np.column_stack((self.x, self.y,
+                                   self.x + self.vx * 5, self.y + self.vy * 5)))
 
-class Spring:
-    """A spring connecting two physics objects."""
 
-    def __init__(self, obj_a, obj_b, rest_length=100, stiffness=0.05):
-        self.obj_a = obj_a
-        self.obj_b = obj_b
-        self.rest_length = rest_length
-        self.stiffness = stiffness
-        self.damping = 0.1
+class SpringNetwork:
+    """All springs in the scene, stored as parallel NumPy arrays.
 
-    def update(self):
-        """Apply spring force to connected objects."""
-        # Calculate distance
-        dx = self.obj_b.x - self.obj_a.x
-        dy = self.obj_b.y - self.obj_a.y
-        distance = math.sqrt(dx * dx + dy * dy)
+    Spring i joins objects a[i] and b[i] of the World with rest length
+    rest[i] and stiffness k[i], so Hooke's Law is evaluated for every
+    spring at once instead of one Python call per spring.
+    """
 
-        if distance == 0:
-            return
+    __slots__ = ('a', 'b', 'rest', 'k')
 
-        # Calculate spring force (Hooke's Law: F = -k * displacement)
-        displacement = distance - self.rest_length
-        force = self.stiffness * displacement
+    def __init__(self):
+        self.a = np.empty(0, dtype=np.intp)
+        self.b = np.empty(0, dtype=np.intp)
+        self.rest = np.empty(0, dtype=np.float32)
+        self.k = np.empty(0, dtype=np.float32)
 
-        # Normalize direction
-        nx = dx / distance
-        ny = dy / distance
+    def __len__(self):
+        return len(self.a)
 
-        # Apply force to both objects (Newton's 3rd Law)
-        fx = force * nx
-        fy = force * ny
+    def connect(self, i, j, rest_length=100, stiffness=0.05):
+        """Add a spring between objects i and j."""
+        self.a = np.append(self.a, i)
+        self.b = np.append(self.b, j)
+        self.rest = np.append(self.rest, np.float32(rest_length))
+        self.k = np.append(self.k, np.float32(stiffness))
 
-        self.obj_a.apply_force(fx, fy)
-        self.obj_b.apply_force(-fx, -fy)
+    def update(self, world):
+        """Apply spring forces to connected objects."""
+        if len(self) == 0:
+            return
 
-    def display(self):
-        """Draw the spring."""
+        x, y, mass = world.x, world.y, world.mass
+
+        # Calculate squared distance for every spring; springs of
+        # (near) zero length have no direction and exert no force, so
+        # they skip the sqrt and keep inv_d = 0
+        dx = x[self.b] - x[self.a]
+        dy = y[self.b] - y[self.a]
+        d2 = dx * dx + dy * dy
+        active = d2 > 1e-8
+        distance = np.sqrt(d2, where=active, out=np.zeros_like(d2))
+        inv_d = np.divide(1.0, distance, where=active, out=np.zeros_like(d2))
+
+        # Hooke's Law: F = -k * displacement, along the normalized
+        # direction (dx * inv_d, dy * inv_d)
+        force = self.k * (distance - self.rest) * inv_d
+        fx = force * dx
+        fy = force * dy
+
+        # Apply force to both objects (Newton's 3rd Law). np.add.at
+        # accumulates correctly when an object belongs to several springs.
+        np.add.at(world.ax, self.a, fx / mass[self.a])
+        np.add.at(world.ay, self.a, fy / mass[self.a])
+        np.add.at(world.ax, self.b, -fx / mass[self.b])
+        np.add.at(world.ay, self.b, -fy / mass[self.b])
+
+    def display(self, world):
+        """Draw every spring as one batch of lines."""
+        if len(self) == 0:
+            return
+        x, y = world.x, world.y
         py5.stroke(150)
         py5.stroke_weight(2)
-        py5.line(self.obj_a.x, self.obj_a.y, self.obj_b.x, self.obj_b.y)
+        py5.lines(np.column_stack((x[self.a], y[self.a], x[self.b], y[self.b])))
 
 
 def setup():
@@ -191,107 +280,76 @@ def setup():
 
 def reset_simulation():
     """Reset the simulation for the current mode."""
-    global objects, springs
-    objects = []
-    springs = []
+    global world, springs
+    world = World()
+    springs = SpringNetwork()
+
+    center_x, center_y = py5.width / 2, py5.height / 2
 
     if mode == 0:  # Newton's 1st Law - Inertia
         # Create objects with initial velocities
-        obj = PhysicsObject(200, 300, 2)
-        obj.vx = 3
-        obj.vy = 0
-        objects.append(obj)
-
-        obj2 = PhysicsObject(600, 300, 2)
-        obj2.vx = 0  # At rest
-        obj2.vy = 0
-        objects.append(obj2)
+        world.add(200, 300, 2, vx=3)
+        world.add(600, 300, 2)  # At rest
 
     elif mode == 1:  # Newton's 2nd Law - F=ma
         # Create objects with different masses
         for i in range(3):
             mass = (i + 1) * 1.5
-            obj = PhysicsObject(150 + i * 200, 300, mass)
-            objects.append(obj)
+            world.add(150 + i * 200, 300, mass)
 
     elif mode == 2:  # Newton's 3rd Law - Action-Reaction
         # Create two objects that will collide
-        obj1 = PhysicsObject(200, 300, 2)
-        obj1.vx = 4
-        objects.append(obj1)
-
-        obj2 = PhysicsObject(600, 300, 2)
-        obj2.vx = -4
-        objects.append(obj2)
+        world.add(200, 300, 2, vx=4)
+        world.add(600, 300, 2, vx=-4)
 
     elif mode == 3:  # Gravity Well
-        # Create orbiting objects
-        center_x, center_y = py5.width / 2, py5.height / 2
-        for i in range(5):
-            angle = i * py5.TWO_PI / 5
-            dist = 150
-            obj = PhysicsObject(
-                center_x + py5.cos(angle) * dist,
-                center_y + py5.sin(angle) * dist,
-                py5.random(1, 3)
-            )
+        # Create orbiting objects, evenly spaced around the center
+        angles = np.linspace(0, math.tau, 5, endpoint=False)
+        dist = 150
+        world.add(
+            center_x + np.cos(angles) * dist,
+            center_y + np.sin(angles) * dist,
+            rng.uniform(1, 3, len(angles)),
             # Give tangential velocity for orbit
-            obj.vx = -py5.sin(angle) * 3
-            obj.vy = py5.cos(angle) * 3
-            objects.append(obj)
+            vx=-np.sin(angles) * 3,
+            vy=np.cos(angles) * 3
+        )
 
     elif mode == 4:  # Spring Physics
         # Create a chain of springs
-        prev = None
         for i in range(5):
-            obj = PhysicsObject(200 + i * 100, 300, 1.5)
-            objects.append(obj)
-            if prev is not None:
-                springs.append(Spring(prev, obj, 100, 0.03))
-            prev = obj
+            world.add(200 + i * 100, 300, 1.5)
+            if i > 0:
+                springs.connect(i - 1, i, 100, 0.03)
         # Fix the first object
-        objects[0].mass = 1000  # Very heavy = fixed
+        world.mass[0] = 1000  # Very heavy = fixed
 
     elif mode == 5:  # Kinetic Sculpture
         # Create a complex spring network
-        center_x, center_y = py5.width / 2, py5.height / 2
-
         # Central anchor (fixed)
-        anchor = PhysicsObject(center_x, center_y, 1000)
-        objects.append(anchor)
+        anchor = world.add(center_x, center_y, 1000)
 
         # Orbiting nodes
-        for i in range(6):
-            angle = i * py5.TWO_PI / 6
-            obj = PhysicsObject(
-                center_x + py5.cos(angle) * 150,
-                center_y + py5.sin(angle) * 150,
-                1.5
-            )
-            objects.append(obj)
-            springs.append(Spring(anchor, obj, 150, 0.02))
+        angles = np.linspace(0, math.tau, 6, endpoint=False)
+        first = world.add(
+            center_x + np.cos(angles) * 150,
+            center_y + np.sin(angles) * 150,
+            1.5
+        )
+        for i in range(len(angles)):
+            node = first + i
+            springs.connect(anchor, node, 150, 0.02)
 
             # Connect to neighbors
             if i > 0:
-                springs.append(Spring(objects[i], obj, 100, 0.01))
+                springs.connect(node - 1, node, 100, 0.01)
 
 
 def draw():
     py5.background(20)
 
     # Update and display based on mode
-    if mode == 0:
-        draw_first_law()
-    elif mode == 1:
-        draw_second_law()
-    elif mode == 2:
-        draw_third_law()
-    elif mode == 3:
-        draw_gravity_well()
-    elif mode == 4:
-        draw_spring_physics()
-    elif mode == 5:
-        draw_kinetic_sculpture()
+    MODE_DRAWERS[mode]()
 
     # Draw UI
     draw_ui()
@@ -299,10 +357,8 @@ def draw():
 
 def draw_first_law():
     """Demonstrate Newton's First Law: Inertia."""
-    for obj in objects:
-        obj.update()
-        obj.check_boundaries()
-        obj.display()
+    world.step()
+    world.display()
 
     # Explanation
     py5.fill(255)
@@ -314,19 +370,18 @@ def draw_first_law():
 
 def draw_second_law():
     """Demonstrate Newton's Second Law: F = ma."""
-    # Apply same force to all (gravity)
-    for obj in objects:
-        # Same force, different accelerations due to mass
-        obj.apply_force(0, obj.mass * GRAVITY)
-        obj.update()
-        obj.check_boundaries()
-        obj.display()
-
-        # Show mass label
-        py5.fill(255)
-        py5.text_size(12)
-        py5.text_align(py5.CENTER)
-        py5.text(f"m={obj.mass:.1f}", obj.x, obj.y - obj.radius - 10)
+    # Apply same force to all (gravity): the force is mass * GRAVITY,
+    # so every object gets the same acceleration a = F/m
+    world.step(gravity=GRAVITY)
+    world.display()
+
+    # Show mass labels
+    py5.fill(255)
+    py5.text_size(12)
+    py5.text_align(py5.CENTER)
+    for mass, x, y, radius in zip(world.mass.tolist(), world.x.tolist(),
+                                  world.y.tolist(), world.radius.tolist()):
+        py5.text(f"m={mass:.1f}", x, y - radius - 10)
 
     py5.text_align(py5.LEFT)
     py5.fill(255)
@@ -337,13 +392,13 @@ def draw_second_law():
 
 def draw_third_law():
     """Demonstrate Newton's Third Law: Action-Reaction."""
-    # Check for collision
-    if len(objects) >= 2:
-        obj1, obj2 = objects[0], objects[1]
-        dx = obj2.x - obj1.x
-        dy = obj2.y - obj1.y
+    # Check for collision between the first two objects
+    if len(world) >= 2:
+        x, y, vx, vy = world.x, world.y, world.vx, world.vy
+        dx = x[1] - x[0]
+        dy = y[1] - y[0]
         dist = math.sqrt(dx * dx + dy * dy)
-        min_dist = obj1.radius + obj2.radius
+        min_dist = world.radius[0] + world.radius[1]
 
         if dist < min_dist and dist > 0:
             # Collision! Apply equal and opposite forces
@@ -351,8 +406,8 @@ def draw_third_law():
             ny = dy / dist
 
             # Relative velocity
-            dvx = obj1.vx - obj2.vx
-            dvy = obj1.vy - obj2.vy
+            dvx = vx[0] - vx[1]
+            dvy = vy[0] - vy[1]
             dvn = dvx * nx + dvy * ny
 
             # Only collide if objects are approaching
@@ -361,22 +416,20 @@ def draw_third_law():
                 impulse = dvn * 1.5
 
                 # Apply to both objects (equal and opposite)
-                obj1.vx -= impulse * nx
-                obj1.vy -= impulse * ny
-                obj2.vx += impulse * nx
-                obj2.vy += impulse * ny
+                vx[0] -= impulse * nx
+                vy[0] -= impulse * ny
+                vx[1] += impulse * nx
+                vy[1] += impulse * ny
 
                 # Separate objects
                 overlap = min_dist - dist
-                obj1.x -= overlap * nx / 2
-                obj1.y -= overlap * ny / 2
-                obj2.x += overlap * nx / 2
-                obj2.y += overlap * ny / 2
+                x[0] -= overlap * nx / 2
+                y[0] -= overlap * ny / 2
+                x[1] += overlap * nx / 2
+                y[1] += overlap * ny / 2
 
-    for obj in objects:
-        obj.update()
-        obj.check_boundaries()
-        obj.display()
+    world.step()
+    world.display()
 
     py5.fill(255)
     py5.text_size(12)
@@ -390,10 +443,10 @@ def draw_gravity_well():
 
     # Draw gravity well
     py5.no_fill()
+    py5.stroke_weight(1)
     for i in range(5):
         alpha = 100 - i * 20
         py5.stroke(100, 150, 255, alpha)
-        py5.stroke_weight(1)
         py5.ellipse(center_x, center_y, 50 + i * 60, 50 + i * 60)
 
     # Draw center mass
@@ -401,23 +454,19 @@ def draw_gravity_well():
     py5.no_stroke()
     py5.ellipse(center_x, center_y, 40, 40)
 
-    for obj in objects:
-        # Calculate gravitational force toward center
-        dx = center_x - obj.x
-        dy = center_y - obj.y
-        dist = math.sqrt(dx * dx + dy * dy)
+    # Calculate gravitational force toward center
+    dx = center_x - world.x
+    dy = center_y - world.y
+    dist = np.sqrt(dx * dx + dy * dy)
 
-        if dist > 30:  # Avoid singularity at center
-            # F = G * m1 * m2 / r^2 (simplified)
-            force = 200 / (dist * dist) * obj.mass
-            force = min(force, 2)  # Cap force
-
-            nx = dx / dist
-            ny = dy / dist
-            obj.apply_force(force * nx * 50, force * ny * 50)
+    pulled = dist > 30  # Avoid singularity at center
+    d = dist[pulled]
+    # F = G * m1 * m2 / r^2 (simplified)
+    force = np.minimum(200 / (d * d) * world.mass[pulled], 2)  # Cap force
+    world.apply_force(force * dx[pulled] / d * 50, force * dy[pulled] / d * 50, pulled)
 
-        obj.update()
-        obj.display()
+    world.step(bounded=False)
+    world.display()
 
     py5.fill(255)
     py5.text_size(12)
@@ -428,21 +477,15 @@ def draw_gravity_well():
 def draw_spring_physics():
     """Demonstrate spring physics with Hooke's Law."""
     # Apply gravity to all except fixed objects
-    for obj in objects:
-        if obj.mass < 100:  # Not fixed
-            obj.apply_force(0, GRAVITY * 10)
+    world.apply_force(0, GRAVITY * 10, world.movable())
 
     # Update springs
-    for spring in springs:
-        spring.update()
-        spring.display()
+    springs.update(world)
+    springs.display(world)
 
     # Update and display objects
-    for obj in objects:
-        if obj.mass < 100:  # Not fixed
-            obj.update()
-            obj.check_boundaries()
-        obj.display(show_trail=False)
+    world.step()
+    world.display(show_trail=False)
 
     py5.fill(255)
     py5.text_size(12)
@@ -453,17 +496,17 @@ def draw_spring_physics():
 def draw_kinetic_sculpture():
     """Create a kinetic sculpture with springs."""
     # Update springs
-    for spring in springs:
-        spring.update()
-        spring.display()
+    springs.update(world)
+    springs.display(world)
+
+    # Add slight random perturbation, drawn for every movable object at once
+    moving = world.movable()
+    noise = rng.uniform(-0.5, 0.5, (np.count_nonzero(moving), 2)).astype(np.float32)
+    world.apply_force(noise[:, 0], noise[:, 1], moving)
 
     # Update and display objects
-    for obj in objects:
-        if obj.mass < 100:  # Not fixed
-            # Add slight random perturbation
-            obj.apply_force(py5.random(-0.5, 0.5), py5.random(-0.5, 0.5))
-            obj.update()
-        obj.display(show_trail=True)
+    world.step(bounded=False)
+    world.display(show_trail=True)
 
     py5.fill(255)
     py5.text_size(12)
@@ -471,6 +514,17 @@ def draw_kinetic_sculpture():
     py5.text("Click to disturb the sculpture", 20, py5.height - 20)
 
 
+# Drawing function for each mode, indexed like `modes`
+MODE_DRAWERS = (
+    draw_first_law,
+    draw_second_law,
+    draw_third_law,
+    draw_gravity_well,
+    draw_spring_physics,
+    draw_kinetic_sculpture
+)
+
+
 def draw_ui():
     """Draw mode indicator."""
     py5.fill(255)
@@ -484,78 +538,54 @@ def draw_ui():
 
 def mouse_pressed():
     """Handle mouse interaction."""
-    global objects
-
-    if mode == 0:  # Apply force to nearest object
-        for obj in objects:
-            dx = py5.mouse_x - obj.x
-            dy = py5.mouse_y - obj.y
-            dist = math.sqrt(dx * dx + dy * dy)
-            if dist < 100:
-                obj.apply_force(-dx * 0.5, -dy * 0.5)
+    if mode == 0:  # Apply force to nearby objects
+        dx = py5.mouse_x - world.x
+        dy = py5.mouse_y - world.y
+        near = dx * dx + dy * dy < 100 * 100
+        world.apply_force(-dx[near] * 0.5, -dy[near] * 0.5, near)
 
     elif mode == 1:  # Apply upward force
-        for obj in objects:
-            obj.apply_force(0, -20)
+        world.apply_force(0, -20)
 
     elif mode == 3:  # Add new orbiting object
         center_x, center_y = py5.width / 2, py5.height / 2
-        obj = PhysicsObject(py5.mouse_x, py5.mouse_y, py5.random(1, 3))
         # Calculate tangential velocity
         dx = py5.mouse_x - center_x
         dy = py5.mouse_y - center_y
         dist = math.sqrt(dx * dx + dy * dy)
+        vx, vy = 0.0, 0.0
         if dist > 0:
-            obj.vx = -dy / dist * 4
-            obj.vy = dx / dist * 4
-        objects.append(obj)
+            vx = -dy / dist * 4
+            vy = dx / dist * 4
+        world.add(py5.mouse_x, py5.mouse_y, py5.random(1, 3), vx=vx, vy=vy)
 
     elif mode == 5:  # Disturb sculpture
-        for obj in objects:
-            if obj.mass < 100:
-                dx = obj.x - py5.mouse_x
-                dy = obj.y - py5.mouse_y
-                dist = math.sqrt(dx * dx + dy * dy)
-                if dist > 0 and dist < 200:
-                    force = 10 / dist * 100
-                    obj.apply_force(dx / dist * force, dy / dist * force)
+        dx = world.x - py5.mouse_x
+        dy = world.y - py5.mouse_y
+        dist = np.sqrt(dx * dx + dy * dy)
+        near = world.movable() & (dist > 0) & (dist < 200)
+        d = dist[near]
+        force = 10 / d * 100
+        world.apply_force(dx[near] / d * force, dy[near] / d * force, near)
 
 
 def mouse_dragged():
     """Handle mouse dragging for spring mode."""
     if mode == 4:
-        for obj in objects:
-            if obj.mass < 100:
-                dx = py5.mouse_x - obj.x
-                dy = py5.mouse_y - obj.y
-                dist = math.sqrt(dx * dx + dy * dy)
-                if dist < obj.radius * 2:
-                    obj.x = py5.mouse_x
-                    obj.y = py5.mouse_y
-                    obj.vx = 0
-                    obj.vy = 0
+        dx = py5.mouse_x - world.x
+        dy = py5.mouse_y - world.y
+        grabbed = world.movable() & (dx * dx + dy * dy < (world.radius * 2) ** 2)
+        world.x[grabbed] = py5.mouse_x
+        world.y[grabbed] = py5.mouse_y
+        world.vx[grabbed] = 0
+        world.vy[grabbed] = 0
 
 
 def key_pressed():
     global mode
 
-    if py5.key == '1':
-        mode = 0
-        reset_simulation()
-    elif py5.key == '2':
-        mode = 1
-        reset_simulation()
-    elif py5.key == '3':
-        mode = 2
-        reset_simulation()
-    elif py5.key == '4':
-        mode = 3
-        reset_simulation()
-    elif py5.key == '5':
-        mode = 4
-        reset_simulation()
-    elif py5.key == '6':
-        mode = 5
+    if py5.key in KEY_MODES:
+        mode = KEY_MODES[py5.key]
         reset_simulation()
     elif py5.key == 'r':
         reset_simulation()
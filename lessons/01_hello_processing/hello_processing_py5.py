@@ -23,16 +23,11 @@ def setup():
     """
     py5.size(800, 600)  # Create an 800x600 pixel canvas
     py5.background(240)  # Light gray background
+    py5.no_loop()  # Static composition: draw it once, no frame loop
     print("Hello py5!")
     print(f"Canvas size: {py5.width} x {py5.height}")
 
-
-def draw():
-    """
-    draw() runs continuously in a loop (~60 times per second).
-    This is where animation and interaction happen.
-    """
-    # For now, we'll draw a static composition
+    # Draw a static composition
     # (We'll add animation in Lesson 03)
 
     # Set fill color to blue
@@ -68,8 +63,15 @@ def draw():
     py5.text_align(py5.CENTER, py5.CENTER)
     py5.text("Welcome to py5!", py5.width/2, 550)
 
-    # Stop the draw loop since this is static
-    py5.no_loop()
+
+def draw():
+    """
+    draw() normally runs continuously in a loop (~60 times per second),
+    which is where animation and interaction happen. Here py5.no_loop() in
+    setup() stops the loop, so draw() runs just once.
+    """
+    # Nothing to animate yet: the composition is drawn once in setup()
+    pass
 
 
 # Exercise Ideas:
@@ -15,6 +15,7 @@ Run with: python color_systems_py5.py
 """
 
 import py5
+import math
 
 # Color mode state
 use_hsb = False
@@ -119,11 +120,15 @@ def draw_hsb_mode():
     center_y = 300
     radius = 120
 
+    # Bind loop-invariant lookups to locals once
+    fill, arc, rect, remap = py5.fill, py5.arc, py5.rect, py5.remap
+    radians = math.radians
+
     for angle in range(360):
         h = angle
-        py5.fill(h, 100, 100)
-        py5.arc(center_x, center_y, radius * 2, radius * 2,
-                py5.radians(angle), py5.radians(angle + 2))
+        fill(h, 100, 100)
+        arc(center_x, center_y, radius * 2, radius * 2,
+            radians(angle), radians(angle + 2))
 
     # White center
     py5.fill(0, 0, 100)
@@ -135,21 +140,20 @@ def draw_hsb_mode():
     py5.text("Hue Wheel", 160, 450)
 
     # Saturation gradient
+    py5.no_stroke()
     for x in range(200):
-        s = py5.remap(x, 0, 200, 0, 100)
-        py5.fill(200, s, 100)  # Fixed hue (cyan), varying saturation
-        py5.no_stroke()
-        py5.rect(450 + x, 100, 1, 60)
+        s = remap(x, 0, 200, 0, 100)
+        fill(200, s, 100)  # Fixed hue (cyan), varying saturation
+        rect(450 + x, 100, 1, 60)
 
     py5.fill(255)
     py5.text("Saturation (0-100)", 500, 180)
 
     # Brightness gradient
     for x in range(200):
-        b = py5.remap(x, 0, 200, 0, 100)
-        py5.fill(200, 100, b)  # Fixed hue and saturation, varying brightness
-        py5.no_stroke()
-        py5.rect(450 + x, 220, 1, 60)
+        b = remap(x, 0, 200, 0, 100)
+        fill(200, 100, b)  # Fixed hue and saturation, varying brightness
+        rect(450 + x, 220, 1, 60)
 
     py5.fill(255)
     py5.text("Brightness (0-100)", 500, 300)
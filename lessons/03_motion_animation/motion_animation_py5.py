@@ -15,6 +15,9 @@ Run with: python motion_animation_py5.py
 """
 
 import py5
+import math
+from array import array
+import numpy as np
 
 # Animation variables
 x = 0
@@ -29,12 +32,52 @@ target_y = 300
 ease_x = 0
 ease_y = 0
 
+# Sine lookup table: one full turn (0..TWO_PI) in SIN_SIZE steps.
+# Indexing a table is much cheaper than calling sin() in a loop;
+# cos(a) is sin(a + quarter turn), so one table serves both.
+SIN_SIZE = 4096
+SIN_MASK = SIN_SIZE - 1  # Wraps any index into the table
+SIN_SCALE = SIN_SIZE / (2 * math.pi)  # Radians -> table index
+SIN_LUT = array('d', [math.sin(2 * math.pi * k / SIN_SIZE) for k in range(SIN_SIZE)])
+
+# Linear-motion ball and its fading trail, pre-rendered in setup()
+trail_sprite = None
+TRAIL_HEAD = 145  # x of the ball's center inside trail_sprite
+
+# Circular-motion orbit paths and center, pre-rendered in setup()
+orbit_sprite = None
+ORBIT_RADIUS = 150
+ORBIT_HALF = ORBIT_RADIUS + 2  # Half the sprite size (room for the stroke)
+
+# Sine-wave path buffers, built in setup(): the phase offset of each
+# vertex and an (N, 2) array of vertex coordinates reused every frame
+wave_phase = None
+wave_points = None
+
+
+def lut_sin(a):
+    """Table-based sin(a)."""
+    return SIN_LUT[int(a * SIN_SCALE) & SIN_MASK]
+
+
+def lut_cos(a):
+    """Table-based cos(a), a quarter turn ahead of sin."""
+    return SIN_LUT[(int(a * SIN_SCALE) + SIN_SIZE // 4) & SIN_MASK]
+
 
 def setup():
     py5.size(800, 600)
-    global ease_x, ease_y
+    global ease_x, ease_y, wave_phase, wave_points, trail_sprite, orbit_sprite
     ease_x = py5.width / 2
     ease_y = py5.height / 2
+
+    wave_xs = np.arange(py5.width, dtype=np.float32)
+    wave_phase = wave_xs * np.float32(0.02)
+    wave_points = np.empty((py5.width, 2), dtype=np.float32)
+    wave_points[:, 0] = wave_xs
+
+    trail_sprite = make_trail_sprite()
+    orbit_sprite = make_orbit_sprite()
     print("Lesson 03: Motion and Animation")
     print("\nControls:")
     print("  Press 1-4 to switch modes")
@@ -42,6 +85,41 @@ def setup():
     print("  Click to set easing target (mode 4)")
 
 
+def make_trail_sprite():
+    """Render the linear-motion ball and its fading trail once."""
+    sprite = py5.create_graphics(TRAIL_HEAD + 25, 50)
+    sprite.begin_draw()
+    sprite.no_stroke()
+    sprite.fill(66, 133, 244)
+    sprite.ellipse(TRAIL_HEAD, 25, 50, 50)
+
+    # Each trail circle is smaller and more transparent
+    for i in range(10):
+        alpha = py5.remap(i, 0, 10, 200, 0)
+        sprite.fill(66, 133, 244, alpha)
+        sprite.ellipse(TRAIL_HEAD - i * 15, 25, 50 - i * 4, 50 - i * 4)
+    sprite.end_draw()
+    return sprite
+
+
+def make_orbit_sprite():
+    """Render the circular-motion orbit paths and center once."""
+    size = ORBIT_HALF * 2
+    sprite = py5.create_graphics(size, size)
+    sprite.begin_draw()
+    sprite.stroke(255, 50)
+    sprite.stroke_weight(1)
+    sprite.no_fill()
+    sprite.ellipse(ORBIT_HALF, ORBIT_HALF, ORBIT_RADIUS * 2, ORBIT_RADIUS * 2)
+    sprite.ellipse(ORBIT_HALF, ORBIT_HALF, 160, 160)
+
+    sprite.fill(100)
+    sprite.no_stroke()
+    sprite.ellipse(ORBIT_HALF, ORBIT_HALF, 30, 30)
+    sprite.end_draw()
+    return sprite
+
+
 def draw():
     py5.background(30)
 
@@ -65,44 +143,42 @@ def draw_linear():
     """Simple linear motion - constant speed."""
     global x
 
+    w = py5.width
+    h = py5.height
+
     # Move right at constant speed
     x += 3
 
     # Wrap around when off screen
-    if x > py5.width + 25:
+    if x > w + 25:
         x = -25
 
-    # Draw moving circle
-    py5.fill(66, 133, 244)
-    py5.no_stroke()
-    py5.ellipse(x, py5.height/2, 50, 50)
-
-    # Draw trail
-    for i in range(10):
-        alpha = py5.remap(i, 0, 10, 200, 0)
-        py5.fill(66, 133, 244, alpha)
-        py5.ellipse(x - i * 15, py5.height/2, 50 - i * 4, 50 - i * 4)
+    # Draw moving circle and its trail (pre-rendered in setup())
+    py5.image(trail_sprite, x - TRAIL_HEAD, h/2 - 25)
 
     # Explanation
     py5.fill(255)
     py5.text_size(14)
-    py5.text("Linear motion: constant velocity", 20, py5.height - 60)
-    py5.text("x += speed (same amount each frame)", 20, py5.height - 40)
+    py5.text("Linear motion: constant velocity", 20, h - 60)
+    py5.text("x += speed (same amount each frame)", 20, h - 40)
 
 
 def draw_sine_wave():
     """Sine wave motion - smooth oscillation."""
     global angle
 
+    w = py5.width
+    h = py5.height
+
     angle += 0.03
 
     # Horizontal position based on angle
-    x = py5.width / 2
+    x = w / 2
     # Vertical oscillation using sine
-    y = py5.height/2 + py5.sin(angle) * 150
+    y = h/2 + lut_sin(angle) * 150
 
     # Secondary ball with different phase
-    y2 = py5.height/2 + py5.sin(angle + py5.PI) * 150
+    y2 = h/2 + lut_sin(angle + math.pi) * 150
 
     # Draw balls
     py5.fill(219, 68, 55)
@@ -116,51 +192,46 @@ def draw_sine_wave():
     py5.stroke(255, 100)
     py5.stroke_weight(1)
     py5.no_fill()
+    # All vertices at once: y = sin(angle + x * 0.02) for every x
+    wave_points[:, 1] = h / 2 + np.sin(angle + wave_phase) * 150
     py5.begin_shape()
-    for i in range(py5.width):
-        wave_y = py5.height/2 + py5.sin(angle + i * 0.02) * 150
-        py5.vertex(i, wave_y)
+    py5.vertices(wave_points)
     py5.end_shape()
 
     # Explanation
     py5.no_stroke()
     py5.fill(255)
     py5.text_size(14)
-    py5.text("Sine wave: smooth oscillation", 20, py5.height - 60)
-    py5.text("y = sin(angle) * amplitude", 20, py5.height - 40)
+    py5.text("Sine wave: smooth oscillation", 20, h - 60)
+    py5.text("y = sin(angle) * amplitude", 20, h - 40)
 
 
 def draw_circular():
     """Circular motion using sin and cos."""
     global angle
 
+    w = py5.width
+    h = py5.height
+
     angle += 0.02
 
-    center_x = py5.width / 2
-    center_y = py5.height / 2
-    radius = 150
+    center_x = w / 2
+    center_y = h / 2
+    radius = ORBIT_RADIUS
 
     # Calculate position on circle
-    x = center_x + py5.cos(angle) * radius
-    y = center_y + py5.sin(angle) * radius
+    x = center_x + lut_cos(angle) * radius
+    y = center_y + lut_sin(angle) * radius
 
     # Second circle with different radius and speed
-    x2 = center_x + py5.cos(angle * 2) * 80
-    y2 = center_y + py5.sin(angle * 2) * 80
+    x2 = center_x + lut_cos(angle * 2) * 80
+    y2 = center_y + lut_sin(angle * 2) * 80
 
-    # Draw orbit paths
-    py5.stroke(255, 50)
-    py5.stroke_weight(1)
-    py5.no_fill()
-    py5.ellipse(center_x, center_y, radius * 2, radius * 2)
-    py5.ellipse(center_x, center_y, 160, 160)
-
-    # Draw center
-    py5.fill(100)
-    py5.no_stroke()
-    py5.ellipse(center_x, center_y, 30, 30)
+    # Draw orbit paths and center (pre-rendered in setup())
+    py5.image(orbit_sprite, center_x - ORBIT_HALF, center_y - ORBIT_HALF)
 
     # Draw orbiting circles
+    py5.no_stroke()
     py5.fill(15, 157, 88)
     py5.ellipse(x, y, 40, 40)
 
@@ -169,20 +240,23 @@ def draw_circular():
 
     # Draw connecting line
     py5.stroke(255, 100)
+    py5.stroke_weight(1)
     py5.line(center_x, center_y, x, y)
 
     # Explanation
     py5.no_stroke()
     py5.fill(255)
     py5.text_size(14)
-    py5.text("Circular motion: sin + cos", 20, py5.height - 60)
-    py5.text("x = cos(angle) * r, y = sin(angle) * r", 20, py5.height - 40)
+    py5.text("Circular motion: sin + cos", 20, h - 60)
+    py5.text("x = cos(angle) * r, y = sin(angle) * r", 20, h - 40)
 
 
 def draw_easing():
     """Easing motion - smooth acceleration/deceleration."""
     global ease_x, ease_y, target_x, target_y
 
+    h = py5.height
+
     # Easing formula: move a fraction of remaining distance
     easing = 0.05
     ease_x += (target_x - ease_x) * easing
@@ -209,9 +283,9 @@ def draw_easing():
     py5.no_stroke()
     py5.fill(255)
     py5.text_size(14)
-    py5.text("Easing: smooth acceleration", 20, py5.height - 80)
-    py5.text("x += (target - x) * easing", 20, py5.height - 60)
-    py5.text("Click anywhere to set new target", 20, py5.height - 40)
+    py5.text("Easing: smooth acceleration", 20, h - 80)
+    py5.text("x += (target - x) * easing", 20, h - 60)
+    py5.text("Click anywhere to set new target", 20, h - 40)
 
 
 def key_pressed():
@@ -19,15 +19,23 @@ import py5
 # Drawing state
 strokes = []
 current_color = None
+current_color_rgb = (0, 0, 0)  # (r, g, b) of current_color, cached
 brush_size = 20
 colors = []
 
+# UI: the palette bar is pre-rendered and redrawn only when it changes,
+# the brush preview only when the mouse moves
+palette_bar = None
+BAR_HEIGHT = 40
+preview_x = -1000
+preview_y = -1000
+
 
 def setup():
     py5.size(800, 600)
     py5.background(250)
 
-    global colors, current_color
+    global colors
     # Art-inspired palette
     colors = [
         py5.color(41, 65, 114),    # Deep blue
@@ -36,7 +44,7 @@ def setup():
         py5.color(156, 136, 103),  # Warm gray
         py5.color(180, 60, 60),    # Muted red
     ]
-    current_color = colors[0]
+    select_color(0)
 
     print("Lesson 04: Interactivity")
     print("\nControls:")
@@ -48,6 +56,16 @@ def setup():
     print("  'p': Show palette")
 
 
+def select_color(index):
+    """Make colors[index] the brush color and cache its RGB components."""
+    global current_color, current_color_rgb
+    current_color = colors[index]
+    current_color_rgb = (py5.red(current_color),
+                         py5.green(current_color),
+                         py5.blue(current_color))
+    render_palette_bar()
+
+
 def draw():
     # Draw UI elements
     draw_brush_preview()
@@ -56,48 +74,70 @@ def draw():
 
 def draw_brush_preview():
     """Show current brush at mouse position."""
+    global preview_x, preview_y
+
+    # Only redraw when the mouse has moved
+    mx = py5.mouse_x
+    my = py5.mouse_y
+    if abs(mx - preview_x) <= 1 and abs(my - preview_y) <= 1:
+        return
+    preview_x = mx
+    preview_y = my
+
     # Brush preview (follows mouse)
     py5.no_fill()
     py5.stroke(0, 100)
     py5.stroke_weight(1)
-    py5.ellipse(py5.mouse_x, py5.mouse_y, brush_size, brush_size)
+    py5.ellipse(mx, my, brush_size, brush_size)
 
 
 def draw_palette_bar():
-    """Draw color palette at bottom."""
-    bar_height = 40
+    """Draw color palette at bottom (pre-rendered by render_palette_bar())."""
+    py5.image(palette_bar, 0, py5.height - BAR_HEIGHT)
+
+
+def render_palette_bar():
+    """Render the palette bar; called whenever the color or brush size changes."""
+    global palette_bar
+    w = py5.width
     swatch_size = 30
 
+    if palette_bar is None:
+        palette_bar = py5.create_graphics(w, BAR_HEIGHT)
+    bar = palette_bar
+    bar.begin_draw()
+
     # Background bar
-    py5.no_stroke()
-    py5.fill(240)
-    py5.rect(0, py5.height - bar_height, py5.width, bar_height)
+    bar.no_stroke()
+    bar.fill(240)
+    bar.rect(0, 0, w, BAR_HEIGHT)
 
     # Color swatches
     for i, c in enumerate(colors):
         x = 20 + i * (swatch_size + 10)
-        y = py5.height - bar_height + 5
+        y = 5
 
         # Highlight current color
         if c == current_color:
-            py5.stroke(0)
-            py5.stroke_weight(3)
+            bar.stroke(0)
+            bar.stroke_weight(3)
         else:
-            py5.stroke(150)
-            py5.stroke_weight(1)
+            bar.stroke(150)
+            bar.stroke_weight(1)
 
-        py5.fill(c)
-        py5.rect(x, y, swatch_size, swatch_size, 5)
+        bar.fill(c)
+        bar.rect(x, y, swatch_size, swatch_size, 5)
 
     # Brush size indicator
-    py5.fill(0)
-    py5.no_stroke()
-    py5.text_size(12)
-    py5.text(f"Size: {brush_size}", py5.width - 100, py5.height - 15)
+    bar.fill(0)
+    bar.no_stroke()
+    bar.text_size(12)
+    bar.text(f"Size: {brush_size}", w - 100, BAR_HEIGHT - 15)
 
     # Key hints
-    py5.fill(100)
-    py5.text("Keys: 1-5 color | Up/Down size | c clear | s save", 220, py5.height - 15)
+    bar.fill(100)
+    bar.text("Keys: 1-5 color | Up/Down size | c clear | s save", 220, BAR_HEIGHT - 15)
+    bar.end_draw()
 
 
 def mouse_dragged():
@@ -107,59 +147,52 @@ def mouse_dragged():
     alpha = py5.remap(speed, 0, 50, 200, 50)
     alpha = py5.constrain(alpha, 50, 200)
 
-    # Draw brush stroke
-    py5.no_stroke()
-    r = py5.red(current_color)
-    g = py5.green(current_color)
-    b = py5.blue(current_color)
-    py5.fill(r, g, b, alpha)
-
-    # Draw multiple circles for smooth stroke
-    steps = int(speed) + 1
-    for i in range(steps):
-        t = float(i) / steps
-        x = py5.lerp(py5.pmouse_x, py5.mouse_x, t)
-        y = py5.lerp(py5.pmouse_y, py5.mouse_y, t)
-        py5.ellipse(x, y, brush_size, brush_size)
+    # Draw brush stroke: one thick line with round caps covers the
+    # same area as a chain of brush-sized circles along the path
+    r, g, b = current_color_rgb
+    py5.stroke(r, g, b, alpha)
+    py5.stroke_weight(brush_size)
+    py5.stroke_cap(py5.ROUND)
+    py5.line(py5.pmouse_x, py5.pmouse_y, py5.mouse_x, py5.mouse_y)
 
 
 def mouse_pressed():
     """Single click draws a dot."""
     if py5.mouse_y < py5.height - 45:  # Not on palette bar
         py5.no_stroke()
-        r = py5.red(current_color)
-        g = py5.green(current_color)
-        b = py5.blue(current_color)
+        r, g, b = current_color_rgb
         py5.fill(r, g, b, 200)
         py5.ellipse(py5.mouse_x, py5.mouse_y, brush_size, brush_size)
 
 
 def key_pressed():
-    global current_color, brush_size
+    global brush_size
 
     # Number keys for color selection
     if py5.key == '1' and len(colors) >= 1:
-        current_color = colors[0]
+        select_color(0)
         print("Color: Deep Blue")
     elif py5.key == '2' and len(colors) >= 2:
-        current_color = colors[1]
+        select_color(1)
         print("Color: Burnt Orange")
     elif py5.key == '3' and len(colors) >= 3:
-        current_color = colors[2]
+        select_color(2)
         print("Color: Sage Green")
     elif py5.key == '4' and len(colors) >= 4:
-        current_color = colors[3]
+        select_color(3)
         print("Color: Warm Gray")
     elif py5.key == '5' and len(colors) >= 5:
-        current_color = colors[4]
+        select_color(4)
         print("Color: Muted Red")
 
     # Arrow keys for brush size
     elif py5.key_code == py5.UP:
         brush_size = min(brush_size + 5, 100)
+        render_palette_bar()
         print(f"Brush size: {brush_size}")
     elif py5.key_code == py5.DOWN:
         brush_size = max(brush_size - 5, 5)
+        render_palette_bar()
         print(f"Brush size: {brush_size}")
 
     # Clear canvas
@@ -15,6 +15,15 @@ Run with: python randomness_noise_py5.py
 """
 
 import py5
+import numpy as np
+
+# Try to import numba to compile the 2D noise field
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    print("Numba not available - using py5.noise() for the 2D noise field")
 
 # Mode control
 mode = 0
@@ -24,11 +33,81 @@ modes = ["Random", "Noise 1D", "Noise 2D", "Comparison"]
 t = 0
 particles = []
 
+# 1D noise graph as an (N, 2) array of vertex coordinates, built in
+# setup(): x is fixed, y is refilled every frame
+noise_line = None
+
+# Ring buffer of the graph's noise samples, oldest (leftmost) at
+# noise_head, and the frame it was last advanced on
+noise_ring = None
+noise_samples = None  # The ring unrolled into column order
+noise_head = 0
+noise_ring_frame = -2
+
+# Noise-field sample coordinates for every pixel, built in setup()
+noise_grid_x = None
+noise_grid_y = None
+
+# Compiled noise field (used when numba is available): the Perlin
+# permutation table and the output buffer filled every frame
+noise_perm = None
+noise_field = None
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _fade(t):
+        return t * t * t * (t * (t * 6 - 15) + 10)
+
+    @njit(cache=True, fastmath=True)
+    def _grad(h, x, y):
+        # One of four diagonal gradient directions
+        h &= 3
+        return (x if h & 1 == 0 else -x) + (y if h & 2 == 0 else -y)
+
+    @njit(cache=True, fastmath=True)
+    def _perlin(perm, x, y):
+        """Classic 2D Perlin noise in about -1 to 1."""
+        xi = int(np.floor(x))
+        yi = int(np.floor(y))
+        xf = x - xi
+        yf = y - yi
+        xi &= 255
+        yi &= 255
+        u = _fade(xf)
+        v = _fade(yf)
+        aa = perm[perm[xi] + yi]
+        ab = perm[perm[xi] + yi + 1]
+        ba = perm[perm[xi + 1] + yi]
+        bb = perm[perm[xi + 1] + yi + 1]
+        x1 = _grad(aa, xf, yf) + u * (_grad(ba, xf - 1, yf) - _grad(aa, xf, yf))
+        x2 = _grad(ab, xf, yf - 1) + u * (_grad(bb, xf - 1, yf - 1) - _grad(ab, xf, yf - 1))
+        return x1 + v * (x2 - x1)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def compute_noise_field(perm, t, scale, out):
+        """Fill out[y, x] with 4-octave noise (0-1) at (x, y + t) * scale."""
+        rows, cols = out.shape
+        for j in prange(rows):
+            for i in range(cols):
+                x = i * scale
+                y = j * scale + t
+                total = 0.0
+                amp = 0.5
+                for _ in range(4):  # Octaves halve in weight, like noise()
+                    total += amp * _perlin(perm, x, y)
+                    x *= 2.0
+                    y *= 2.0
+                    amp *= 0.5
+                out[j, i] = total * 0.5 + 0.5
+
 
 def setup():
     py5.size(800, 600)
     py5.noise_seed(42)  # Consistent results
     init_particles()
+    init_noise_line()
+    init_noise_grid(42)
 
     print("Lesson 05: Randomness and Noise")
     print("\nControls:")
@@ -50,6 +129,55 @@ def init_particles():
         })
 
 
+def init_noise_line():
+    """Allocate the 1D noise graph with one vertex per pixel column."""
+    global noise_line, noise_ring, noise_samples, noise_ring_frame
+    noise_line = np.empty((py5.width, 2), dtype=np.float32)
+    noise_line[:, 0] = np.arange(py5.width)
+    noise_ring = np.empty(py5.width, dtype=np.float32)
+    noise_samples = np.empty(py5.width, dtype=np.float32)
+    noise_ring_frame = -2  # Forces a full resample
+
+
+def sample_noise_line(w):
+    """Return noise(x * 0.01 + t) for every column x of the 1D graph.
+
+    t moves by exactly one column step per frame, so on consecutive
+    frames every sample shifts one column left and only the new right
+    edge has to be computed; the ring buffer makes that shift free.
+    Any other jump in t (e.g. after switching modes) resamples all.
+    """
+    global noise_head, noise_ring_frame
+    frame = py5.frame_count
+    if frame == noise_ring_frame + 1:
+        noise_ring[noise_head] = py5.noise((w - 1) * 0.01 + t)
+        noise_head = (noise_head + 1) % w
+    else:
+        noise_ring[:] = py5.noise(noise_line[:, 0] * 0.01 + t)
+        noise_head = 0
+    noise_ring_frame = frame
+
+    noise_samples[:w - noise_head] = noise_ring[noise_head:]
+    noise_samples[w - noise_head:] = noise_ring[:noise_head]
+    return noise_samples
+
+
+def init_noise_grid(seed):
+    """Precompute the (x, y) noise coordinates of the 2D noise field."""
+    global noise_grid_x, noise_grid_y, noise_perm, noise_field
+    scale_factor = 0.01
+    noise_grid_x, noise_grid_y = np.meshgrid(
+        np.arange(py5.width) * scale_factor,
+        np.arange(py5.height - 50) * scale_factor
+    )
+
+    if NUMBA_AVAILABLE:
+        # Permutation table repeated twice so lookups never wrap
+        perm = np.random.default_rng(seed).permutation(256)
+        noise_perm = np.concatenate((perm, perm)).astype(np.int32)
+        noise_field = np.empty(noise_grid_x.shape, dtype=np.float32)
+
+
 def draw():
     global t
     t += 0.01
@@ -74,13 +202,16 @@ def draw():
 
 def draw_random_demo():
     """Demonstrate random() - chaotic, unpredictable."""
+    w = py5.width
+    h = py5.height
+
     py5.background(240)
 
     # Random dots
     py5.no_stroke()
     for i in range(100):
-        x = py5.random(py5.width)
-        y = py5.random(60, py5.height - 60)
+        x = py5.random(w)
+        y = py5.random(60, h - 60)
         r = py5.random(5, 20)
 
         # Random color
@@ -92,8 +223,8 @@ def draw_random_demo():
     py5.stroke_weight(2)
     py5.no_fill()
     py5.begin_shape()
-    for x in range(0, py5.width, 10):
-        y = py5.random(py5.height/2 - 100, py5.height/2 + 100)
+    for x in range(0, w, 10):
+        y = py5.random(h/2 - 100, h/2 + 100)
         py5.vertex(x, y)
     py5.end_shape()
 
@@ -101,85 +232,93 @@ def draw_random_demo():
     py5.fill(0)
     py5.no_stroke()
     py5.text_size(12)
-    py5.text("random(): Each value is completely independent", 20, py5.height - 40)
-    py5.text("Results are chaotic and unpredictable", 20, py5.height - 20)
+    py5.text("random(): Each value is completely independent", 20, h - 40)
+    py5.text("Results are chaotic and unpredictable", 20, h - 20)
 
 
 def draw_noise_1d():
     """Demonstrate 1D Perlin noise - smooth, organic."""
+    w = py5.width
+    h = py5.height
+
     py5.background(240)
 
     # Noise line graph
     py5.stroke(0)
     py5.stroke_weight(2)
     py5.no_fill()
+    # One sample per column; noise() returns 0-1, so we scale it
+    n = sample_noise_line(w)
+    noise_line[:, 1] = 100 + n * (h - 200)
     py5.begin_shape()
-    for x in range(py5.width):
-        # noise() returns 0-1, so we scale it
-        n = py5.noise(x * 0.01 + t)
-        y = py5.remap(n, 0, 1, 100, py5.height - 100)
-        py5.vertex(x, y)
+    py5.vertices(noise_line)
     py5.end_shape()
 
-    # Show noise values as dots
+    # Show noise values as dots (every 20th sample of the graph)
     py5.no_stroke()
-    for x in range(0, py5.width, 20):
-        n = py5.noise(x * 0.01 + t)
-        y = py5.remap(n, 0, 1, 100, py5.height - 100)
-
+    for x, y, v in zip(range(0, w, 20), noise_line[::20, 1].tolist(), n[::20].tolist()):
         # Color based on noise value
-        py5.fill(py5.remap(n, 0, 1, 50, 200), 100, 150)
+        py5.fill(50 + v * 150, 100, 150)
         py5.ellipse(x, y, 15, 15)
 
     # Explanation
     py5.fill(0)
     py5.no_stroke()
     py5.text_size(12)
-    py5.text("noise(x): Smooth, continuous values", 20, py5.height - 40)
-    py5.text("Adjacent inputs produce similar outputs", 20, py5.height - 20)
+    py5.text("noise(x): Smooth, continuous values", 20, h - 40)
+    py5.text("Adjacent inputs produce similar outputs", 20, h - 20)
 
 
 def draw_noise_2d():
     """Demonstrate 2D Perlin noise - creates natural textures."""
-    # Draw noise field
-    py5.load_pixels()
-    scale_factor = 0.01
-
-    for x in range(py5.width):
-        for y in range(py5.height - 50):
-            n = py5.noise(x * scale_factor, y * scale_factor + t)
-            brightness = int(n * 255)
-            idx = x + y * py5.width
-            py5.pixels[idx] = py5.color(brightness)
-
-    py5.update_pixels()
+    h = py5.height
+
+    # Draw noise field: the whole grid is evaluated at once (compiled
+    # with numba when available, otherwise by py5.noise() on arrays),
+    # and the result is written straight into the pixel array
+    # (np_pixels channels are alpha, red, green, blue)
+    if NUMBA_AVAILABLE:
+        compute_noise_field(noise_perm, t, 0.01, noise_field)
+        n = noise_field
+    else:
+        n = py5.noise(noise_grid_x, noise_grid_y + t)
+    brightness = (n * 255).astype(np.uint8)
+
+    py5.load_np_pixels()
+    rows = brightness.shape[0]
+    py5.np_pixels[:rows, :, 0] = 255
+    py5.np_pixels[:rows, :, 1:] = brightness[..., np.newaxis]
+    py5.update_np_pixels()
 
     # Explanation overlay
     py5.fill(0, 200)
     py5.no_stroke()
-    py5.rect(10, py5.height - 50, 400, 45, 5)
+    py5.rect(10, h - 50, 400, 45, 5)
 
     py5.fill(255)
     py5.text_size(12)
-    py5.text("noise(x, y): 2D noise creates natural textures", 20, py5.height - 30)
-    py5.text("Like clouds, terrain, organic patterns", 20, py5.height - 12)
+    py5.text("noise(x, y): 2D noise creates natural textures", 20, h - 30)
+    py5.text("Like clouds, terrain, organic patterns", 20, h - 12)
 
 
 def draw_comparison():
     """Side by side comparison of random vs noise motion."""
+    w = py5.width
+    h = py5.height
+
     py5.background(30)
 
     # Dividing line
     py5.stroke(100)
     py5.stroke_weight(1)
-    py5.line(py5.width/2, 50, py5.width/2, py5.height - 50)
+    py5.line(w/2, 50, w/2, h - 50)
 
     # Labels
     py5.fill(255)
     py5.no_stroke()
     py5.text_size(14)
     py5.text("random() motion", 100, 70)
-    py5.text("noise() motion", py5.width/2 + 100, 70)
+    py5.text("noise() motion", w/2 + 100, 70)
 
     # Update and draw particles
     py5.no_stroke()
@@ -187,8 +326,8 @@ def draw_comparison():
         # Random motion (left side)
         p['x'] += py5.random(-5, 5)
         p['y'] += py5.random(-5, 5)
-        p['x'] = py5.constrain(p['x'], 20, py5.width/2 - 20)
-        p['y'] = py5.constrain(p['y'], 100, py5.height - 60)
+        p['x'] = py5.constrain(p['x'], 20, w/2 - 20)
+        p['y'] = py5.constrain(p['y'], 100, h - 60)
 
         py5.fill(219, 68, 55, 150)
         py5.ellipse(p['x'], p['y'], 10, 10)
@@ -198,8 +337,8 @@ def draw_comparison():
         ny = py5.noise(i * 0.1 + 100, t) * 2 - 1
         p['x2'] += nx * 3
         p['y2'] += ny * 3
-        p['x2'] = py5.constrain(p['x2'], py5.width/2 + 20, py5.width - 20)
-        p['y2'] = py5.constrain(p['y2'], 100, py5.height - 60)
+        p['x2'] = py5.constrain(p['x2'], w/2 + 20, w - 20)
+        p['y2'] = py5.constrain(p['y2'], 100, h - 60)
 
         py5.fill(66, 133, 244, 150)
         py5.ellipse(p['x2'], p['y2'], 10, 10)
@@ -207,8 +346,8 @@ def draw_comparison():
     # Explanation
     py5.fill(255)
     py5.text_size(12)
-    py5.text("random(): Jittery, chaotic movement", 50, py5.height - 25)
-    py5.text("noise(): Smooth, organic flow", py5.width/2 + 50, py5.height - 25)
+    py5.text("random(): Jittery, chaotic movement", 50, h - 25)
+    py5.text("noise(): Smooth, organic flow", w/2 + 50, h - 25)
 
 
 def key_pressed():
@@ -225,7 +364,10 @@ def key_pressed():
         init_particles()
     elif py5.key == 'r':
         init_particles()
-        py5.noise_seed(int(py5.random(10000)))
+        init_noise_line()
+        seed = int(py5.random(10000))
+        py5.noise_seed(seed)
+        init_noise_grid(seed)
         print("Reset with new seed")
     elif py5.key == 's':
         filename = f"noise_{py5.frame_count}.png"
@@ -15,103 +15,247 @@ Run with: python particle_systems_py5.py
 """
 
 import py5
+import math
+import numpy as np
 
-# Particle system
-particles = []
+# One particle system per mode (built in setup()) and the current one
+systems = []
+particles = None
 emitter_x = 400
 emitter_y = 300
 mode = 0
 modes = ["Fountain", "Explosion", "Rain", "Fireflies"]
 
-# Palette (art-inspired colors)
+# Palette (art-inspired colors) and its (r, g, b) components as an
+# (N, 3) array, unpacked once so emitting particles never has to call
+# red()/green()/blue()
 palette = []
+palette_rgb = None
+RAIN_RGB = (100, 150, 200)
+FIREFLY_RGB = (255, 220, 100)
+
+MAX_PARTICLES = 4096
+
+rng = np.random.default_rng()
+
+# Sine lookup table: one full turn (0..TWO_PI) in SIN_SIZE steps.
+# Indexing it replaces sin()/cos() calls for explosion directions and
+# firefly glow; cos(a) is sin(a + quarter turn), so one table serves both.
+SIN_SIZE = 1024
+SIN_MASK = SIN_SIZE - 1  # Wraps any index into the table
+SIN_LUT = np.sin(np.arange(SIN_SIZE) * (2 * math.pi / SIN_SIZE))
+
+# Firefly glow phases are binary angles: a uint16 where 65536 is one
+# full turn, so adding to them wraps around for free and the top 10
+# bits are directly a SIN_LUT index
+BAMS_TURN = 65536
+BAMS_SHIFT = 6  # uint16 angle >> 6 -> SIN_LUT index
+GLOW_STEP = round(0.1 * BAMS_TURN / (2 * math.pi))  # 0.1 rad per frame
+
+
+def fill_uniform(out, low, high):
+    """Fill the array out in place with random numbers in [low, high)."""
+    rng.random(out=out)
+    out *= high - low
+    out += low
+
+
+class ParticleSystem:
+    """A fixed-size pool of particles stored as parallel NumPy arrays.
+
+    Slot i holds one particle: position (x, y), velocity (vx, vy),
+    gravity, lifespan, decay, size and color (r, g, b). The live
+    particles always fill the first n slots, so the whole system is
+    updated with a handful of array operations on [:n] slices per
+    frame, emitting appends after them and removing the dead is a
+    single compacting pass. The arrays are allocated once and
+    emitting re-initializes free slots in place, so the pool never
+    allocates per particle.
+
+    The base class is the fountain mode. The other modes are subclasses
+    that only hold particles of their kind: launch() sets their starting
+    motion and color, and update(), appearance() and alive() are
+    overridden where a mode behaves differently, so no per-frame code
+    checks which mode it is in.
+    """
+
+    FIELDS = ('x', 'y', 'vx', 'vy', 'gravity', 'lifespan', 'decay',
+              'size', 'r', 'g', 'b')
+    __slots__ = FIELDS + ('n',)
+
+    def __init__(self, capacity=MAX_PARTICLES):
+        for name in self.FIELDS:
+            setattr(self, name, np.zeros(capacity))
+        self.n = 0  # Number of live particles
+
+    def __len__(self):
+        return self.n
+
+    def clear(self):
+        """Kill every particle."""
+        self.n = 0
+
+    def emit(self, x, y, count=1):
+        """Start up to count particles at (x, y) after the live ones.
+
+        x and y may be scalars or arrays of count positions. Every
+        random property of the burst is drawn in one NumPy call.
+        """
+        start = self.n
+        self.n = min(start + count, len(self.x))
+        k = self.n - start
+        if k <= 0:
+            return
+        i = slice(start, self.n)
+        self.x[i] = np.broadcast_to(x, (count,))[:k]
+        self.y[i] = np.broadcast_to(y, (count,))[:k]
+        self.launch(i, k)
+        self.lifespan[i] = 255
+        fill_uniform(self.decay[i], 2, 5)
+
+    def launch(self, i, k):
+        """Set velocity, gravity, color and size of the k new slots i."""
+        # Fountain: shoot upward in a palette color and fall back
+        fill_uniform(self.vx[i], -2, 2)
+        fill_uniform(self.vy[i], -8, -4)
+        self.gravity[i] = 0.15
+        self.r[i], self.g[i], self.b[i] = palette_rgb[rng.integers(len(palette_rgb), size=k)].T
+        fill_uniform(self.size[i], 8, 15)
 
+    def update(self):
+        """Update particle physics for every live particle."""
+        a = slice(0, self.n)
+        self.vy[a] += self.gravity[a]
+        self.x[a] += self.vx[a]
+        self.y[a] += self.vy[a]
+        self.lifespan[a] -= self.decay[a]
 
-class Particle:
-    """A single particle with position, velocity, and lifecycle."""
-
-    def __init__(self, x, y, mode):
-        self.x = x
-        self.y = y
-        self.mode = mode
-
-        if mode == 0:  # Fountain
-            self.vx = py5.random(-2, 2)
-            self.vy = py5.random(-8, -4)
-            self.gravity = 0.15
-            self.col = palette[int(py5.random(len(palette)))]
-            self.size = py5.random(8, 15)
-
-        elif mode == 1:  # Explosion
-            angle = py5.random(py5.TWO_PI)
-            speed = py5.random(2, 8)
-            self.vx = py5.cos(angle) * speed
-            self.vy = py5.sin(angle) * speed
-            self.gravity = 0.05
-            self.col = palette[int(py5.random(len(palette)))]
-            self.size = py5.random(5, 12)
-
-        elif mode == 2:  # Rain
-            self.vx = py5.random(-0.5, 0.5)
-            self.vy = py5.random(5, 12)
-            self.gravity = 0.1
-            self.col = py5.color(100, 150, 200, 150)
-            self.size = py5.random(2, 4)
-
-        elif mode == 3:  # Fireflies
-            self.vx = py5.random(-1, 1)
-            self.vy = py5.random(-1, 1)
-            self.gravity = 0
-            self.col = py5.color(255, 220, 100)
-            self.size = py5.random(4, 8)
-            self.phase = py5.random(py5.TWO_PI)
-
-        self.lifespan = 255
-        self.decay = py5.random(2, 5)
+    def appearance(self, live):
+        """Return the (diameter, alpha) arrays of the live particles."""
+        return self.size[live], self.lifespan[live]
 
-    def update(self):
-        """Update particle physics."""
-        self.vy += self.gravity
-        self.x += self.vx
-        self.y += self.vy
-        self.lifespan -= self.decay
-
-        # Mode-specific behavior
-        if self.mode == 3:  # Fireflies wander
-            self.vx += py5.random(-0.2, 0.2)
-            self.vy += py5.random(-0.2, 0.2)
-            self.vx = py5.constrain(self.vx, -2, 2)
-            self.vy = py5.constrain(self.vy, -2, 2)
-            # Pulsing glow
-            self.phase += 0.1
+    def alive(self, n):
+        """Return a mask of the first n particles that are still alive."""
+        return (self.lifespan[:n] > 0) & (self.y[:n] <= py5.height + 20)
 
     def display(self):
-        """Draw the particle."""
-        py5.no_stroke()
-
-        if self.mode == 3:  # Fireflies glow
-            glow = (py5.sin(self.phase) + 1) / 2
-            alpha = self.lifespan * glow
-            py5.fill(py5.red(self.col), py5.green(self.col), py5.blue(self.col), alpha)
-            py5.ellipse(self.x, self.y, self.size * (1 + glow), self.size * (1 + glow))
-        else:
-            py5.fill(py5.red(self.col), py5.green(self.col), py5.blue(self.col), self.lifespan)
-            py5.ellipse(self.x, self.y, self.size, self.size)
-
-    def is_dead(self):
-        """Check if particle should be removed."""
-        if self.lifespan <= 0:
-            return True
-        if self.y > py5.height + 20:
-            return True
-        if self.mode == 2 and self.y > py5.height - 5:
-            return True
-        return False
+        """Draw the live particles in a few batched POINTS shapes.
+
+        A point is a round dot whose diameter is the stroke weight, so
+        particles are grouped by (rounded) diameter and each group is
+        drawn as one shape with a color per vertex.
+        """
+        live = slice(0, self.n)
+        if self.n == 0:
+            return
+
+        diameter, alpha = self.appearance(live)
+
+        # Pack each particle's color as an ARGB int (signed, as Java expects)
+        argb = ((np.clip(alpha, 0, 255).astype(np.uint32) << 24)
+                | (self.r[live].astype(np.uint32) << 16)
+                | (self.g[live].astype(np.uint32) << 8)
+                | self.b[live].astype(np.uint32)).view(np.int32)
+        points = np.column_stack((self.x[live], self.y[live]))
+        weight = np.maximum(np.rint(diameter), 1).astype(int)
+
+        for w in np.unique(weight).tolist():
+            group = weight == w
+            shape = py5.create_shape()
+            shape.begin_shape(py5.POINTS)
+            shape.stroke_weight(w)
+            shape.vertices(points[group])
+            shape.end_shape()
+            shape.set_strokes(argb[group].tolist())
+            py5.shape(shape)
+
+    def remove_dead(self):
+        """Drop particles that faded out or left the screen.
+
+        Survivors are packed to the front of every array in one pass
+        (boolean indexing), keeping live particles in [:n].
+        """
+        n = self.n
+        keep = self.alive(n)
+        count = int(np.count_nonzero(keep))
+        if count < n:
+            for name in self.FIELDS:
+                values = getattr(self, name)
+                values[:count] = values[:n][keep]
+            self.n = count
+
+
+class ExplosionSystem(ParticleSystem):
+    __slots__ = ()
+
+    def launch(self, i, k):
+        # Random directions as table indices rather than angles
+        angle = rng.integers(SIN_SIZE, size=k)
+        speed = rng.uniform(2, 8, k)
+        self.vx[i] = SIN_LUT[(angle + SIN_SIZE // 4) & SIN_MASK] * speed
+        self.vy[i] = SIN_LUT[angle] * speed
+        self.gravity[i] = 0.05
+        self.r[i], self.g[i], self.b[i] = palette_rgb[rng.integers(len(palette_rgb), size=k)].T
+        fill_uniform(self.size[i], 5, 12)
+
+
+class RainSystem(ParticleSystem):
+    __slots__ = ()
+
+    def launch(self, i, k):
+        fill_uniform(self.vx[i], -0.5, 0.5)
+        fill_uniform(self.vy[i], 5, 12)
+        self.gravity[i] = 0.1
+        self.r[i], self.g[i], self.b[i] = RAIN_RGB
+        fill_uniform(self.size[i], 2, 4)
+
+    def alive(self, n):
+        # Rain also dies when it hits the ground
+        return (self.lifespan[:n] > 0) & (self.y[:n] <= py5.height - 5)
+
+
+class FireflySystem(ParticleSystem):
+    FIELDS = ParticleSystem.FIELDS + ('phase',)  # Glow phase
+    __slots__ = ('phase', 'jitter')
+
+    def __init__(self, capacity=MAX_PARTICLES):
+        super().__init__(capacity)
+        self.phase = np.zeros(capacity, dtype=np.uint16)  # Binary angles
+        self.jitter = np.zeros(capacity)  # Scratch buffer for wandering
+
+    def launch(self, i, k):
+        fill_uniform(self.vx[i], -1, 1)
+        fill_uniform(self.vy[i], -1, 1)
+        self.gravity[i] = 0
+        self.r[i], self.g[i], self.b[i] = FIREFLY_RGB
+        fill_uniform(self.size[i], 4, 8)
+        self.phase[i] = rng.integers(BAMS_TURN, size=k, dtype=np.uint16)
+
+    def update(self):
+        super().update()
+
+        # Fireflies wander
+        a = slice(0, self.n)
+        jitter = self.jitter[a]
+        for v in (self.vx[a], self.vy[a]):
+            fill_uniform(jitter, -0.2, 0.2)
+            v += jitter
+            np.clip(v, -2, 2, out=v)
+        # Pulsing glow
+        self.phase[a] += GLOW_STEP
+
+    def appearance(self, live):
+        glow = (SIN_LUT[self.phase[live] >> BAMS_SHIFT] + 1) / 2
+        return self.size[live] * (1 + glow), self.lifespan[live] * glow
+
+
+# One particle system class per mode, in the order of modes
+SYSTEMS = (ParticleSystem, ExplosionSystem, RainSystem, FireflySystem)
 
 
 def setup():
-    py5.size(800, 600)
-    global palette
+    py5.size(800, 600, py5.P2D)  # P2D keeps per-vertex colors in batched shapes
+    global palette, palette_rgb, systems, particles
 
     # Art-inspired palette
     palette = [
@@ -121,6 +265,9 @@ def setup():
         py5.color(15, 157, 88),    # Green
         py5.color(156, 39, 176),   # Purple
     ]
+    palette_rgb = np.array([(py5.red(c), py5.green(c), py5.blue(c)) for c in palette])
+    systems = [system() for system in SYSTEMS]
+    particles = systems[mode]
 
     print("Lesson 06: Particle Systems")
     print("\nControls:")
@@ -131,7 +278,8 @@ def setup():
 
 
 def draw():
-    global particles
+    w = py5.width
+    h = py5.height
 
     # Different backgrounds per mode
     if mode == 2:  # Rain
@@ -143,22 +291,17 @@ def draw():
 
     # Continuous emission for some modes
     if mode == 0:  # Fountain
-        for _ in range(3):
-            particles.append(Particle(emitter_x, py5.height - 50, mode))
+        particles.emit(emitter_x, h - 50, count=3)
     elif mode == 2:  # Rain
-        for _ in range(5):
-            particles.append(Particle(py5.random(py5.width), -10, mode))
+        particles.emit(rng.uniform(0, w, 5), -10, count=5)
     elif mode == 3:  # Fireflies
         if len(particles) < 50 and py5.random(1) < 0.1:
-            particles.append(Particle(py5.random(py5.width), py5.random(py5.height), mode))
+            particles.emit(py5.random(w), py5.random(h))
 
     # Update and display particles
-    for i in range(len(particles) - 1, -1, -1):
-        p = particles[i]
-        p.update()
-        p.display()
-        if p.is_dead():
-            particles.pop(i)
+    particles.update()
+    particles.display()
+    particles.remove_dead()
 
     # UI
     draw_ui()
@@ -166,6 +309,8 @@ def draw():
 
 def draw_ui():
     """Draw mode indicator and particle count."""
+    h = py5.height
+
     py5.fill(255)
     py5.no_stroke()
     py5.text_size(14)
@@ -173,43 +318,36 @@ def draw_ui():
     py5.text(f"Particles: {len(particles)}", 20, 45)
 
     if mode == 1:
-        py5.text("Click anywhere for explosion", 20, py5.height - 20)
+        py5.text("Click anywhere for explosion", 20, h - 20)
     else:
-        py5.text("Click to set emitter position", 20, py5.height - 20)
+        py5.text("Click to set emitter position", 20, h - 20)
 
 
 def mouse_pressed():
     global emitter_x, emitter_y
 
     if mode == 1:  # Explosion
-        for _ in range(100):
-            particles.append(Particle(py5.mouse_x, py5.mouse_y, mode))
+        particles.emit(py5.mouse_x, py5.mouse_y, count=100)
     else:
         emitter_x = py5.mouse_x
         emitter_y = py5.mouse_y
 
 
 def key_pressed():
-    global mode, particles
-
     if py5.key == '1':
-        mode = 0
-        particles = []
+        set_mode(0)
         print("Mode: Fountain")
     elif py5.key == '2':
-        mode = 1
-        particles = []
+        set_mode(1)
         print("Mode: Explosion (click to trigger)")
     elif py5.key == '3':
-        mode = 2
-        particles = []
+        set_mode(2)
         print("Mode: Rain")
     elif py5.key == '4':
-        mode = 3
-        particles = []
+        set_mode(3)
         print("Mode: Fireflies")
     elif py5.key == 'c':
-        particles = []
+        particles.clear()
         print("Particles cleared")
     elif py5.key == 's':
         filename = f"particles_{py5.frame_count}.png"
@@ -217,6 +355,14 @@ def key_pressed():
         print(f"Saved: {filename}")
 
 
+def set_mode(new_mode):
+    """Switch to the particle system of new_mode, starting it empty."""
+    global mode, particles
+    mode = new_mode
+    particles = systems[mode]
+    particles.clear()
+
+
 # -------------------------------------------------
 # Particle System Concepts:
 #
@@ -15,97 +15,196 @@ Run with: python flow_fields_py5.py
 """
 
 import py5
+import math
+import numpy as np
+
+# Try to import numba to compile the flow field noise
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    print("Numba not available - using py5.noise() for the flow field")
 
 # Flow field settings
 cols = 0
 rows = 0
 scale = 20
-field = []
-particles = []
+noise_scale = 0.1
+field = None  # Angle of each (col, row) cell, a contiguous float32 array
+noise_i = None  # Noise x/y coordinates of each cell, built in setup()
+noise_j = None
+noise_perm = None  # Perlin permutation table (used when numba is available)
+particles = None
 num_particles = 500
 
+rng = np.random.default_rng()
+
 # Animation
 z_offset = 0
 
 # Visualization mode
 show_field = False
 show_trails = True
+trail_buf = None  # Offscreen canvas the trails build up on, made in setup()
 
-# Palette
+# Palette, and its (r, g, b) components unpacked once in setup()
 palette = []
-
-
-class FlowParticle:
-    """A particle that follows the flow field."""
-
-    def __init__(self):
+palette_rgb = None
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _fade(t):
+        return t * t * t * (t * (t * 6 - 15) + 10)
+
+    @njit(cache=True, fastmath=True)
+    def _lerp(t, a, b):
+        return a + t * (b - a)
+
+    @njit(cache=True, fastmath=True)
+    def _grad(h, x, y, z):
+        # One of twelve gradient directions (edges of a cube)
+        h &= 15
+        u = x if h < 8 else y
+        v = y if h < 4 else (x if h == 12 or h == 14 else z)
+        return (u if h & 1 == 0 else -u) + (v if h & 2 == 0 else -v)
+
+    @njit(cache=True, fastmath=True)
+    def _perlin(perm, x, y, z):
+        """Classic 3D Perlin noise in about -1 to 1."""
+        xi = int(math.floor(x))
+        yi = int(math.floor(y))
+        zi = int(math.floor(z))
+        xf = x - xi
+        yf = y - yi
+        zf = z - zi
+        xi &= 255
+        yi &= 255
+        zi &= 255
+        u = _fade(xf)
+        v = _fade(yf)
+        w = _fade(zf)
+        a = perm[xi] + yi
+        aa = perm[a] + zi
+        ab = perm[a + 1] + zi
+        b = perm[xi + 1] + yi
+        ba = perm[b] + zi
+        bb = perm[b + 1] + zi
+        near = _lerp(v, _lerp(u, _grad(perm[aa], xf, yf, zf),
+                              _grad(perm[ba], xf - 1, yf, zf)),
+                     _lerp(u, _grad(perm[ab], xf, yf - 1, zf),
+                           _grad(perm[bb], xf - 1, yf - 1, zf)))
+        far = _lerp(v, _lerp(u, _grad(perm[aa + 1], xf, yf, zf - 1),
+                             _grad(perm[ba + 1], xf - 1, yf, zf - 1)),
+                    _lerp(u, _grad(perm[ab + 1], xf, yf - 1, zf - 1),
+                          _grad(perm[bb + 1], xf - 1, yf - 1, zf - 1)))
+        return _lerp(w, near, far)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def compute_flow_field(perm, noise_scale, z, out):
+        """Fill out[i, j] with the angle 4 * PI * noise(i, j, z) (scaled).
+
+        noise is 4-octave Perlin noise mapped to 0-1, like py5.noise();
+        the columns are computed in parallel.
+        """
+        cols, rows = out.shape
+        for i in prange(cols):
+            for j in range(rows):
+                x = i * noise_scale
+                y = j * noise_scale
+                zz = z
+                total = 0.0
+                amp = 0.5
+                for _ in range(4):  # Octaves halve in weight, like noise()
+                    total += amp * _perlin(perm, x, y, zz)
+                    x *= 2.0
+                    y *= 2.0
+                    zz *= 2.0
+                    amp *= 0.5
+                out[i, j] = (total * 0.5 + 0.5) * 4 * math.pi
+
+
+class FlowParticles:
+    """All the particles that follow the flow field, as NumPy arrays.
+
+    Particle i is at (x[i], y[i]), was at (prev_x[i], prev_y[i]) last
+    frame, moves at velocity (vx[i], vy[i]) with speed max_speed[i]
+    and is drawn in palette[col[i]]. Following the field, moving and
+    wrapping around the edges are a few array operations for all
+    particles at once, and groups[c] lists the particles of palette
+    color c so each color is drawn in one call.
+    """
+
+    def __init__(self, count):
+        self.col = rng.integers(len(palette), size=count)
+        self.groups = [np.flatnonzero(self.col == c) for c in range(len(palette))]
         self.reset()
-        self.col = palette[int(py5.random(len(palette)))]
 
     def reset(self):
-        self.x = py5.random(py5.width)
-        self.y = py5.random(py5.height)
-        self.prev_x = self.x
-        self.prev_y = self.y
-        self.vx = 0
-        self.vy = 0
-        self.max_speed = py5.random(2, 4)
+        count = len(self.col)
+        self.x = rng.uniform(0, py5.width, count)
+        self.y = rng.uniform(0, py5.height, count)
+        self.prev_x = self.x.copy()
+        self.prev_y = self.y.copy()
+        self.vx = np.zeros(count)
+        self.vy = np.zeros(count)
+        self.max_speed = rng.uniform(2, 4, count)
 
     def follow(self, field):
         """Follow the flow field vectors."""
-        # Find which cell we're in
-        col = int(self.x / scale)
-        row = int(self.y / scale)
-
-        # Clamp to field bounds
-        col = py5.constrain(col, 0, cols - 1)
-        row = py5.constrain(row, 0, rows - 1)
+        # Find which cell each particle is in, clamped to field bounds
+        col = np.clip((self.x / scale).astype(int), 0, cols - 1)
+        row = np.clip((self.y / scale).astype(int), 0, rows - 1)
 
-        # Get the angle from the field
-        angle = field[col][row]
+        # Get the angles from the field
+        angle = field[col, row]
 
         # Calculate velocity from angle
-        self.vx = py5.cos(angle) * self.max_speed
-        self.vy = py5.sin(angle) * self.max_speed
+        self.vx = np.cos(angle) * self.max_speed
+        self.vy = np.sin(angle) * self.max_speed
 
     def update(self):
         # Store previous position for trails
-        self.prev_x = self.x
-        self.prev_y = self.y
+        self.prev_x[:] = self.x
+        self.prev_y[:] = self.y
 
         # Update position
         self.x += self.vx
         self.y += self.vy
 
-        # Wrap around edges
-        if self.x < 0:
-            self.x = py5.width
-            self.prev_x = self.x
-        if self.x > py5.width:
-            self.x = 0
-            self.prev_x = self.x
-        if self.y < 0:
-            self.y = py5.height
-            self.prev_y = self.y
-        if self.y > py5.height:
-            self.y = 0
-            self.prev_y = self.y
-
-    def display(self):
+        # Wrap around edges (a wrapped particle starts a new trail)
+        for pos, prev, size in ((self.x, self.prev_x, py5.width),
+                                (self.y, self.prev_y, py5.height)):
+            low = pos < 0
+            high = pos > size
+            pos[low] = size
+            pos[high] = 0
+            wrapped = low | high
+            prev[wrapped] = pos[wrapped]
+
+    def display(self, canvas):
+        """Draw on canvas: the sketch (py5) or an offscreen Py5Graphics."""
+        # One batched draw call per palette color
         if show_trails:
-            # Draw line from previous to current position
-            py5.stroke(py5.red(self.col), py5.green(self.col), py5.blue(self.col), 50)
-            py5.stroke_weight(1)
-            py5.line(self.prev_x, self.prev_y, self.x, self.y)
+            # Draw lines from previous to current positions
+            segments = np.column_stack((self.prev_x, self.prev_y, self.x, self.y))
+            canvas.stroke_weight(1)
+            for (r, g, b), group in zip(palette_rgb.tolist(), self.groups):
+                canvas.stroke(r, g, b, 50)
+                canvas.lines(segments[group])
         else:
-            # Draw as point
-            py5.stroke(self.col)
-            py5.stroke_weight(2)
-            py5.point(self.x, self.y)
+            # Draw as points
+            points = np.column_stack((self.x, self.y))
+            canvas.stroke_weight(2)
+            for col, group in zip(palette, self.groups):
+                canvas.stroke(col)
+                canvas.points(points[group])
 
 
 def setup():
-    global cols, rows, field, particles, palette
+    global cols, rows, field, noise_i, noise_j, noise_perm, particles, palette, palette_rgb
+    global trail_buf
 
     py5.size(800, 600)
 
@@ -117,19 +216,31 @@ def setup():
         py5.color(78, 91, 110),    # Blue-gray
         py5.color(168, 147, 120),  # Earth tone
     ]
+    palette_rgb = np.array([(py5.red(c), py5.green(c), py5.blue(c)) for c in palette],
+                           dtype=np.uint8)
 
     # Calculate field dimensions
     cols = int(py5.width / scale) + 1
     rows = int(py5.height / scale) + 1
 
     # Initialize field
-    field = [[0 for _ in range(rows)] for _ in range(cols)]
+    field = np.zeros((cols, rows), dtype=np.float32)
+    if NUMBA_AVAILABLE:
+        # Permutation table repeated twice so lookups never wrap
+        perm = rng.permutation(256)
+        noise_perm = np.concatenate((perm, perm)).astype(np.int32)
+    else:
+        noise_i, noise_j = np.meshgrid(np.arange(cols) * noise_scale,
+                                       np.arange(rows) * noise_scale,
+                                       indexing='ij')
 
     # Create particles
-    particles = [FlowParticle() for _ in range(num_particles)]
+    particles = FlowParticles(num_particles)
 
     # Start with faded background
     py5.background(20)
+    trail_buf = py5.create_graphics(py5.width, py5.height)
+    clear_trails()
 
     print("Lesson 07: Flow Fields")
     print("\nControls:")
@@ -142,27 +253,30 @@ def setup():
 def draw():
     global z_offset
 
-    if not show_trails:
-        py5.background(20)
-    else:
-        # Subtle fade for trail effect
-        py5.no_stroke()
-        py5.fill(20, 5)
-        py5.rect(0, 0, py5.width, py5.height)
-
     # Update flow field
     update_field()
 
+    # Update and display particles
+    particles.follow(field)
+    particles.update()
+    if show_trails:
+        # Fade and draw the trails offscreen, then show them; the field
+        # vectors and UI go on top without becoming part of the trails
+        trail_buf.begin_draw()
+        trail_buf.no_stroke()
+        trail_buf.fill(20, 5)
+        trail_buf.rect(0, 0, trail_buf.width, trail_buf.height)
+        particles.display(trail_buf)
+        trail_buf.end_draw()
+        py5.image(trail_buf, 0, 0)
+    else:
+        py5.background(20)
+        particles.display(py5)
+
     # Show field vectors if enabled
     if show_field:
         draw_field()
 
-    # Update and display particles
-    for p in particles:
-        p.follow(field)
-        p.update()
-        p.display()
-
     # Animate the noise
     z_offset += 0.003
 
@@ -170,36 +284,50 @@ def draw():
     draw_ui()
 
 
+def clear_trails():
+    """Wipe the trail canvas back to the background color."""
+    trail_buf.begin_draw()
+    trail_buf.background(20)
+    trail_buf.end_draw()
+
+
 def update_field():
     """Update the flow field based on Perlin noise."""
-    noise_scale = 0.1
-
-    for i in range(cols):
-        for j in range(rows):
-            # Use 3D noise for animation
-            angle = py5.noise(i * noise_scale, j * noise_scale, z_offset) * py5.TWO_PI * 2
-            field[i][j] = angle
+    # Use 3D noise for animation, evaluated for every cell at once
+    # (written in place into the float32 field): compiled with numba
+    # when available, otherwise by py5.noise() on arrays
+    if NUMBA_AVAILABLE:
+        compute_flow_field(noise_perm, noise_scale, z_offset, field)
+    else:
+        np.multiply(py5.noise(noise_i, noise_j, z_offset), py5.TWO_PI * 2, out=field)
 
 
 def draw_field():
     """Visualize the flow field vectors."""
-    for i in range(cols):
-        for j in range(rows):
-            x = i * scale
-            y = j * scale
-            angle = field[i][j]
-
-            # Draw vector
-            py5.stroke(255, 100)
-            py5.stroke_weight(1)
-            py5.push_matrix()
-            py5.translate(x + scale/2, y + scale/2)
-            py5.rotate(angle)
-            py5.line(0, 0, scale * 0.4, 0)
-            # Arrow head
-            py5.line(scale * 0.4, 0, scale * 0.3, -3)
-            py5.line(scale * 0.4, 0, scale * 0.3, 3)
-            py5.pop_matrix()
+    # Cell centers, and each cell's direction as (cos, sin)
+    cx = (np.arange(cols) * scale + scale / 2)[:, np.newaxis]
+    cy = (np.arange(rows) * scale + scale / 2)[np.newaxis, :]
+    ca = np.cos(field)
+    sa = np.sin(field)
+
+    # Vector and arrow head in world coordinates: the local points
+    # (u, v) of the arrow are rotated by the cell angle and moved to
+    # the cell center, three line segments per cell
+    tip_x = cx + scale * 0.4 * ca
+    tip_y = cy + scale * 0.4 * sa
+    segments = np.empty((cols, rows, 3, 4))
+    segments[..., 0] = tip_x[..., np.newaxis]
+    segments[..., 1] = tip_y[..., np.newaxis]
+    segments[:, :, 0, 2] = cx
+    segments[:, :, 0, 3] = cy
+    for k, v in ((1, -3), (2, 3)):
+        segments[:, :, k, 2] = cx + scale * 0.3 * ca - v * sa
+        segments[:, :, k, 3] = cy + scale * 0.3 * sa + v * ca
+
+    # Draw vectors
+    py5.stroke(255, 100)
+    py5.stroke_weight(1)
+    py5.lines(segments.reshape(-1, 4))
 
 
 def draw_ui():
@@ -226,17 +354,18 @@ def key_pressed():
 
     elif py5.key == 't':
         show_trails = not show_trails
-        py5.background(20)
+        clear_trails()
         print(f"Trails: {'ON' if show_trails else 'OFF'}")
 
     elif py5.key == 'r':
-        particles = [FlowParticle() for _ in range(num_particles)]
-        py5.background(20)
+        particles = FlowParticles(num_particles)
+        clear_trails()
         print("Reset particles")
 
     elif py5.key == 's':
         filename = f"flowfield_{py5.frame_count}.png"
-        py5.save(filename)
+        # Encode the PNG on a background thread so drawing doesn't stall
+        py5.save(filename, use_thread=True)
         print(f"Saved: {filename}")
 
 
@@ -15,6 +15,20 @@ Run with: python recursive_structures_py5.py
 """
 
 import py5
+import math
+import numpy as np
+
+# Try to import numba to compile the fractal geometry
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    print("Numba not available - computing fractal geometry in plain Python")
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as it is."""
+        return lambda function: function
 
 # Mode and settings
 mode = 0
@@ -25,12 +39,126 @@ max_depth = 6
 angle_offset = 0
 animate = False
 
-# Palette
+# Palette, and 256 steps between two of its greens for the Sierpinski
+# triangles (built in setup())
 palette = []
+sierpinski_colors = []
+
+# Sierpinski leaf triangles and Koch snowflake points only depend on
+# the depth, so each is computed once per depth and reused
+sierpinski_cache = {}
+koch_cache = {}
+
+# Rotation by -60 degrees: turns a Koch segment's middle third into
+# the side of its peak
+KOCH_COS = math.cos(-math.pi / 3)
+KOCH_SIN = math.sin(-math.pi / 3)
+
+
+@njit(cache=True)
+def koch_fill(points):
+    """Fill points[1:-1] with the Koch curve from points[0] to points[-1].
+
+    len(points) must be 4**depth + 1. Instead of recursing, each pass
+    splits every segment of the previous pass (stride step) into four,
+    writing the three new points between its ends in place.
+    """
+    n = len(points) - 1
+    step = n
+    while step > 1:
+        q = step // 4
+        for k in range(0, n, step):
+            x1 = points[k, 0]
+            y1 = points[k, 1]
+            dx = (points[k + step, 0] - x1) / 3
+            dy = (points[k + step, 1] - y1) / 3
+
+            # Points at 1/3 and 2/3
+            ax = x1 + dx
+            ay = y1 + dy
+            points[k + q, 0] = ax
+            points[k + q, 1] = ay
+            points[k + 3 * q, 0] = x1 + 2 * dx
+            points[k + 3 * q, 1] = y1 + 2 * dy
+
+            # Peak point (equilateral triangle)
+            points[k + 2 * q, 0] = ax + dx * KOCH_COS - dy * KOCH_SIN
+            points[k + 2 * q, 1] = ay + dx * KOCH_SIN + dy * KOCH_COS
+        step = q
+
+
+@njit(cache=True)
+def tree_fill(segments, x, y, length, max_depth, angles, num_colors):
+    """Grow the tree from (x, y) and store its branches in segments.
+
+    Each row is (x1, y1, x2, y2, weight, palette index); the number of
+    branches is returned. Instead of recursing with the matrix stack,
+    pending branches are kept on an explicit stack of (x, y, heading,
+    length, depth), with the heading turned by angles[depth].
+    """
+    stack = np.empty((3 * max_depth + 1, 5))
+    # The trunk, pointing up
+    stack[0] = (float(x), float(y), -math.pi / 2, float(length), float(max_depth))
+    top = 1
+    n = 0
+    while top > 0:
+        top -= 1
+        x, y, heading, length, d = stack[top]
+        depth = int(d)
+
+        # This branch
+        x2 = x + math.cos(heading) * length
+        y2 = y + math.sin(heading) * length
+        weight = 1 + depth * 7 / max_depth
+        # Color changes with depth: leaves or trunk
+        color = float(np.random.randint(1, num_colors)) if depth <= 2 else 0.0
+        segments[n] = (x, y, x2, y2, weight, color)
+        n += 1
+
+        if depth > 1:
+            angle = angles[depth]
+            # Sometimes add a middle branch
+            if depth > 2 and np.random.random() > 0.5:
+                stack[top] = (x2, y2, heading + np.random.uniform(-0.1, 0.1),
+                              length * 0.5, d - 2)
+                top += 1
+            # Left and right branches
+            stack[top] = (x2, y2, heading - angle, length * 0.7, d - 1)
+            stack[top + 1] = (x2, y2, heading + angle, length * 0.7, d - 1)
+            top += 2
+    return n
+
+
+@njit(cache=True)
+def sierpinski_fill(triangles, depth):
+    """Subdivide triangles[0] (x1, y1, x2, y2, x3, y3) depth times.
+
+    triangles must have 3**depth rows; they end up holding the leaf
+    triangles. Each pass replaces triangle t by its three corner
+    triangles at 3t..3t+2, walking t downwards so no triangle is
+    overwritten before it has been split.
+    """
+    count = 1
+    for _ in range(depth):
+        for t in range(count - 1, -1, -1):
+            x1, y1, x2, y2, x3, y3 = triangles[t]
+
+            # Calculate midpoints
+            mx1 = (x1 + x2) / 2
+            my1 = (y1 + y2) / 2
+            mx2 = (x2 + x3) / 2
+            my2 = (y2 + y3) / 2
+            mx3 = (x1 + x3) / 2
+            my3 = (y1 + y3) / 2
+
+            triangles[3 * t] = (x1, y1, mx1, my1, mx3, my3)
+            triangles[3 * t + 1] = (mx1, my1, x2, y2, mx2, my2)
+            triangles[3 * t + 2] = (mx3, my3, mx2, my2, x3, y3)
+        count *= 3
 
 
 def setup():
-    global palette
+    global palette, sierpinski_colors
 
     py5.size(800, 600)
 
@@ -41,6 +169,7 @@ def setup():
         py5.color(85, 107, 47),    # Dark olive
         py5.color(46, 139, 87),    # Sea green
     ]
+    sierpinski_colors = [py5.lerp_color(palette[1], palette[4], t / 255) for t in range(256)]
 
     print("Lesson 08: Recursive Structures")
     print("\nControls:")
@@ -73,93 +202,58 @@ def draw():
 
 def draw_tree():
     """Recursive tree structure."""
-    py5.translate(py5.width/2, py5.height - 50)
-
-    py5.stroke(palette[0])
-    py5.stroke_weight(8)
-
-    branch(120, max_depth)
-
-
-def branch(length, depth):
-    """Recursively draw tree branches."""
-    if depth <= 0:
-        return
-
-    # Draw this branch
-    weight = py5.remap(depth, 0, max_depth, 1, 8)
-    py5.stroke_weight(weight)
-
-    # Color changes with depth
-    if depth <= 2:
-        py5.stroke(palette[int(py5.random(1, len(palette)))])  # Leaves
-    else:
-        py5.stroke(palette[0])  # Trunk
-
-    py5.line(0, 0, 0, -length)
-
-    # Move to end of branch
-    py5.translate(0, -length)
+    # Branch angle per depth, with optional animation
+    angles = np.full(max_depth + 1, math.pi / 6)
+    if animate:
+        angles += np.sin(angle_offset + np.arange(max_depth + 1) * 0.5) * 0.1
 
-    # Calculate branch angle with optional animation
-    base_angle = py5.PI/6
-    angle = base_angle + py5.sin(angle_offset + depth * 0.5) * 0.1 if animate else base_angle
+    # Compute every branch first, then draw them
+    segments = np.empty((tree_capacity(max_depth), 6))
+    n = tree_fill(segments, py5.width / 2, py5.height - 50, 120.0,
+                  max_depth, angles, len(palette))
+    segments = segments[:n]
 
-    # Right branch
-    py5.push_matrix()
-    py5.rotate(angle)
-    branch(length * 0.7, depth - 1)
-    py5.pop_matrix()
+    # One batch of lines per (weight, color) combination
+    for weight, color in np.unique(segments[:, 4:], axis=0).tolist():
+        group = (segments[:, 4] == weight) & (segments[:, 5] == color)
+        py5.stroke(palette[int(color)])
+        py5.stroke_weight(weight)
+        py5.lines(segments[group, :4])
 
-    # Left branch
-    py5.push_matrix()
-    py5.rotate(-angle)
-    branch(length * 0.7, depth - 1)
-    py5.pop_matrix()
 
-    # Sometimes add a middle branch
-    if depth > 2 and py5.random(1) > 0.5:
-        py5.push_matrix()
-        py5.rotate(py5.random(-0.1, 0.1))
-        branch(length * 0.5, depth - 2)
-        py5.pop_matrix()
+def tree_capacity(depth):
+    """Most branches a tree of this depth can have (every middle branch grown)."""
+    counts = [0, 1]
+    for d in range(2, depth + 1):
+        counts.append(1 + 2 * counts[d - 1] + (counts[d - 2] if d > 2 else 0))
+    return counts[depth]
 
 
 def draw_sierpinski():
     """Sierpinski triangle fractal."""
-    # Start points
-    size_val = 500
-    x1 = py5.width/2
-    y1 = py5.height/2 - size_val/2
-    x2 = py5.width/2 - size_val/2
-    y2 = py5.height/2 + size_val/3
-    x3 = py5.width/2 + size_val/2
-    y3 = py5.height/2 + size_val/3
+    if max_depth not in sierpinski_cache:
+        # Start points
+        size_val = 500
+        x1 = py5.width/2
+        y1 = py5.height/2 - size_val/2
+        x2 = py5.width/2 - size_val/2
+        y2 = py5.height/2 + size_val/3
+        x3 = py5.width/2 + size_val/2
+        y3 = py5.height/2 + size_val/3
+
+        # Compute every leaf triangle first, then draw them
+        triangles = np.empty((3 ** max_depth, 6))
+        triangles[0] = (x1, y1, x2, y2, x3, y3)
+        sierpinski_fill(triangles, max_depth)
+        sierpinski_cache[max_depth] = triangles.tolist()
+    triangles = sierpinski_cache[max_depth]
 
     py5.no_stroke()
-    sierpinski(x1, y1, x2, y2, x3, y3, max_depth)
-
-
-def sierpinski(x1, y1, x2, y2, x3, y3, depth):
-    """Recursively draw Sierpinski triangle."""
-    if depth <= 0:
+    shades = np.random.randint(256, size=len(triangles)).tolist()
+    for triangle, shade in zip(triangles, shades):
         # Draw filled triangle
-        py5.fill(py5.lerp_color(palette[1], palette[4], py5.random(1)))
-        py5.triangle(x1, y1, x2, y2, x3, y3)
-        return
-
-    # Calculate midpoints
-    mx1 = (x1 + x2) / 2
-    my1 = (y1 + y2) / 2
-    mx2 = (x2 + x3) / 2
-    my2 = (y2 + y3) / 2
-    mx3 = (x1 + x3) / 2
-    my3 = (y1 + y3) / 2
-
-    # Recurse on three sub-triangles
-    sierpinski(x1, y1, mx1, my1, mx3, my3, depth - 1)
-    sierpinski(mx1, my1, x2, y2, mx2, my2, depth - 1)
-    sierpinski(mx3, my3, mx2, my2, x3, y3, depth - 1)
+        py5.fill(sierpinski_colors[shade])
+        py5.triangle(*triangle)
 
 
 def draw_koch():
@@ -168,61 +262,52 @@ def draw_koch():
     py5.stroke_weight(2)
     py5.no_fill()
 
-    # Draw three sides of the snowflake
-    size_val = 400
-    h = size_val * py5.sqrt(3) / 2
-
-    x1 = py5.width/2 - size_val/2
-    y1 = py5.height/2 + h/3
-    x2 = py5.width/2 + size_val/2
-    y2 = py5.height/2 + h/3
-    x3 = py5.width/2
-    y3 = py5.height/2 - 2*h/3
-
-    koch(x1, y1, x2, y2, max_depth)
-    koch(x2, y2, x3, y3, max_depth)
-    koch(x3, y3, x1, y1, max_depth)
-
-
-def koch(x1, y1, x2, y2, depth):
-    """Recursively draw Koch curve segment."""
-    if depth <= 0:
-        py5.line(x1, y1, x2, y2)
-        return
-
-    # Calculate the four new points
-    dx = x2 - x1
-    dy = y2 - y1
-
-    # Point at 1/3
-    ax = x1 + dx/3
-    ay = y1 + dy/3
-
-    # Point at 2/3
-    bx = x1 + 2*dx/3
-    by = y1 + 2*dy/3
-
-    # Peak point (equilateral triangle)
-    angle = py5.atan2(dy, dx) - py5.PI/3
-    length = py5.sqrt(dx*dx + dy*dy) / 3
-    px = ax + py5.cos(angle) * length
-    py_val = ay + py5.sin(angle) * length
-
-    # Recurse on four segments
-    koch(x1, y1, ax, ay, depth - 1)
-    koch(ax, ay, px, py_val, depth - 1)
-    koch(px, py_val, bx, by, depth - 1)
-    koch(bx, by, x2, y2, depth - 1)
+    if max_depth not in koch_cache:
+        # Draw three sides of the snowflake
+        size_val = 400
+        h = size_val * math.sqrt(3) / 2
+
+        x1 = py5.width/2 - size_val/2
+        y1 = py5.height/2 + h/3
+        x2 = py5.width/2 + size_val/2
+        y2 = py5.height/2 + h/3
+        x3 = py5.width/2
+        y3 = py5.height/2 - 2*h/3
+
+        # The three sides share their end points in one closed polyline
+        n = 4 ** max_depth
+        points = np.empty((3 * n + 1, 2))
+        points[0] = points[3 * n] = (x1, y1)
+        points[n] = (x2, y2)
+        points[2 * n] = (x3, y3)
+        for side in range(3):
+            koch_fill(points[side * n:(side + 1) * n + 1])
+        koch_cache[max_depth] = points
+
+    py5.begin_shape()
+    py5.vertices(koch_cache[max_depth])
+    py5.end_shape()
 
 
 def draw_circles():
     """Recursive packed circles."""
+    # The small circles sit at the same angles around every circle, so
+    # their directions are computed once per frame, not once per circle
+    num_circles = 6
+    thetas = np.arange(num_circles) * (math.tau / num_circles)
+    if animate:
+        thetas += angle_offset
+    directions = list(zip(np.cos(thetas).tolist(), np.sin(thetas).tolist()))
+
     py5.no_stroke()
-    recursive_circle(py5.width/2, py5.height/2, 250, max_depth)
+    recursive_circle(py5.width/2, py5.height/2, 250, max_depth, directions)
+
 
+def recursive_circle(x, y, radius, depth, directions):
+    """Recursively draw circles with smaller circles inside.
 
-def recursive_circle(x, y, radius, depth):
-    """Recursively draw circles with smaller circles inside."""
+    directions holds the (cos, sin) of each small circle's angle.
+    """
     if depth <= 0 or radius < 5:
         return
 
@@ -231,14 +316,11 @@ def recursive_circle(x, y, radius, depth):
     py5.ellipse(x, y, radius * 2, radius * 2)
 
     # Draw smaller circles around the edge
-    num_circles = 6
     small_radius = radius / 3
-
-    for i in range(num_circles):
-        angle = i * py5.TWO_PI / num_circles + (angle_offset if animate else 0)
-        cx = x + py5.cos(angle) * (radius - small_radius)
-        cy = y + py5.sin(angle) * (radius - small_radius)
-        recursive_circle(cx, cy, small_radius * 0.8, depth - 1)
+    distance = radius - small_radius
+    for c, s in directions:
+        recursive_circle(x + c * distance, y + s * distance,
+                         small_radius * 0.8, depth - 1, directions)
 
 
 def draw_ui():
@@ -273,7 +355,8 @@ def key_pressed():
         print(f"Animation: {'ON' if animate else 'OFF'}")
     elif py5.key == 's':
         filename = f"recursive_{py5.frame_count}.png"
-        py5.save(filename)
+        # Encode the PNG on a background thread so drawing doesn't stall
+        py5.save(filename, use_thread=True)
         print(f"Saved: {filename}")
 
 
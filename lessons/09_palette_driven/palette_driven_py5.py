@@ -10,45 +10,64 @@ Run with: python palette_driven_py5.py
 
 import py5
 import json
+import numpy as np
 from pathlib import Path
 
 # Global variables
 palette = []
+palette_rgb = []  # (r, g, b) of each palette color, unpacked in setup()
 color_names = []
+strokes = None
 
+rng = np.random.default_rng()
 
-class Brushstroke:
-    """A simple brushstroke inspired by Impressionism."""
 
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.col = palette[int(py5.random(len(palette)))]
-        self.angle = py5.noise(x * 0.01, y * 0.01) * py5.TWO_PI
-        self.length = py5.random(15, 40)
-        self.weight = py5.random(3, 8)
-        self.alpha = py5.random(150, 220)
+class Brushstrokes:
+    """Brushstrokes inspired by Impressionism, built in one NumPy array.
 
-    def display(self):
-        py5.push_matrix()
-        py5.translate(self.x, self.y)
-        py5.rotate(self.angle)
+    Each batch of strokes is generated into rows of data as (x, y, color
+    index, angle, length, weight, alpha) and drawn straight away, so
+    painting never creates an object per stroke. The strokes stay on the
+    canvas, so the array is only scratch space reused by every batch.
+    """
 
-        # Get RGB components from the color
-        r = py5.red(self.col)
-        g = py5.green(self.col)
-        b = py5.blue(self.col)
+    def __init__(self, capacity=16):
+        self.data = np.empty((capacity, 7), dtype=np.float32)
+
+    def add(self, x, y):
+        """Add and draw a stroke at each position (x[i], y[i])."""
+        k = len(x)
+        if k > len(self.data):
+            # Batch bigger than the scratch space: make room for it
+            self.data = np.empty((k, 7), dtype=np.float32)
+        new = self.data[:k]
+
+        new[:, 0] = x
+        new[:, 1] = y
+        new[:, 2] = rng.integers(len(palette), size=k)
+        new[:, 3] = py5.noise(x * 0.01, y * 0.01) * py5.TWO_PI
+        new[:, 4] = rng.uniform(15, 40, k)
+        new[:, 5] = rng.uniform(3, 8, k)
+        new[:, 6] = rng.uniform(150, 220, k)
+        self.display(new)
+
+    def display(self, strokes):
+        # Half-stroke offsets along each stroke's angle
+        dx = np.cos(strokes[:, 3]) * strokes[:, 4] / 2
+        dy = np.sin(strokes[:, 3]) * strokes[:, 4] / 2
 
-        py5.stroke(r, g, b, self.alpha)
-        py5.stroke_weight(self.weight)
         py5.stroke_cap(py5.ROUND)
-        py5.line(-self.length/2, 0, self.length/2, 0)
-        py5.pop_matrix()
+        for (x, y, c, _, _, weight, alpha), hx, hy in zip(strokes.tolist(),
+                                                          dx.tolist(), dy.tolist()):
+            r, g, b = palette_rgb[int(c)]
+            py5.stroke(r, g, b, alpha)
+            py5.stroke_weight(weight)
+            py5.line(x - hx, y - hy, x + hx, y + hy)
 
 
 def setup():
     py5.size(800, 600)
-    global palette, color_names
+    global palette, palette_rgb, color_names, strokes
 
     # Try to load palette from JSON
     data_path = Path(__file__).parent / 'data' / 'monet.json'
@@ -84,6 +103,9 @@ def setup():
         ]
         color_names = ['Sky', 'Sage', 'Beige', 'Blue-gray', 'Earth']
 
+    palette_rgb = [(py5.red(c), py5.green(c), py5.blue(c)) for c in palette]
+    strokes = Brushstrokes()
+
     # Set background to first palette color
     py5.background(palette[0])
 
@@ -98,11 +120,9 @@ def setup():
 def draw():
     # Add brushstrokes while mouse is pressed
     if py5.is_mouse_pressed:
-        for _ in range(3):  # Multiple strokes per frame
-            x = py5.mouse_x + py5.random(-20, 20)
-            y = py5.mouse_y + py5.random(-20, 20)
-            stroke = Brushstroke(x, y)
-            stroke.display()
+        # Multiple strokes per frame, around the mouse
+        offsets = rng.uniform(-20, 20, (3, 2))
+        strokes.add(py5.mouse_x + offsets[:, 0], py5.mouse_y + offsets[:, 1])
 
 
 def key_pressed():
@@ -114,7 +134,8 @@ def key_pressed():
     elif py5.key == 's':
         # Save image
         filename = f"palette_driven_{py5.frame_count}.png"
-        py5.save(filename)
+        # Encode the PNG on a background thread so drawing doesn't stall
+        py5.save(filename, use_thread=True)
         print(f"Saved: {filename}")
 
     elif py5.key == 'p':
@@ -15,6 +15,9 @@ Run with: python movement_aesthetics_py5.py
 """
 
 import py5
+import math
+import random
+import numpy as np
 
 # Movement palettes and characteristics
 movements = {
@@ -50,6 +53,8 @@ movements = {
 
 current_movement = "impressionism"
 
+rng = np.random.default_rng()
+
 
 def setup():
     py5.size(800, 600)
@@ -102,6 +107,10 @@ def initialize_palettes():
         py5.color(255, 100, 200),  # Hot pink
     ]
 
+    # Unpack every color's (r, g, b) once for the stroke functions
+    for m in movements.values():
+        m["palette_rgb"] = [(py5.red(c), py5.green(c), py5.blue(c)) for c in m["palette"]]
+
 
 def draw():
     # Don't clear - allow painting to accumulate
@@ -141,66 +150,70 @@ def mouse_dragged():
     style = m["stroke_style"]
 
     # Pick random color from palette
-    col = palette[int(py5.random(len(palette)))]
+    i = random.randrange(len(palette))
+    col = palette[i]
+    rgb = m["palette_rgb"][i]
 
     if style == "short":
-        draw_impressionist_stroke(py5.mouse_x, py5.mouse_y, col)
+        draw_impressionist_stroke(py5.mouse_x, py5.mouse_y, col, rgb)
     elif style == "bold":
-        draw_expressionist_stroke(py5.mouse_x, py5.mouse_y, col)
+        draw_expressionist_stroke(py5.mouse_x, py5.mouse_y, col, rgb)
     elif style == "soft":
-        draw_tonalist_stroke(py5.mouse_x, py5.mouse_y, col)
+        draw_tonalist_stroke(py5.mouse_x, py5.mouse_y, col, rgb)
     elif style == "wild":
-        draw_fauvist_stroke(py5.mouse_x, py5.mouse_y, col)
+        draw_fauvist_stroke(py5.mouse_x, py5.mouse_y, col, rgb)
 
 
-def draw_impressionist_stroke(x, y, col):
+def draw_impressionist_stroke(x, y, col, rgb):
     """Short, dabbed strokes with light variation."""
-    for _ in range(3):
-        px = x + py5.random(-15, 15)
-        py_val = y + py5.random(-15, 15)
-
-        # Slight color variation
-        r = py5.red(col) + py5.random(-20, 20)
-        g = py5.green(col) + py5.random(-20, 20)
-        b = py5.blue(col) + py5.random(-20, 20)
+    # Random placement, slight color variation, angle and size of the
+    # three dabs, drawn in one batch each
+    offsets = rng.uniform(-15, 15, (3, 2))
+    channels = np.clip(np.asarray(rgb) + rng.uniform(-20, 20, (3, 3)), 0, 255).astype(np.uint32)
+    angles = rng.uniform(0, math.tau, 3)
+    widths = rng.uniform(8, 15, 3)
+    heights = rng.uniform(4, 8, 3)
+
+    # Pack each jittered color with alpha 180 into one ARGB int
+    colors = (180 << 24) | (channels[:, 0] << 16) | (channels[:, 1] << 8) | channels[:, 2]
+    colors = colors.view(np.int32)
 
-        py5.no_stroke()
-        py5.fill(r, g, b, 180)
+    py5.no_stroke()
+    for (dx, dy), c, angle, w, h in zip(offsets.tolist(), colors.tolist(),
+                                        angles.tolist(), widths.tolist(),
+                                        heights.tolist()):
+        py5.fill(c)
 
         # Short dabs
-        angle = py5.random(py5.TWO_PI)
         py5.push_matrix()
-        py5.translate(px, py_val)
+        py5.translate(x + dx, y + dy)
         py5.rotate(angle)
-        py5.ellipse(0, 0, py5.random(8, 15), py5.random(4, 8))
+        py5.ellipse(0, 0, w, h)
         py5.pop_matrix()
 
 
-def draw_expressionist_stroke(x, y, col):
+def draw_expressionist_stroke(x, y, col, rgb):
     """Bold, angular, emotional strokes."""
     py5.stroke(col)
     py5.stroke_weight(py5.random(4, 10))
     py5.stroke_cap(py5.SQUARE)
 
     # Angular direction
-    angle = py5.noise(x * 0.01, y * 0.01) * py5.TWO_PI
+    angle = py5.noise(x * 0.01, y * 0.01) * math.tau
     length = py5.random(20, 40)
 
-    x2 = x + py5.cos(angle) * length
-    y2 = y + py5.sin(angle) * length
+    x2 = x + math.cos(angle) * length
+    y2 = y + math.sin(angle) * length
 
     py5.line(x, y, x2, y2)
 
 
-def draw_tonalist_stroke(x, y, col):
+def draw_tonalist_stroke(x, y, col, rgb):
     """Soft, atmospheric, blended strokes."""
     py5.no_stroke()
 
     # Very transparent, layered
-    r = py5.red(col)
-    g = py5.green(col)
-    b = py5.blue(col)
-    py5.fill(r, g, b, 30)
+    py5.fill(col, 30)
 
     # Soft, large circles
     for i in range(3):
@@ -210,25 +223,26 @@ def draw_tonalist_stroke(x, y, col):
         py5.ellipse(px, py_val, size, size)
 
 
-def draw_fauvist_stroke(x, y, col):
+def draw_fauvist_stroke(x, y, col, rgb):
     """Wild, energetic, pure color strokes."""
     py5.stroke(col)
     py5.stroke_weight(py5.random(5, 12))
     py5.stroke_cap(py5.ROUND)
 
     # Energetic, varied direction
-    angle = py5.random(py5.TWO_PI)
+    angle = py5.random(math.tau)
     length = py5.random(15, 35)
 
-    x2 = x + py5.cos(angle) * length
-    y2 = y + py5.sin(angle) * length
+    x2 = x + math.cos(angle) * length
+    y2 = y + math.sin(angle) * length
 
     py5.line(x, y, x2, y2)
 
     # Sometimes add complementary splashes
     if py5.random(1) > 0.7:
         py5.no_stroke()
-        py5.fill(255 - py5.red(col), 255 - py5.green(col), 255 - py5.blue(col), 200)
+        r, g, b = rgb
+        py5.fill(255 - r, 255 - g, 255 - b, 200)
         py5.ellipse(x + py5.random(-20, 20), y + py5.random(-20, 20), 8, 8)
 
 
@@ -261,7 +275,8 @@ def key_pressed():
 
     elif py5.key == 's':
         filename = f"{current_movement}_{py5.frame_count}.png"
-        py5.save(filename)
+        # Encode the PNG on a background thread so drawing doesn't stall
+        py5.save(filename, use_thread=True)
         print(f"Saved: {filename}")
 
 
@@ -15,11 +15,18 @@ Run with: python artist_style_py5.py
 """
 
 import py5
+import numpy as np
+from functools import partial
 
 # Artist data
 artists = {}
 current_artist = "monet"
 
+# Artist selected by each number key
+ARTIST_KEYS = {'1': "monet", '2': "vangogh", '3': "seurat", '4': "mondrian"}
+
+rng = np.random.default_rng()
+
 
 def setup():
     py5.size(800, 600)
@@ -110,34 +117,48 @@ def initialize_artists():
         "overlap": False
     }
 
+    # Unpacked colors, info panels and stroke functions only change
+    # with the artist, so prepare them up front
+    for a in artists.values():
+        a["palette_rgb"] = [(py5.red(c), py5.green(c), py5.blue(c)) for c in a["palette"]]
+        a["panel"] = make_panel(a)
+        a["stroke"] = bind_stroke(a)
+
 
 def draw():
     draw_ui()
 
 
 def draw_ui():
-    """Draw artist info panel."""
-    a = artists[current_artist]
+    """Draw artist info panel (pre-rendered by make_panel())."""
+    py5.image(artists[current_artist]["panel"], 10, 10)
+
+
+def make_panel(artist):
+    """Render an artist's info panel and palette swatches once."""
+    panel = py5.create_graphics(220, 95)
+    panel.begin_draw()
 
     # Info panel
-    py5.fill(255, 240)
-    py5.no_stroke()
-    py5.rect(10, 10, 220, 95, 5)
+    panel.fill(255, 240)
+    panel.no_stroke()
+    panel.rect(0, 0, 220, 95, 5)
 
-    py5.fill(0)
-    py5.text_size(14)
-    py5.text(a["name"], 20, 32)
+    panel.fill(0)
+    panel.text_size(14)
+    panel.text(artist["name"], 10, 22)
 
-    py5.text_size(11)
-    py5.fill(80)
-    py5.text(a["period"], 20, 50)
-    py5.text(f"Style: {a['direction']}", 20, 68)
+    panel.text_size(11)
+    panel.fill(80)
+    panel.text(artist["period"], 10, 40)
+    panel.text(f"Style: {artist['direction']}", 10, 58)
 
     # Palette swatches
-    for i, c in enumerate(a["palette"]):
-        py5.fill(c)
-        py5.no_stroke()
-        py5.rect(20 + i * 22, 78, 18, 12, 2)
+    for i, c in enumerate(artist["palette"]):
+        panel.fill(c)
+        panel.rect(10 + i * 22, 68, 18, 12, 2)
+    panel.end_draw()
+    return panel
 
 
 def mouse_dragged():
@@ -149,43 +170,61 @@ def mouse_dragged():
 def draw_artist_stroke(x, y, artist):
     """Draw a stroke in the artist's characteristic style."""
     palette = artist["palette"]
-    col = palette[int(py5.random(len(palette)))]
+    i = int(py5.random(len(palette)))
+    artist["stroke"](x, y, palette[i], artist["palette_rgb"][i])
+
+
+def bind_stroke(artist):
+    """Pick the artist's stroke function and fill in its style settings.
+
+    The result only needs (x, y, col, rgb), so painting doesn't look up the
+    direction and settings again for every stroke.
+    """
     min_len, max_len = artist["stroke_length"]
     min_w, max_w = artist["stroke_width"]
     direction = artist["direction"]
     alpha = artist["opacity"]
 
     if direction == "horizontal":
-        draw_horizontal_stroke(x, y, col, min_len, max_len, min_w, max_w, alpha)
+        return partial(draw_horizontal_stroke, min_len=min_len, max_len=max_len,
+                       min_w=min_w, max_w=max_w, alpha=alpha)
     elif direction == "swirl":
-        draw_swirl_stroke(x, y, col, min_len, max_len, min_w, max_w, alpha)
+        return partial(draw_swirl_stroke, min_len=min_len, max_len=max_len,
+                       min_w=min_w, max_w=max_w, alpha=alpha)
     elif direction == "point":
-        draw_point_stroke(x, y, col, min_len, max_len, alpha)
+        return partial(draw_point_stroke, min_size=min_len, max_size=max_len, alpha=alpha)
     elif direction == "grid":
-        draw_grid_stroke(x, y, col, min_len, max_len, min_w, max_w)
+        return partial(draw_grid_stroke, min_len=min_len, max_len=max_len,
+                       min_w=min_w, max_w=max_w)
 
 
-def draw_horizontal_stroke(x, y, col, min_len, max_len, min_w, max_w, alpha):
+def draw_horizontal_stroke(x, y, col, rgb, min_len, max_len, min_w, max_w, alpha):
     """Impressionist horizontal brushstroke."""
-    for _ in range(2):
-        px = x + py5.random(-10, 10)
-        py_val = y + py5.random(-10, 10)
-
-        py5.stroke(py5.red(col), py5.green(col), py5.blue(col), alpha)
-        py5.stroke_weight(py5.random(min_w, max_w))
+    # Placement, width and length of both strokes, drawn at once
+    offsets = rng.uniform(-10, 10, (2, 2))
+    weights = rng.uniform(min_w, max_w, 2)
+    lengths = rng.uniform(min_len, max_len, 2)
+
+    r, g, b = rgb
+    for (dx, dy), weight, length in zip(offsets.tolist(), weights.tolist(), lengths.tolist()):
+        px = x + dx
+        py_val = y + dy
+
+        py5.stroke(r, g, b, alpha)
+        py5.stroke_weight(weight)
         py5.stroke_cap(py5.ROUND)
 
-        length = py5.random(min_len, max_len)
         # Slight wave
         y_offset = py5.sin(px * 0.1) * 3
         py5.line(px - length/2, py_val + y_offset, px + length/2, py_val - y_offset)
 
 
-def draw_swirl_stroke(x, y, col, min_len, max_len, min_w, max_w, alpha):
+def draw_swirl_stroke(x, y, col, rgb, min_len, max_len, min_w, max_w, alpha):
     """Expressive swirling brushstroke."""
     angle = py5.noise(x * 0.01, y * 0.01) * py5.TWO_PI * 2
 
-    py5.stroke(py5.red(col), py5.green(col), py5.blue(col), alpha)
+    r, g, b = rgb
+    py5.stroke(r, g, b, alpha)
     py5.stroke_weight(py5.random(min_w, max_w))
     py5.stroke_cap(py5.ROUND)
 
@@ -204,24 +243,21 @@ def draw_swirl_stroke(x, y, col, min_len, max_len, min_w, max_w, alpha):
     py5.end_shape()
 
 
-def draw_point_stroke(x, y, col, min_size, max_size, alpha):
+def draw_point_stroke(x, y, col, rgb, min_size, max_size, alpha):
     """Pointillist dot application."""
-    for _ in range(5):
-        px = x + py5.random(-15, 15)
-        py_val = y + py5.random(-15, 15)
+    # Placement, color variation and size of all five dots, drawn at once
+    offsets = rng.uniform(-15, 15, (5, 2))
+    # Slight color variation for optical mixing
+    colors = np.clip(np.add(rgb, rng.uniform(-30, 30, (5, 3))), 0, 255)
+    sizes = rng.uniform(min_size, max_size, 5)
 
-        # Slight color variation for optical mixing
-        r = py5.constrain(py5.red(col) + py5.random(-30, 30), 0, 255)
-        g = py5.constrain(py5.green(col) + py5.random(-30, 30), 0, 255)
-        b = py5.constrain(py5.blue(col) + py5.random(-30, 30), 0, 255)
-
-        py5.no_stroke()
+    py5.no_stroke()
+    for (dx, dy), (r, g, b), size in zip(offsets.tolist(), colors.tolist(), sizes.tolist()):
         py5.fill(r, g, b, alpha)
-        size = py5.random(min_size, max_size)
-        py5.ellipse(px, py_val, size, size)
+        py5.ellipse(x + dx, y + dy, size, size)
 
 
-def draw_grid_stroke(x, y, col, min_len, max_len, min_w, max_w):
+def draw_grid_stroke(x, y, col, rgb, min_len, max_len, min_w, max_w):
     """Geometric grid-aligned block."""
     # Snap to grid
     grid_size = 40
@@ -244,36 +280,38 @@ def auto_generate():
     if current_artist == "mondrian":
         generate_mondrian(a)
     else:
-        for _ in range(500):
-            x = py5.random(py5.width)
-            y = py5.random(py5.height)
+        xs = rng.uniform(0, py5.width, 500)
+        ys = rng.uniform(0, py5.height, 500)
+        for x, y in zip(xs.tolist(), ys.tolist()):
             draw_artist_stroke(x, y, a)
 
 
 def generate_mondrian(artist):
     """Generate a Mondrian-style composition."""
+    width = py5.width
+    height = py5.height
+
     # Black grid lines
     py5.stroke(0)
     py5.stroke_weight(8)
 
     # Vertical lines
-    for _ in range(3):
-        x = py5.random(100, py5.width - 100)
-        py5.line(x, 0, x, py5.height)
+    for x in rng.uniform(100, width - 100, 3).tolist():
+        py5.line(x, 0, x, height)
 
     # Horizontal lines
-    for _ in range(3):
-        y = py5.random(100, py5.height - 100)
-        py5.line(0, y, py5.width, y)
-
-    # Fill some rectangles with color
+    for y in rng.uniform(100, height - 100, 3).tolist():
+        py5.line(0, y, width, y)
+
+    # Fill some rectangles with color (positions, sizes and colors
+    # all drawn at once)
+    xs = rng.uniform(0, width, 5)
+    ys = rng.uniform(0, height, 5)
+    sizes = rng.uniform(50, 200, (5, 2))
+    colors = rng.integers(4, size=5)
     py5.no_stroke()
-    for _ in range(5):
-        x = py5.random(py5.width)
-        y = py5.random(py5.height)
-        w = py5.random(50, 200)
-        h = py5.random(50, 200)
-        py5.fill(artist["palette"][int(py5.random(4))])
+    for x, y, (w, h), i in zip(xs.tolist(), ys.tolist(), sizes.tolist(), colors.tolist()):
+        py5.fill(artist["palette"][i])
         py5.rect(x, y, w, h)
 
 
@@ -290,25 +328,10 @@ def set_background():
 def key_pressed():
     global current_artist
 
-    if py5.key == '1':
-        current_artist = "monet"
-        set_background()
-        print("Artist: Claude Monet")
-
-    elif py5.key == '2':
-        current_artist = "vangogh"
-        set_background()
-        print("Artist: Vincent van Gogh")
-
-    elif py5.key == '3':
-        current_artist = "seurat"
-        set_background()
-        print("Artist: Georges Seurat")
-
-    elif py5.key == '4':
-        current_artist = "mondrian"
+    if py5.key in ARTIST_KEYS:
+        current_artist = ARTIST_KEYS[py5.key]
         set_background()
-        print("Artist: Piet Mondrian")
+        print(f"Artist: {artists[current_artist]['name']}")
 
     elif py5.key == 'g':
         auto_generate()
@@ -15,11 +15,17 @@ Run with: python data_driven_py5.py
 """
 
 import py5
+import numpy as np
 
 # Simulated artist data (from renoir exports)
 artist_data = {}
 current_view = 0
 views = ["Timeline", "Comparison", "Harmony", "Temperature"]
+VIEW_KEYS = {'1': 0, '2': 1, '3': 2, '4': 3}  # View selected by each number key
+
+# The data never changes, so each view is drawn once and the finished
+# frame is kept here and shown from then on
+view_cache = [None] * len(views)
 
 
 def setup():
@@ -96,8 +102,28 @@ def load_artist_data():
         "harmonies": {"analogous": 50, "complementary": 20, "triadic": 18, "split": 12}
     }
 
+    # Pie chart slices: (start angle, end angle, harmony) for each
+    # harmony, laid end to end around the circle
+    for data in artist_data.values():
+        arcs = []
+        start_angle = 0
+        for harmony, value in data["harmonies"].items():
+            end_angle = start_angle + value / 100 * py5.TWO_PI
+            arcs.append((start_angle, end_angle, harmony))
+            start_angle = end_angle
+        data["harmony_arcs"] = arcs
+
+        # Comparison bar heights: 0-100% maps to 0-300 pixels
+        stats = data["color_stats"]
+        data["bar_heights"] = {metric: stats[metric] * 3
+                               for metric in ("avg_saturation", "avg_brightness")}
+
 
 def draw():
+    if view_cache[current_view] is not None:
+        py5.image(view_cache[current_view], 0, 0)
+        return
+
     py5.background(250)
 
     if current_view == 0:
@@ -110,6 +136,7 @@ def draw():
         draw_temperature()
 
     draw_title()
+    view_cache[current_view] = py5.get_pixels()
 
 
 def draw_title():
@@ -151,19 +178,21 @@ def draw_timeline():
 
     for idx, artist_id in enumerate(artists):
         data = artist_data[artist_id]
-        timeline = data["timeline"]
 
-        min_year = min([d["year"] for d in timeline])
-        max_year = max([d["year"] for d in timeline])
+        # Screen positions of the whole line at once
+        years = np.array([d["year"] for d in data["timeline"]], dtype=float)
+        saturation = np.array([d["saturation"] for d in data["timeline"]], dtype=float)
+        points = np.empty((len(years), 2))
+        points[:, 0] = np.interp(years, (years.min(), years.max()),
+                                 (margin + 20, py5.width - margin - 20))
+        points[:, 1] = np.interp(saturation, (0, 100),
+                                 (py5.height - margin, margin + 80))
 
         py5.stroke(colors[idx])
         py5.stroke_weight(2)
         py5.no_fill()
         py5.begin_shape()
-        for point in timeline:
-            x = py5.remap(point["year"], min_year, max_year, margin + 20, py5.width - margin - 20)
-            y = py5.remap(point["saturation"], 0, 100, py5.height - margin, margin + 80)
-            py5.vertex(x, y)
+        py5.vertices(points)
         py5.end_shape()
 
         # Legend
@@ -206,7 +235,7 @@ def draw_comparison():
             value = data["color_stats"][metric]
 
             x = base_x + a_idx * (bar_width + spacing)
-            bar_height = py5.remap(value, 0, 100, 0, 300)
+            bar_height = data["bar_heights"][metric]
             y = py5.height - margin - bar_height
 
             py5.fill(colors_list[a_idx])
@@ -237,19 +266,15 @@ def draw_harmony():
 
     for idx, artist_id in enumerate(artists):
         data = artist_data[artist_id]
-        harmonies = data["harmonies"]
 
         cx = 180 + idx * 260
         cy = 300
         radius = 100
 
-        start_angle = 0
-        for harmony, value in harmonies.items():
-            angle = py5.remap(value, 0, 100, 0, py5.TWO_PI)
+        py5.no_stroke()
+        for start_angle, end_angle, harmony in data["harmony_arcs"]:
             py5.fill(harmony_colors[harmony])
-            py5.no_stroke()
-            py5.arc(cx, cy, radius * 2, radius * 2, start_angle, start_angle + angle, py5.PIE)
-            start_angle += angle
+            py5.arc(cx, cy, radius * 2, radius * 2, start_angle, end_angle, py5.PIE)
 
         py5.fill(0)
         py5.text_size(14)
@@ -273,15 +298,18 @@ def draw_harmony():
 def draw_temperature():
     """Warm/cool temperature visualization."""
     margin = 100
+    bar_width = py5.width - 2 * margin
 
     artists = ["monet", "vangogh", "renoir"]
 
     for idx, artist_id in enumerate(artists):
         data = artist_data[artist_id]
-        ratio = data["color_stats"]["warm_cool_ratio"]
 
+        ratio = data["color_stats"]["warm_cool_ratio"]
         y = 150 + idx * 130
-        bar_width = py5.width - 2 * margin
+        cool_width = bar_width * (1 - ratio)
+        cool_label = f"Cool: {int((1 - ratio) * 100)}%"
+        warm_label = f"Warm: {int(ratio * 100)}%"
 
         py5.stroke(200)
         py5.stroke_weight(1)
@@ -290,10 +318,10 @@ def draw_temperature():
 
         py5.fill(100, 150, 220)
         py5.no_stroke()
-        py5.rect(margin, y, bar_width * (1 - ratio), 40, 5, 0, 0, 5)
+        py5.rect(margin, y, cool_width, 40, 5, 0, 0, 5)
 
         py5.fill(220, 150, 100)
-        py5.rect(margin + bar_width * (1 - ratio), y, bar_width * ratio, 40, 0, 5, 5, 0)
+        py5.rect(margin + cool_width, y, bar_width - cool_width, 40, 0, 5, 5, 0)
 
         py5.fill(0)
         py5.text_size(14)
@@ -301,8 +329,8 @@ def draw_temperature():
 
         py5.text_size(11)
         py5.fill(255)
-        py5.text(f"Cool: {int((1 - ratio) * 100)}%", margin + 10, y + 25)
-        py5.text(f"Warm: {int(ratio * 100)}%", margin + bar_width - 80, y + 25)
+        py5.text(cool_label, margin + 10, y + 25)
+        py5.text(warm_label, margin + bar_width - 80, y + 25)
 
     py5.fill(100)
     py5.text_size(12)
@@ -313,14 +341,8 @@ def draw_temperature():
 def key_pressed():
     global current_view
 
-    if py5.key == '1':
-        current_view = 0
-    elif py5.key == '2':
-        current_view = 1
-    elif py5.key == '3':
-        current_view = 2
-    elif py5.key == '4':
-        current_view = 3
+    if py5.key in VIEW_KEYS:
+        current_view = VIEW_KEYS[py5.key]
     elif py5.key == 's':
         filename = f"datadriven_{py5.frame_count}.png"
         py5.save(filename)
@@ -0,0 +1,37 @@
+// Hue shift for Lesson 13 (Color Shift effect)
+// Turns the hue of every pixel of the image being drawn by shift
+// (0-1 of a full turn), keeping saturation and brightness.
+
+#ifdef GL_ES
+precision mediump float;
+precision mediump int;
+#endif
+
+#define PROCESSING_TEXTURE_SHADER
+
+uniform sampler2D texture;
+uniform float shift;
+
+varying vec4 vertColor;
+varying vec4 vertTexCoord;
+
+vec3 rgb_to_hsb(vec3 c) {
+    vec4 k = vec4(0.0, -1.0 / 3.0, 2.0 / 3.0, -1.0);
+    vec4 p = mix(vec4(c.bg, k.wz), vec4(c.gb, k.xy), step(c.b, c.g));
+    vec4 q = mix(vec4(p.xyw, c.r), vec4(c.r, p.yzx), step(p.x, c.r));
+    float d = q.x - min(q.w, q.y);
+    float e = 1.0e-10;
+    return vec3(abs(q.z + (q.w - q.y) / (6.0 * d + e)), d / (q.x + e), q.x);
+}
+
+vec3 hsb_to_rgb(vec3 c) {
+    vec3 p = abs(fract(c.xxx + vec3(1.0, 2.0 / 3.0, 1.0 / 3.0)) * 6.0 - 3.0);
+    return c.z * mix(vec3(1.0), clamp(p - 1.0, 0.0, 1.0), c.y);
+}
+
+void main() {
+    vec4 c = texture2D(texture, vertTexCoord.st);
+    vec3 hsb = rgb_to_hsb(c.rgb);
+    hsb.x = fract(hsb.x + shift);
+    gl_FragColor = vec4(hsb_to_rgb(hsb), c.a) * vertColor;
+}
@@ -16,25 +16,87 @@ Note: Place an image named 'source.jpg' in the same folder.
 """
 
 import py5
+import numpy as np
 from pathlib import Path
 
+# Try to import numba to compile the per-pixel effects
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    print("Numba not available - using NumPy for the pixel effects")
+
 # Image and mode
 img = None
 mode = 0
 modes = ["Original", "Grayscale", "Threshold", "Pixelate", "Pointillism", "Color Shift"]
+MODE_KEYS = {'1': 0, '2': 1, '3': 2, '4': 3, '5': 4, '6': 5}  # Mode selected by each number key
 
 # Effect parameters
 threshold_val = 128
 pixel_size = 10
 point_density = 5000
 
-# Palette for pointillism
+# One image buffer (made in setup()) that every effect renders into,
+# and the (effect, parameter) it currently holds; it is redrawn as is
+# until either changes
+effect_key = None
+effect_image = None
+
+# GPU hue shift for the Color Shift effect, loaded in setup()
+hue_shader = None
+
+# Palette for pointillism, and its (r, g, b) rows unpacked once in setup()
 palette = []
+palette_rgb = None
+# Closest palette index for every color, with each channel cut to its
+# top 5 bits: a (32, 32, 32) table built in setup()
+palette_lut = None
+
+rng = np.random.default_rng()
+
+
+def dot_offsets(diameter):
+    """Pixel (dy, dx) offsets covered by a dot of this diameter around its center."""
+    center = (diameter - 1) / 2
+    dy, dx = np.nonzero(np.add.outer((np.arange(diameter) - center) ** 2,
+                                     (np.arange(diameter) - center) ** 2) <= (diameter / 2) ** 2)
+    return dy - diameter // 2, dx - diameter // 2
+
+
+# Pointillist dots are 3-8 pixels across; their pixel offsets per diameter
+DOT_OFFSETS = {d: dot_offsets(d) for d in range(3, 9)}
+
+
+if NUMBA_AVAILABLE:
+    # Compiled pixel loops over np_pixels arrays (height, width, ARGB),
+    # each row of the image on its own thread
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def grayscale_kernel(src, dst):
+        """Write the luminance of every src pixel to dst."""
+        height, width = src.shape[:2]
+        for y in prange(height):
+            for x in range(width):
+                gray = 0.299 * src[y, x, 1] + 0.587 * src[y, x, 2] + 0.114 * src[y, x, 3]
+                dst[y, x, 0] = 255
+                dst[y, x, 1] = dst[y, x, 2] = dst[y, x, 3] = int(gray)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def threshold_kernel(src, dst, threshold):
+        """Write white to dst where src is brighter than threshold, black elsewhere."""
+        height, width = src.shape[:2]
+        for y in prange(height):
+            for x in range(width):
+                gray = (int(src[y, x, 1]) + int(src[y, x, 2]) + int(src[y, x, 3])) / 3
+                dst[y, x, 0] = 255
+                dst[y, x, 1] = dst[y, x, 2] = dst[y, x, 3] = 255 if gray > threshold else 0
 
 
 def setup():
-    py5.size(900, 600)
-    global img, palette
+    py5.size(900, 600, py5.P2D)  # P2D runs the hue shift shader
+    global img, palette, palette_rgb, palette_lut, hue_shader, effect_image
 
     # Try to load image
     img_path = Path(__file__).parent / "data" / "source.jpg"
@@ -48,17 +110,20 @@ def setup():
     # Fallback: create a gradient image
     if img is None:
         img = py5.create_image(800, 600, py5.RGB)
-        img.load_pixels()
-        for y in range(img.height):
-            for x in range(img.width):
-                r = py5.remap(x, 0, img.width, 50, 200)
-                g = py5.remap(y, 0, img.height, 100, 180)
-                b = 150
-                img.pixels[y * img.width + x] = py5.color(r, g, b)
-        img.update_pixels()
+        img.load_np_pixels()
+        # Red follows x and green follows y: whole columns and rows at once
+        pixels = img.np_pixels
+        pixels[..., 0] = 255
+        pixels[..., 1] = np.interp(np.arange(img.width), (0, img.width), (50, 200))
+        pixels[..., 2] = np.interp(np.arange(img.height), (0, img.height), (100, 180))[:, np.newaxis]
+        pixels[..., 3] = 150
+        img.update_np_pixels()
         print("No image found - using generated gradient")
         print("Place 'source.jpg' in data/ folder for real images")
 
+    effect_image = py5.create_image(img.width, img.height, py5.RGB)
+    hue_shader = py5.load_shader(str(Path(__file__).parent / "color_shift.frag"))
+
     # Art palette for pointillism
     palette = [
         py5.color(142, 178, 197),
@@ -67,6 +132,13 @@ def setup():
         py5.color(15, 157, 88),
         py5.color(156, 39, 176),
     ]
+    palette_rgb = np.array([(py5.red(c), py5.green(c), py5.blue(c)) for c in palette],
+                           dtype=np.float32)
+
+    # Match the center color of every table cell once
+    levels = np.arange(32) * 8 + 4
+    cells = np.stack(np.meshgrid(levels, levels, levels, indexing='ij'), axis=-1)
+    palette_lut = find_closest_colors(cells.reshape(-1, 3)).astype(np.uint8).reshape(32, 32, 32)
 
     print("Lesson 13: Image Processing")
     print("\nControls:")
@@ -99,120 +171,139 @@ def draw_original():
     py5.image(img, 0, 0)
 
 
+def draw_effect(key, render):
+    """Draw the effect image for key, calling render() to fill it only when key changes."""
+    global effect_key
+    if key != effect_key:
+        render(effect_image)
+        effect_key = key
+    py5.image(effect_image, 0, 0)
+
+
 def draw_grayscale():
     """Convert to grayscale."""
-    result = py5.create_image(img.width, img.height, py5.RGB)
-    img.load_pixels()
-    result.load_pixels()
+    draw_effect(("grayscale",), render_grayscale)
+
 
-    for i in range(len(img.pixels)):
-        c = img.pixels[i]
-        r = py5.red(c)
-        g = py5.green(c)
-        b = py5.blue(c)
-        gray = 0.299 * r + 0.587 * g + 0.114 * b
-        result.pixels[i] = py5.color(gray)
+def render_grayscale(result):
+    img.load_np_pixels()
+    result.load_np_pixels()
 
-    result.update_pixels()
-    py5.image(result, 0, 0)
+    if NUMBA_AVAILABLE:
+        grayscale_kernel(img.np_pixels, result.np_pixels)
+    else:
+        # Luminance of every pixel at once, weighting red, green and blue
+        # (np_pixels channels are alpha, red, green, blue)
+        gray = img.np_pixels[..., 1:] @ np.array([0.299, 0.587, 0.114])
+        result.np_pixels[..., 0] = 255
+        result.np_pixels[..., 1:] = gray[..., np.newaxis]
+
+    result.update_np_pixels()
 
 
 def draw_threshold():
     """Binary threshold effect."""
-    result = py5.create_image(img.width, img.height, py5.RGB)
-    img.load_pixels()
-    result.load_pixels()
+    draw_effect(("threshold", threshold_val), render_threshold)
 
-    for i in range(len(img.pixels)):
-        c = img.pixels[i]
-        gray = (py5.red(c) + py5.green(c) + py5.blue(c)) / 3
 
-        if gray > threshold_val:
-            result.pixels[i] = py5.color(255)
-        else:
-            result.pixels[i] = py5.color(0)
+def render_threshold(result):
+    img.load_np_pixels()
+    result.load_np_pixels()
 
-    result.update_pixels()
-    py5.image(result, 0, 0)
+    if NUMBA_AVAILABLE:
+        threshold_kernel(img.np_pixels, result.np_pixels, threshold_val)
+    else:
+        # White where the average of red, green and blue is above the
+        # threshold, black elsewhere, for all pixels in one comparison
+        gray = img.np_pixels[..., 1:].mean(axis=2)
+        result.np_pixels[..., 0] = 255
+        result.np_pixels[..., 1:] = np.where(gray > threshold_val, 255, 0)[..., np.newaxis]
+
+    result.update_np_pixels()
 
 
 def draw_pixelate():
     """Pixelation effect."""
-    py5.no_stroke()
-    img.load_pixels()
-
-    for y in range(0, img.height, pixel_size):
-        for x in range(0, img.width, pixel_size):
-            # Get pixel from center of block
-            px = min(x + pixel_size//2, img.width - 1)
-            py = min(y + pixel_size//2, img.height - 1)
-            c = img.pixels[py * img.width + px]
-            py5.fill(c)
-            py5.rect(x, y, pixel_size, pixel_size)
-
-
-def draw_pointillism():
-    """Pointillist rendering using palette colors."""
-    py5.background(240)
-    py5.no_stroke()
-    img.load_pixels()
-
-    for _ in range(point_density):
-        x = int(py5.random(img.width))
-        y = int(py5.random(img.height))
+    draw_effect(("pixelate", pixel_size), render_pixelate)
 
-        c = img.pixels[y * img.width + x]
-        closest = find_closest_color(c)
 
-        py5.fill(closest, 200)
-        size_val = py5.random(3, 8)
-        py5.ellipse(x, y, size_val, size_val)
+def render_pixelate(result):
+    img.load_np_pixels()
+    result.load_np_pixels()
 
+    # Get pixel from center of each block (clamped to the image)
+    ys = np.minimum(np.arange(0, img.height, pixel_size) + pixel_size//2, img.height - 1)
+    xs = np.minimum(np.arange(0, img.width, pixel_size) + pixel_size//2, img.width - 1)
+    blocks = img.np_pixels[ys[:, np.newaxis], xs]
 
-def find_closest_color(target):
-    """Find closest color in palette."""
-    min_dist = float('inf')
-    closest = palette[0]
+    # Blow each sample up to a full block, to be drawn as one image
+    blocks = blocks.repeat(pixel_size, axis=0).repeat(pixel_size, axis=1)
+    result.np_pixels[...] = blocks[:img.height, :img.width]
 
-    tr = py5.red(target)
-    tg = py5.green(target)
-    tb = py5.blue(target)
+    result.update_np_pixels()
 
-    for c in palette:
-        pr = py5.red(c)
-        pg = py5.green(c)
-        pb = py5.blue(c)
 
-        d = py5.sqrt((tr - pr)**2 + (tg - pg)**2 + (tb - pb)**2)
-        if d < min_dist:
-            min_dist = d
-            closest = c
-
-    return closest
+def draw_pointillism():
+    """Pointillist rendering using palette colors."""
+    py5.background(240)
+    # New dots every frame
+    draw_effect(("pointillism", py5.frame_count), render_pointillism)
+
+
+def render_pointillism(result):
+    width = img.width
+    height = img.height
+    img.load_np_pixels()
+
+    # Sample every point and match its palette color in one go
+    xs = rng.integers(width, size=point_density)
+    ys = rng.integers(height, size=point_density)
+    r, g, b = (img.np_pixels[ys, xs, 1:] >> 3).T
+    colors = palette_rgb[palette_lut[r, g, b]]
+    diameters = rng.integers(3, 9, size=point_density)
+
+    # Paint the dots into a pixel array instead of drawing thousands of
+    # ellipses: for each diameter, blend the dot color (alpha 200) into
+    # every pixel offset its dot covers, for all dots of that size at once
+    canvas = np.full((height, width, 3), 240, dtype=np.float32)
+    alpha = 200 / 255
+    for diameter, (dy, dx) in DOT_OFFSETS.items():
+        dots = diameters == diameter
+        dot_x = xs[dots]
+        dot_y = ys[dots]
+        dot_colors = colors[dots]
+        for oy, ox in zip(dy.tolist(), dx.tolist()):
+            px = dot_x + ox
+            py = dot_y + oy
+            inside = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+            px = px[inside]
+            py = py[inside]
+            canvas[py, px] += (dot_colors[inside] - canvas[py, px]) * alpha
+
+    result.load_np_pixels()
+    result.np_pixels[..., 0] = 255
+    result.np_pixels[..., 1:] = canvas
+    result.update_np_pixels()
+
+
+def find_closest_colors(targets):
+    """Find the index of the closest palette color to each (r, g, b) row of targets."""
+    # Squared distance from every target to every palette color; the
+    # smallest squared distance is also the smallest distance
+    diff = targets[:, np.newaxis, :].astype(np.float32) - palette_rgb
+    return (diff * diff).sum(axis=2).argmin(axis=1)
 
 
 def draw_color_shift():
     """Shift colors in HSB space."""
-    result = py5.create_image(img.width, img.height, py5.RGB)
-    img.load_pixels()
-    result.load_pixels()
-
     shift = py5.remap(py5.mouse_x, 0, py5.width, 0, 360)
 
-    py5.color_mode(py5.HSB, 360, 100, 100)
-
-    for i in range(len(img.pixels)):
-        c = img.pixels[i]
-        h = py5.hue(c)
-        s = py5.saturation(c)
-        b = py5.brightness(c)
-
-        new_h = (h + shift) % 360
-        result.pixels[i] = py5.color(new_h, s, b)
-
-    py5.color_mode(py5.RGB, 255)
-    result.update_pixels()
-    py5.image(result, 0, 0)
+    # The shader converts every pixel to hue/saturation/brightness,
+    # turns the hue and converts back on the GPU as the image is drawn
+    hue_shader.set("shift", shift / 360)
+    py5.shader(hue_shader)
+    py5.image(img, 0, 0)
+    py5.reset_shader()
 
 
 def draw_ui():
@@ -242,18 +333,8 @@ def draw_ui():
 def key_pressed():
     global mode, threshold_val, pixel_size, point_density
 
-    if py5.key == '1':
-        mode = 0
-    elif py5.key == '2':
-        mode = 1
-    elif py5.key == '3':
-        mode = 2
-    elif py5.key == '4':
-        mode = 3
-    elif py5.key == '5':
-        mode = 4
-    elif py5.key == '6':
-        mode = 5
+    if py5.key in MODE_KEYS:
+        mode = MODE_KEYS[py5.key]
     elif py5.key_code == py5.UP:
         if mode == 2:
             threshold_val = min(threshold_val + 10, 255)
@@ -15,6 +15,7 @@ Run with: python typography_py5.py
 """
 
 import py5
+import numpy as np
 
 # Mode control
 mode = 0
@@ -27,15 +28,42 @@ t = 0
 quote = "Art is not what you see, but what you make others see."
 author = "- Edgar Degas"
 
-# Particles for mode 3
-text_particles = []
+# Circular text for mode 1: the two rings' phrases, the angle of each
+# character before rotation, and the outer ring's colors from palette[0]
+# to palette[1] in 256 steps (built in setup())
+OUTER_PHRASE = "PROCESSING * PYTHON * GENERATIVE * ART * "
+INNER_PHRASE = "ART * CODE * "
+outer_angles = np.linspace(0, 2 * np.pi, len(OUTER_PHRASE), endpoint=False)
+inner_angles = np.linspace(0, 2 * np.pi, len(INNER_PHRASE), endpoint=False)
+outer_colors = []
+
+# Text widths measured so far, by (text, size)
+text_widths = {}
+
+# Particles for mode 3: one character and color per letter, with
+# positions and velocities held in parallel arrays
+text_chars = []
+text_cols = []
+text_home_x = text_home_y = None
+text_x = text_y = None
+text_vx = text_vy = None
+
+# ASCII art grid for mode 4: cell size, characters from light to dense,
+# and the noise x/y coordinates of every cell (built in setup())
+ASCII_CELL = 12
+ASCII_CHARS = " .:-=+*#%@"
+ascii_noise_x = None
+ascii_noise_y = None
+ascii_atlas = None  # Every character drawn once in a row of cells
+ascii_buf = None  # Offscreen copy of the grid, made in setup()
+ascii_shown = None  # Character index each cell of ascii_buf shows
 
 # Palette
 palette = []
 
 
 def setup():
-    global palette
+    global palette, outer_colors, ascii_noise_x, ascii_noise_y, ascii_atlas, ascii_buf, ascii_shown
 
     py5.size(800, 600)
 
@@ -47,35 +75,64 @@ def setup():
         py5.color(180, 60, 60),
     ]
 
+    outer_colors = [py5.lerp_color(palette[0], palette[1], k / 255) for k in range(256)]
+
     init_text_particles()
 
+    # One row per line of cells, one column per cell in the line
+    ascii_noise_x, ascii_noise_y = np.meshgrid(np.arange(0, py5.width, ASCII_CELL) * 0.02,
+                                               np.arange(0, py5.height, ASCII_CELL) * 0.02)
+    ascii_shown = np.zeros(ascii_noise_x.shape, int)
+    ascii_atlas = make_ascii_atlas()
+    ascii_buf = py5.create_graphics(py5.width, py5.height)
+    ascii_buf.begin_draw()
+    ascii_buf.background(20)
+    ascii_buf.end_draw()
+
     print("Lesson 14: Typography")
     print("\nControls:")
     print("  Press 1-5 to switch modes")
     print("  Press 's' to save image")
 
 
+def make_ascii_atlas():
+    """Draw each ASCII art character once, green on the grid's background.
+
+    Character i fills the cell starting at x = i * ASCII_CELL, so a grid
+    cell is painted by copying its character's cell instead of laying
+    out text.
+    """
+    cell_size = ASCII_CELL
+    atlas = py5.create_graphics(cell_size * len(ASCII_CHARS), cell_size)
+    atlas.begin_draw()
+    atlas.background(20)
+    atlas.text_size(cell_size)
+    atlas.text_align(py5.CENTER, py5.CENTER)
+    atlas.fill(0, 255, 0)
+    for i, char in enumerate(ASCII_CHARS):
+        atlas.text(char, i * cell_size + cell_size/2, cell_size/2)
+    atlas.end_draw()
+    return atlas
+
+
 def init_text_particles():
     """Create particles from text characters."""
-    global text_particles
-    text_particles = []
+    global text_chars, text_cols, text_home_x, text_home_y, text_x, text_y, text_vx, text_vy
 
     phrase = "GENERATIVE"
     char_size = 60
     start_x = 100
     start_y = 300
 
-    for i, char in enumerate(phrase):
-        text_particles.append({
-            'char': char,
-            'home_x': start_x + i * char_size,
-            'home_y': start_y,
-            'x': start_x + i * char_size,
-            'y': start_y,
-            'vx': 0,
-            'vy': 0,
-            'col': palette[i % len(palette)]
-        })
+    text_chars = list(phrase)
+    text_cols = [palette[i % len(palette)] for i in range(len(phrase))]
+
+    text_home_x = start_x + np.arange(len(phrase), dtype=np.float32) * char_size
+    text_home_y = np.full(len(phrase), start_y, np.float32)
+    text_x = text_home_x.copy()
+    text_y = text_home_y.copy()
+    text_vx = np.zeros(len(phrase), np.float32)
+    text_vy = np.zeros(len(phrase), np.float32)
 
 
 def draw():
@@ -141,7 +198,6 @@ def draw_circular_text():
     """Text arranged in a circle."""
     py5.background(30)
 
-    phrase = "PROCESSING * PYTHON * GENERATIVE * ART * "
     radius = 200
     cx = py5.width / 2
     cy = py5.height / 2
@@ -149,34 +205,36 @@ def draw_circular_text():
     py5.text_size(16)
     py5.text_align(py5.CENTER)
 
-    for i, char in enumerate(phrase):
-        angle = py5.remap(i, 0, len(phrase), 0, py5.TWO_PI) + t
-        x = cx + py5.cos(angle) * radius
-        y = cy + py5.sin(angle) * radius
+    # Positions and colors of all characters at once; the color
+    # follows (sin(angle + t) + 1) / 2 through the lookup table
+    angles = outer_angles + t
+    xs = cx + np.cos(angles) * radius
+    ys = cy + np.sin(angles) * radius
+    color_idx = ((np.sin(angles + t) + 1) * 127.5).astype(int)
 
+    for char, x, y, angle, k in zip(OUTER_PHRASE, xs.tolist(), ys.tolist(),
+                                    angles.tolist(), color_idx.tolist()):
         py5.push_matrix()
         py5.translate(x, y)
         py5.rotate(angle + py5.HALF_PI)
 
-        py5.fill(py5.lerp_color(palette[0], palette[1], (py5.sin(angle + t) + 1) / 2))
+        py5.fill(outer_colors[k])
         py5.text(char, 0, 0)
         py5.pop_matrix()
 
     # Inner circle with different text
-    inner_phrase = "ART * CODE * "
     inner_radius = 100
+    angles = inner_angles - t * 0.5
+    xs = cx + np.cos(angles) * inner_radius
+    ys = cy + np.sin(angles) * inner_radius
 
     py5.text_size(14)
-    for i, char in enumerate(inner_phrase):
-        angle = py5.remap(i, 0, len(inner_phrase), 0, py5.TWO_PI) - t * 0.5
-        x = cx + py5.cos(angle) * inner_radius
-        y = cy + py5.sin(angle) * inner_radius
-
+    py5.fill(palette[2])
+    for char, x, y, angle in zip(INNER_PHRASE, xs.tolist(), ys.tolist(), angles.tolist()):
         py5.push_matrix()
         py5.translate(x, y)
         py5.rotate(angle + py5.HALF_PI)
 
-        py5.fill(palette[2])
         py5.text(char, 0, 0)
         py5.pop_matrix()
 
@@ -199,7 +257,7 @@ def draw_wave_text():
         col = py5.lerp_color(palette[0], palette[3], i / float(len(words)))
         py5.fill(col)
 
-        word_width = py5.text_width(word + " ")
+        word_width = cached_text_width(word + " ", 28)
         py5.text(word, x_offset + word_width/2, y_base + wave)
         x_offset += word_width
 
@@ -212,34 +270,45 @@ def draw_wave_text():
     py5.text("- Pablo Picasso", py5.width/2, py5.height - 50)
 
 
+def cached_text_width(s, size):
+    """Width of s at the given text size, measured once and then reused."""
+    key = (s, size)
+    if key not in text_widths:
+        py5.text_size(size)
+        text_widths[key] = py5.text_width(s)
+    return text_widths[key]
+
+
 def draw_text_particles():
     """Interactive text particles."""
+    global text_x, text_y, text_vx, text_vy
     py5.background(250)
 
     py5.text_size(60)
     py5.text_align(py5.CENTER, py5.CENTER)
 
-    for p in text_particles:
-        dx = py5.mouse_x - p['x']
-        dy = py5.mouse_y - p['y']
-        dist_val = py5.sqrt(dx * dx + dy * dy)
+    # Update every letter at once: push away from the mouse,
+    # spring back home, damp and move
+    dx = py5.mouse_x - text_x
+    dy = py5.mouse_y - text_y
+    dist_val = np.hypot(dx, dy)
+    force = np.where(dist_val < 150, (150 - dist_val) / 150, 0)
 
-        if dist_val < 150:
-            force = (150 - dist_val) / 150
-            p['vx'] -= dx * force * 0.1
-            p['vy'] -= dy * force * 0.1
+    text_vx -= dx * force * 0.1
+    text_vy -= dy * force * 0.1
 
-        p['vx'] += (p['home_x'] - p['x']) * 0.05
-        p['vy'] += (p['home_y'] - p['y']) * 0.05
+    text_vx += (text_home_x - text_x) * 0.05
+    text_vy += (text_home_y - text_y) * 0.05
 
-        p['vx'] *= 0.9
-        p['vy'] *= 0.9
+    text_vx *= 0.9
+    text_vy *= 0.9
 
-        p['x'] += p['vx']
-        p['y'] += p['vy']
+    text_x += text_vx
+    text_y += text_vy
 
-        py5.fill(p['col'])
-        py5.text(p['char'], p['x'], p['y'])
+    for char, col, x, y in zip(text_chars, text_cols, text_x.tolist(), text_y.tolist()):
+        py5.fill(col)
+        py5.text(char, x, y)
 
     py5.fill(100)
     py5.text_size(14)
@@ -249,22 +318,29 @@ def draw_text_particles():
 
 def draw_ascii_art():
     """ASCII art style rendering."""
-    py5.background(20)
-
-    chars = " .:-=+*#%@"
-    cell_size = 12
-
-    py5.text_size(cell_size)
-    py5.text_align(py5.CENTER, py5.CENTER)
-    py5.fill(0, 255, 0)
-
-    for y in range(0, py5.height, cell_size):
-        for x in range(0, py5.width, cell_size):
-            n = py5.noise(x * 0.02, y * 0.02, t)
-            char_index = int(n * len(chars))
-            char_index = py5.constrain(char_index, 0, len(chars) - 1)
-
-            py5.text(chars[char_index], x + cell_size/2, y + cell_size/2)
+    chars = ASCII_CHARS
+    cell_size = ASCII_CELL
+
+    # Noise for every cell at once, mapped to a character index
+    n = py5.noise(ascii_noise_x, ascii_noise_y, t)
+    char_index = np.clip((n * len(chars)).astype(int), 0, len(chars) - 1)
+
+    # The noise drifts slowly, so most cells keep their character from
+    # one frame to the next: only the cells that changed get their
+    # character's cell copied from the atlas into the offscreen grid,
+    # grouped by character so copies from the same source follow each other
+    rows, cols = np.nonzero(char_index != ascii_shown)
+    new_index = char_index[rows, cols]
+    order = np.argsort(new_index, kind='stable')
+
+    ascii_buf.begin_draw()
+    for row, col, i in zip(rows[order].tolist(), cols[order].tolist(), new_index[order].tolist()):
+        ascii_buf.copy(ascii_atlas, i * cell_size, 0, cell_size, cell_size,
+                       col * cell_size, row * cell_size, cell_size, cell_size)
+    ascii_buf.end_draw()
+    ascii_shown[:] = char_index
+
+    py5.image(ascii_buf, 0, 0)
 
     py5.fill(0, 200)
     py5.no_stroke()
@@ -272,6 +348,7 @@ def draw_ascii_art():
 
     py5.fill(0, 255, 0)
     py5.text_size(32)
+    py5.text_align(py5.CENTER, py5.CENTER)
     py5.text("ASCII ART", py5.width/2, py5.height/2)
 
 
@@ -19,11 +19,12 @@ Run with: python sound_music_py5.py
 """
 
 import py5
+import numpy as np
 
 # Simulated audio data
 num_bands = 64
-spectrum = []
-waveform = []
+spectrum = None
+waveform = None
 beat_detected = False
 beat_timer = 0
 
@@ -34,21 +35,105 @@ modes = ["Spectrum", "Waveform", "Circular", "Particles"]
 # Animation
 t = 0
 
-# Palette
+# Palette, and the same colors unpacked into (r, g, b)
 palette = []
-
-# Particles for mode 3
-particles = []
+palette_rgb = []
+
+# Particles for mode 3 (a ParticlePool, made in setup())
+particles = None
+max_particles = 500
+
+rng = np.random.default_rng()
+
+# Noise x coordinates of the spectrum bands and waveform samples, and the
+# bass-heavy falloff applied across the bands (built in setup())
+band_noise_x = None
+band_falloff = None
+wave_noise_x = None
+
+# Palette color of each spectrum band, and for the circular view each
+# band's direction and blended color (built in setup())
+band_colors = []
+band_cos = None
+band_sin = None
+circle_colors = []
+
+# Waveform vertices; x is fixed and y is refilled every frame
+wave_points = None
+
+
+class ParticlePool:
+    """A fixed number of particle slots, held as NumPy arrays.
+
+    Slot i is in use when alive[i] is set; its particle is at (x[i], y[i]),
+    moves at (vx[i], vy[i]), fades out as life[i] drops from 255 and is
+    drawn in palette_rgb[col[i]]. Spawning writes into free slots (or,
+    when all are in use, the ones closest to fading out), so nothing is
+    appended or removed while the sketch runs.
+    """
+
+    def __init__(self, capacity):
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.life = np.zeros(capacity)
+        self.col = np.zeros(capacity, int)
+        self.alive = np.zeros(capacity, bool)
+
+    def clear(self):
+        self.alive[:] = False
+
+    def count(self):
+        return int(np.count_nonzero(self.alive))
+
+    def spawn(self, x, y, vx, vy):
+        """Start len(vx) particles at (x, y) with velocities (vx, vy)."""
+        # Free slots sort first, then the living particles with least life
+        slots = np.argsort(np.where(self.alive, self.life, -1), kind='stable')[:len(vx)]
+        self.x[slots] = x
+        self.y[slots] = y
+        self.vx[slots] = vx
+        self.vy[slots] = vy
+        self.life[slots] = 255
+        self.col[slots] = rng.integers(len(palette_rgb), size=len(slots))
+        self.alive[slots] = True
+
+    def update(self, gravity):
+        a = self.alive
+        self.vy[a] += gravity
+        self.x[a] += self.vx[a]
+        self.y[a] += self.vy[a]
+        self.life[a] -= 3
+        self.alive &= self.life > 0
+
+    def draw(self):
+        idx = np.flatnonzero(self.alive)
+        life = self.life[idx]
+        sizes = 2 + life * (8 / 255.0)
+        for i, x, y, a, size in zip(self.col[idx].tolist(), self.x[idx].tolist(),
+                                    self.y[idx].tolist(), life.tolist(), sizes.tolist()):
+            r, g, b = palette_rgb[i]
+            py5.fill(r, g, b, a)
+            py5.ellipse(x, y, size, size)
 
 
 def setup():
-    global spectrum, waveform, palette
+    global spectrum, waveform, palette, palette_rgb, band_noise_x, band_falloff, wave_noise_x
+    global band_colors, band_cos, band_sin, circle_colors, wave_points, particles
 
     py5.size(800, 600)
 
     # Initialize simulated spectrum
-    spectrum = [0] * num_bands
-    waveform = [0] * 256
+    spectrum = np.zeros(num_bands, np.float32)
+    waveform = np.zeros(256, np.float32)
+
+    bands = np.arange(num_bands)
+    band_noise_x = bands * 0.1
+    band_falloff = 1 - bands / float(num_bands)
+    wave_noise_x = np.arange(len(waveform)) * 0.02
+    wave_points = np.empty((len(waveform), 2), np.float32)
+    wave_points[:, 0] = np.arange(len(waveform)) * py5.width / len(waveform)
 
     palette = [
         py5.color(66, 133, 244),
@@ -57,6 +142,18 @@ def setup():
         py5.color(15, 157, 88),
         py5.color(156, 39, 176),
     ]
+    palette_rgb = [(py5.red(c), py5.green(c), py5.blue(c)) for c in palette]
+    particles = ParticlePool(max_particles)
+
+    # Bands are split evenly across the palette, low bands first
+    color_index = np.minimum(bands * len(palette) // num_bands, len(palette) - 1)
+    band_colors = [palette[k] for k in color_index.tolist()]
+
+    band_angles = bands * py5.TWO_PI / num_bands
+    band_cos = np.cos(band_angles)
+    band_sin = np.sin(band_angles)
+    circle_colors = [py5.lerp_color(palette[0], palette[4], i / float(num_bands))
+                     for i in range(num_bands)]
 
     print("Lesson 15: Sound Visualization")
     print("\nControls:")
@@ -95,20 +192,18 @@ def update_simulated_audio():
     """Generate simulated audio data using noise."""
     global spectrum, waveform
 
-    # Simulate spectrum (bass heavy with decay)
-    for i in range(num_bands):
-        target = py5.noise(i * 0.1, t) * (1 - i / float(num_bands))
-        # Add beat boost to low frequencies
-        if beat_timer > 0 and i < 8:
-            target += 0.5 * (beat_timer / 30.0)
-        spectrum[i] = py5.lerp(spectrum[i], target, 0.3)
+    # Simulate spectrum (bass heavy with decay), all bands at once
+    target = py5.noise(band_noise_x, t) * band_falloff
+    # Add beat boost to low frequencies
+    if beat_timer > 0:
+        target[:8] += 0.5 * (beat_timer / 30.0)
+    spectrum += (target - spectrum) * 0.3
 
     # Simulate waveform
-    for i in range(len(waveform)):
-        waveform[i] = py5.noise(i * 0.02, t * 3) * 2 - 1
-        # Add beat influence
-        if beat_timer > 0:
-            waveform[i] *= 1 + (beat_timer / 60.0)
+    waveform[:] = py5.noise(wave_noise_x, t * 3) * 2 - 1
+    # Add beat influence
+    if beat_timer > 0:
+        waveform *= 1 + (beat_timer / 60.0)
 
 
 def draw_spectrum():
@@ -117,20 +212,22 @@ def draw_spectrum():
 
     bar_width = py5.width / float(num_bands)
 
-    for i in range(num_bands):
-        bar_height = spectrum[i] * py5.height * 0.8
-
-        col_index = int(py5.remap(i, 0, num_bands, 0, len(palette)))
-        col_index = py5.constrain(col_index, 0, len(palette) - 1)
-        col = palette[col_index]
+    # Bar positions and sizes for all bands at once
+    xs = np.arange(num_bands) * bar_width
+    heights = spectrum * py5.height * 0.8
+    tops = py5.height - heights
+    bars = list(zip(xs.tolist(), tops.tolist(), heights.tolist()))
 
-        py5.no_stroke()
+    py5.no_stroke()
+    for col, (x, top, bar_height) in zip(band_colors, bars):
         py5.fill(col)
-        py5.rect(i * bar_width, py5.height - bar_height, bar_width - 2, bar_height)
+        py5.rect(x, top, bar_width - 2, bar_height)
 
-        if beat_timer > 0 and i < 10:
-            py5.fill(255, beat_timer * 8)
-            py5.rect(i * bar_width, py5.height - bar_height, bar_width - 2, bar_height)
+    # Flash the bass bars on a beat
+    if beat_timer > 0:
+        py5.fill(255, beat_timer * 8)
+        for x, top, bar_height in bars[:10]:
+            py5.rect(x, top, bar_width - 2, bar_height)
 
 
 def draw_waveform():
@@ -145,11 +242,9 @@ def draw_waveform():
     py5.stroke_weight(2)
     py5.no_fill()
 
+    wave_points[:, 1] = py5.height/2 + waveform * py5.height * 0.3
     py5.begin_shape()
-    for i in range(len(waveform)):
-        x = py5.remap(i, 0, len(waveform), 0, py5.width)
-        y = py5.height/2 + waveform[i] * py5.height * 0.3
-        py5.vertex(x, y)
+    py5.vertices(wave_points)
     py5.end_shape()
 
     if beat_timer > 0:
@@ -169,23 +264,19 @@ def draw_circular():
     py5.no_fill()
     py5.stroke_weight(3)
 
-    for i in range(num_bands):
-        angle1 = py5.remap(i, 0, num_bands, 0, py5.TWO_PI)
-
-        r = base_radius + spectrum[i] * 200
-
-        if beat_timer > 0:
-            r += beat_timer * 2
+    # Inner and outer end of every band's line at once
+    r = base_radius + spectrum * 200
+    if beat_timer > 0:
+        r += beat_timer * 2
 
-        x1 = cx + py5.cos(angle1) * base_radius
-        y1 = cy + py5.sin(angle1) * base_radius
-        x2 = cx + py5.cos(angle1) * r
-        y2 = cy + py5.sin(angle1) * r
+    x1 = cx + band_cos * base_radius
+    y1 = cy + band_sin * base_radius
+    x2 = cx + band_cos * r
+    y2 = cy + band_sin * r
 
-        col = py5.lerp_color(palette[0], palette[4], float(i) / num_bands)
+    for col, line in zip(circle_colors, np.column_stack((x1, y1, x2, y2)).tolist()):
         py5.stroke(col)
-
-        py5.line(x1, y1, x2, y2)
+        py5.line(*line)
 
     py5.no_stroke()
     py5.fill(palette[2], 100)
@@ -195,59 +286,29 @@ def draw_circular():
 
 def draw_particle_reactive():
     """Particle system reacting to audio."""
-    global particles
-
     py5.no_stroke()
     py5.fill(20, 50)
     py5.rect(0, 0, py5.width, py5.height)
 
     if beat_timer == 29:
-        for _ in range(30):
-            particles.append({
-                'x': py5.width/2,
-                'y': py5.height/2,
-                'vx': py5.random(-10, 10),
-                'vy': py5.random(-10, 10),
-                'life': 255,
-                'col': palette[int(py5.random(len(palette)))]
-            })
+        particles.spawn(py5.width/2, py5.height/2,
+                        rng.uniform(-10, 10, 30), rng.uniform(-10, 10, 30))
 
     if py5.random(1) < spectrum[0] * 2:
-        particles.append({
-            'x': py5.random(py5.width),
-            'y': py5.height,
-            'vx': py5.random(-2, 2),
-            'vy': py5.random(-5, -2) * (1 + spectrum[0] * 3),
-            'life': 255,
-            'col': palette[int(py5.random(len(palette)))]
-        })
-
-    for i in range(len(particles) - 1, -1, -1):
-        p = particles[i]
-
-        p['vy'] += spectrum[0] * 0.5 - 0.1
-
-        p['x'] += p['vx']
-        p['y'] += p['vy']
-        p['life'] -= 3
-
-        py5.fill(py5.red(p['col']), py5.green(p['col']), py5.blue(p['col']), p['life'])
-        size_val = py5.remap(p['life'], 0, 255, 2, 10)
-        py5.ellipse(p['x'], p['y'], size_val, size_val)
-
-        if p['life'] <= 0:
-            particles.pop(i)
+        particles.spawn(py5.random(py5.width), py5.height,
+                        [py5.random(-2, 2)], [py5.random(-5, -2) * (1 + spectrum[0] * 3)])
 
-    while len(particles) > 500:
-        particles.pop(0)
+    # Move everything, retire faded particles and draw the rest
+    particles.update(spectrum[0] * 0.5 - 0.1)
+    particles.draw()
 
     py5.fill(255)
     py5.text_size(10)
-    py5.text(f"Particles: {len(particles)}", 20, py5.height - 20)
+    py5.text(f"Particles: {particles.count()}", 20, py5.height - 20)
 
 
 def key_pressed():
-    global mode, beat_timer, particles
+    global mode, beat_timer
 
     if py5.key == '1':
         mode = 0
@@ -257,7 +318,7 @@ def key_pressed():
         mode = 2
     elif py5.key == '4':
         mode = 3
-        particles = []
+        particles.clear()
     elif py5.key == ' ':
         beat_timer = 30
     elif py5.key == 's':
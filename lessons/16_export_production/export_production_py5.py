@@ -16,85 +16,257 @@ Run with: python export_production_py5.py
 """
 
 import py5
+import math
+import numpy as np
 from pathlib import Path
 
+# Try to import numba to compile the particle simulation
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    print("Numba not available - using py5.noise() for the particles")
+
 # Export settings
 export_width = 1920
 export_height = 1080
 frame_count_export = 0
 exporting_sequence = False
 sequence_frames = 120
+export_pg = None  # High-res canvas, made on the first export and reused
 
 # Artwork parameters
 t = 0
 seed_value = 42
 
-# Color palette - deep ocean tones
+# Random numbers for the particles, and the permutation table of their
+# compiled noise, both remade from seed_value
+rng = np.random.default_rng(seed_value)
+noise_perm = None
+
+# Color palette - deep ocean tones, also unpacked into (r, g, b)
 palette = []
+palette_rgb = []
+
+# Wave vertices: their x positions, and an (x, y) buffer whose y
+# column is refilled for each layer (built in setup())
+wave_xs = None
+wave_points = None
+
+# Pre-rendered UI panel (created in setup()), redrawn when the seed changes
+ui_panel = None
 
 # Particle system
-particles = []
+particles = None
 num_particles = 200
 
 
-class Particle:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.prev_x = x
-        self.prev_y = y
-        self.color_idx = int(py5.random(5))
-        self.speed = py5.random(1, 3)
-        self.life = py5.random(100, 300)
-        self.max_life = self.life
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _fade(t):
+        return t * t * t * (t * (t * 6 - 15) + 10)
+
+    @njit(cache=True, fastmath=True)
+    def _lerp(t, a, b):
+        return a + t * (b - a)
+
+    @njit(cache=True, fastmath=True)
+    def _grad(h, x, y, z):
+        # One of twelve gradient directions (edges of a cube)
+        h &= 15
+        u = x if h < 8 else y
+        v = y if h < 4 else (x if h == 12 or h == 14 else z)
+        return (u if h & 1 == 0 else -u) + (v if h & 2 == 0 else -v)
+
+    @njit(cache=True, fastmath=True)
+    def _perlin(perm, x, y, z):
+        """Classic 3D Perlin noise in about -1 to 1."""
+        xi = int(math.floor(x))
+        yi = int(math.floor(y))
+        zi = int(math.floor(z))
+        xf = x - xi
+        yf = y - yi
+        zf = z - zi
+        xi &= 255
+        yi &= 255
+        zi &= 255
+        u = _fade(xf)
+        v = _fade(yf)
+        w = _fade(zf)
+        a = perm[xi] + yi
+        aa = perm[a] + zi
+        ab = perm[a + 1] + zi
+        b = perm[xi + 1] + yi
+        ba = perm[b] + zi
+        bb = perm[b + 1] + zi
+        near = _lerp(v, _lerp(u, _grad(perm[aa], xf, yf, zf),
+                              _grad(perm[ba], xf - 1, yf, zf)),
+                     _lerp(u, _grad(perm[ab], xf, yf - 1, zf),
+                           _grad(perm[bb], xf - 1, yf - 1, zf)))
+        far = _lerp(v, _lerp(u, _grad(perm[aa + 1], xf, yf, zf - 1),
+                             _grad(perm[ba + 1], xf - 1, yf, zf - 1)),
+                    _lerp(u, _grad(perm[ab + 1], xf, yf - 1, zf - 1),
+                          _grad(perm[bb + 1], xf - 1, yf - 1, zf - 1)))
+        return _lerp(w, near, far)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def step_particles(perm, x, y, prev_x, prev_y, speed, life, noise_scale, z, w, h):
+        """Move every particle one frame along the noise field, in place.
+
+        The direction is 6 * PI * noise(x, y, z) (scaled), with noise as
+        4-octave Perlin noise mapped to 0-1 like py5.noise(); particles
+        leaving the w x h area wrap to the other side. The particles are
+        updated in parallel.
+        """
+        for i in prange(len(x)):
+            prev_x[i] = x[i]
+            prev_y[i] = y[i]
+
+            nx = x[i] * noise_scale
+            ny = y[i] * noise_scale
+            nz = z
+            total = 0.0
+            amp = 0.5
+            for _ in range(4):  # Octaves halve in weight, like noise()
+                total += amp * _perlin(perm, nx, ny, nz)
+                nx *= 2.0
+                ny *= 2.0
+                nz *= 2.0
+                amp *= 0.5
+            angle = (total * 0.5 + 0.5) * 6 * math.pi
+
+            x[i] += math.cos(angle) * speed[i]
+            y[i] += math.sin(angle) * speed[i]
+            life[i] -= 1
+
+            # Wrap around edges
+            if x[i] < 0:
+                x[i] = w
+                prev_x[i] = x[i]
+            elif x[i] > w:
+                x[i] = 0
+                prev_x[i] = x[i]
+            if y[i] < 0:
+                y[i] = h
+                prev_y[i] = y[i]
+            elif y[i] > h:
+                y[i] = 0
+                prev_y[i] = y[i]
+else:
+    def step_particles(perm, x, y, prev_x, prev_y, speed, life, noise_scale, z, w, h):
+        """Move every particle one frame along the noise field, in place.
+
+        Same as the compiled version, with py5.noise() evaluated for all
+        particles at once (perm is unused).
+        """
+        prev_x[:] = x
+        prev_y[:] = y
+
+        angle = py5.noise(x * noise_scale, y * noise_scale, z) * py5.TWO_PI * 3
+        x += np.cos(angle) * speed
+        y += np.sin(angle) * speed
+        life -= 1
+
+        # Wrap around edges
+        left, right = x < 0, x > w
+        x[left] = w
+        x[right] = 0
+        wrapped = left | right
+        prev_x[wrapped] = x[wrapped]
+
+        top, bottom = y < 0, y > h
+        y[top] = h
+        y[bottom] = 0
+        wrapped = top | bottom
+        prev_y[wrapped] = y[wrapped]
+
+
+class ParticleSystem:
+    """All the flowing particles, as NumPy arrays.
+
+    Particle i is at (x[i], y[i]), was at (prev_x[i], prev_y[i]) last
+    frame, moves at speed[i], is drawn in palette[color_idx[i]] and
+    fades out as life[i] runs down from max_life[i]. Moving, wrapping
+    and respawning are array operations for all particles at once.
+    """
+
+    def __init__(self, count):
+        self.x = np.zeros(count)
+        self.y = np.zeros(count)
+        self.prev_x = np.zeros(count)
+        self.prev_y = np.zeros(count)
+        self.color_idx = np.zeros(count, np.int32)
+        self.speed = np.zeros(count)
+        self.life = np.zeros(count)
+        self.max_life = np.zeros(count)
+        self.spawn(np.arange(count))
+
+    def spawn(self, idx):
+        """Start the particles at the indices idx afresh."""
+        n = len(idx)
+        self.x[idx] = rng.uniform(0, py5.width, n)
+        self.y[idx] = rng.uniform(0, py5.height, n)
+        self.prev_x[idx] = self.x[idx]
+        self.prev_y[idx] = self.y[idx]
+        self.color_idx[idx] = rng.integers(5, size=n)
+        self.speed[idx] = rng.uniform(1, 3, n)
+        self.life[idx] = rng.uniform(100, 300, n)
+        self.max_life[idx] = self.life[idx]
 
     def update(self, time_val):
-        self.prev_x = self.x
-        self.prev_y = self.y
+        # Follow the noise field and wrap around the edges
+        step_particles(noise_perm, self.x, self.y, self.prev_x, self.prev_y, self.speed,
+                       self.life, 0.003, time_val * 0.5, py5.width, py5.height)
+
+    def respawn_dead(self):
+        """Replace the particles whose life has run out."""
+        self.spawn(np.flatnonzero(self.life <= 0))
 
-        # Use noise to determine movement direction
-        noise_scale = 0.003
-        angle = py5.noise(self.x * noise_scale, self.y * noise_scale, time_val * 0.5) * py5.TWO_PI * 3
+    def draw(self, pg=None):
+        target = pg if pg else py5
 
-        self.x += py5.cos(angle) * self.speed
-        self.y += py5.sin(angle) * self.speed
+        # Particles that just died are left out (they would be invisible)
+        alive = np.flatnonzero(self.life > 0)
+        segments = np.column_stack((self.prev_x, self.prev_y, self.x, self.y))[alive]
+        target.stroke_weight(1.5)
+        draw_faded_segments(target, segments, self.color_idx[alive],
+                            self.life[alive] / self.max_life[alive], 8)
 
-        self.life -= 1
 
-        # Wrap around edges
-        if self.x < 0:
-            self.x = py5.width
-            self.prev_x = self.x
-        if self.x > py5.width:
-            self.x = 0
-            self.prev_x = self.x
-        if self.y < 0:
-            self.y = py5.height
-            self.prev_y = self.y
-        if self.y > py5.height:
-            self.y = 0
-            self.prev_y = self.y
-
-    def is_dead(self):
-        return self.life <= 0
+def draw_faded_segments(target, segments, color_idx, fade, levels):
+    """Draw line segments in palette colors, faded by fade (0-1).
 
-    def draw(self, pg=None):
-        target = pg if pg else py5
+    The alpha (up to 180) is quantized to the given number of levels and
+    the segments are grouped by (color, alpha level), so each group is
+    one stroke change and one lines() call.
+    """
+    level = np.clip((fade * levels).astype(int), 0, levels - 1)
+    keys = color_idx * levels + level
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    segments = segments[order]
 
-        alpha = py5.remap(self.life, 0, self.max_life, 0, 180)
-        col = palette[self.color_idx]
+    starts = np.flatnonzero(np.diff(keys, prepend=-1))
+    ends = np.append(starts[1:], len(keys))
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        key = int(keys[start])
+        r, g, b = palette_rgb[key // levels]
+        target.stroke(r, g, b, (key % levels + 0.5) * 180 / levels)
+        target.lines(segments[start:end])
 
-        r = py5.red(col)
-        g = py5.green(col)
-        b = py5.blue(col)
 
-        target.stroke(r, g, b, alpha)
-        target.stroke_weight(1.5)
-        target.line(self.prev_x, self.prev_y, self.x, self.y)
+def seed_noise(seed_rng):
+    """Draw a permutation table for the compiled noise from seed_rng.
+
+    The table is repeated twice so lookups never wrap.
+    """
+    perm = seed_rng.permutation(256)
+    return np.concatenate((perm, perm)).astype(np.int32)
 
 
 def setup():
-    global palette, particles
+    global palette, palette_rgb, particles, wave_xs, wave_points, rng, noise_perm, ui_panel
 
     py5.size(800, 600)
 
@@ -106,13 +278,21 @@ def setup():
         py5.color(180, 120, 80),    # Warm amber
         py5.color(220, 180, 140),   # Soft cream
     ]
+    palette_rgb = [(py5.red(c), py5.green(c), py5.blue(c)) for c in palette]
 
     py5.random_seed(seed_value)
     py5.noise_seed(seed_value)
+    rng = np.random.default_rng(seed_value)
+    noise_perm = seed_noise(rng)
 
     # Initialize particles
-    for _ in range(num_particles):
-        particles.append(Particle(py5.random(py5.width), py5.random(py5.height)))
+    particles = ParticleSystem(num_particles)
+
+    wave_xs = np.arange(0, py5.width + 10, 8)
+    wave_points = np.empty((len(wave_xs), 2), np.float32)
+    wave_points[:, 0] = wave_xs
+    ui_panel = py5.create_graphics(180, 90)
+    render_ui_panel()
 
     # Create export folders
     Path("export").mkdir(exist_ok=True)
@@ -130,7 +310,7 @@ def setup():
 
 
 def draw():
-    global t, frame_count_export, particles
+    global t, frame_count_export
 
     # Semi-transparent overlay for trail effect
     py5.fill(8, 12, 20, 15)
@@ -140,15 +320,10 @@ def draw():
     # Draw terrain-like noise waves in background
     draw_noise_waves()
 
-    # Update and draw particles
-    for p in particles:
-        p.update(t)
-        p.draw()
-
-    # Replace dead particles
-    particles = [p for p in particles if not p.is_dead()]
-    while len(particles) < num_particles:
-        particles.append(Particle(py5.random(py5.width), py5.random(py5.height)))
+    # Update and draw particles, then replace dead ones
+    particles.update(t)
+    particles.draw()
+    particles.respawn_dead()
 
     # Handle sequence export
     if exporting_sequence:
@@ -185,42 +360,58 @@ def draw_noise_waves():
         py5.stroke(palette[layer + 1])
         py5.stroke_weight(1)
 
+        wave_points[:, 1] = py5.height * 0.4 + wave_heights(wave_xs, t, layer_offset) + y_offset
+
         py5.begin_shape()
-        for x in range(0, py5.width + 10, 8):
-            # Combine multiple noise octaves
-            n1 = py5.noise(x * 0.008 + layer_offset, t + layer_offset) * 100
-            n2 = py5.noise(x * 0.015 + layer_offset, t * 1.5 + layer_offset) * 50
-            n3 = py5.noise(x * 0.003 + layer_offset, t * 0.5 + layer_offset) * 150
+        py5.curve_vertices(wave_points)
+        py5.end_shape()
 
-            y = py5.height * 0.4 + n1 + n2 + n3 + y_offset
 
-            py5.curve_vertex(x, y)
-        py5.end_shape()
+def wave_heights(xs, time_val, layer_offset):
+    """Height of a wave layer above its baseline at the screen x positions xs.
+
+    Combines three noise octaves, each evaluated for all positions at once.
+    """
+    n1 = py5.noise(xs * 0.008 + layer_offset, time_val + layer_offset) * 100
+    n2 = py5.noise(xs * 0.015 + layer_offset, time_val * 1.5 + layer_offset) * 50
+    n3 = py5.noise(xs * 0.003 + layer_offset, time_val * 0.5 + layer_offset) * 150
+    return n1 + n2 + n3
 
 
 def draw_ui():
-    """Draw minimal UI overlay."""
-    py5.fill(255, 180)
-    py5.no_stroke()
-    py5.rect(10, 10, 180, 90, 5)
+    """Draw minimal UI overlay (pre-rendered by render_ui_panel())."""
+    py5.image(ui_panel, 10, 10)
+
 
-    py5.fill(20)
-    py5.text_size(13)
-    py5.text("Export Options", 20, 30)
+def render_ui_panel():
+    """Render the UI panel for the current seed into ui_panel."""
+    panel = ui_panel
+    panel.begin_draw()
+    panel.clear()
+    panel.fill(255, 180)
+    panel.no_stroke()
+    panel.rect(0, 0, 180, 90, 5)
 
-    py5.text_size(10)
-    py5.fill(60)
-    py5.text("p: PNG  |  h: High-res", 20, 48)
-    py5.text("v: Video sequence", 20, 62)
-    py5.text("r: New seed", 20, 76)
-    py5.text(f"Seed: {seed_value}", 20, 90)
+    panel.fill(20)
+    panel.text_size(13)
+    panel.text("Export Options", 10, 20)
+
+    panel.text_size(10)
+    panel.fill(60)
+    panel.text("p: PNG  |  h: High-res", 10, 38)
+    panel.text("v: Video sequence", 10, 52)
+    panel.text("r: New seed", 10, 66)
+    panel.text(f"Seed: {seed_value}", 10, 80)
+    panel.end_draw()
 
 
 def save_high_res():
     """Save high-resolution version of the artwork."""
-    global particles
+    global particles, export_pg
 
-    pg = py5.create_graphics(export_width, export_height)
+    if export_pg is None:
+        export_pg = py5.create_graphics(export_width, export_height)
+    pg = export_pg
 
     scale_x = export_width / float(py5.width)
     scale_y = export_height / float(py5.height)
@@ -232,22 +423,28 @@ def save_high_res():
     pg.begin_draw()
     pg.background(8, 12, 20)
 
-    # Build up the image over multiple iterations
-    hi_res_particles = []
-    for _ in range(int(num_particles * 1.5)):
-        hi_res_particles.append({
-            'x': py5.random(export_width),
-            'y': py5.random(export_height),
-            'prev_x': 0,
-            'prev_y': 0,
-            'color_idx': int(py5.random(5)),
-            'speed': py5.random(1, 3) * scale_x,
-            'life': py5.random(100, 300),
-            'max_life': 0
-        })
-        hi_res_particles[-1]['prev_x'] = hi_res_particles[-1]['x']
-        hi_res_particles[-1]['prev_y'] = hi_res_particles[-1]['y']
-        hi_res_particles[-1]['max_life'] = hi_res_particles[-1]['life']
+    # Random numbers of its own, seeded so each seed exports the same
+    # image without disturbing the live particles
+    hi_res_rng = np.random.default_rng(seed_value)
+
+    perm = seed_noise(hi_res_rng)
+
+    # Build up the image over multiple iterations, with the particles
+    # held as arrays so each frame moves them all in one step
+    count = int(num_particles * 1.5)
+    xs = hi_res_rng.uniform(0, export_width, count)
+    ys = hi_res_rng.uniform(0, export_height, count)
+    prev_xs = xs.copy()
+    prev_ys = ys.copy()
+    color_idx = hi_res_rng.integers(5, size=count)
+    speed = hi_res_rng.uniform(1, 3, count) * scale_x
+    life = hi_res_rng.uniform(100, 300, count)
+    max_life = life.copy()
+    noise_scale = 0.003 / scale_x
+
+    hi_res_xs = np.arange(0, export_width + 10, int(8 * scale_x))
+    hi_res_points = np.empty((len(hi_res_xs), 2), np.float32)
+    hi_res_points[:, 0] = hi_res_xs
 
     # Simulate many frames
     sim_time = 0
@@ -263,62 +460,31 @@ def save_high_res():
             layer_offset = layer * 0.5
             y_offset = layer * 60 * scale_y
 
-            col = palette[layer + 1]
-            pg.stroke(py5.red(col), py5.green(col), py5.blue(col))
+            r, g, b = palette_rgb[layer + 1]
+            pg.stroke(r, g, b)
             pg.stroke_weight(1 * scale_x)
 
-            pg.begin_shape()
-            for x in range(0, export_width + 10, int(8 * scale_x)):
-                n1 = py5.noise(x * 0.008 / scale_x + layer_offset, sim_time + layer_offset) * 100 * scale_y
-                n2 = py5.noise(x * 0.015 / scale_x + layer_offset, sim_time * 1.5 + layer_offset) * 50 * scale_y
-                n3 = py5.noise(x * 0.003 / scale_x + layer_offset, sim_time * 0.5 + layer_offset) * 150 * scale_y
+            hi_res_points[:, 1] = (export_height * 0.4 + y_offset
+                                   + wave_heights(hi_res_xs / scale_x, sim_time, layer_offset) * scale_y)
 
-                y = export_height * 0.4 + n1 + n2 + n3 + y_offset
-                pg.curve_vertex(x, y)
+            pg.begin_shape()
+            pg.curve_vertices(hi_res_points)
             pg.end_shape()
 
-        # Update and draw particles
-        for p in hi_res_particles:
-            p['prev_x'] = p['x']
-            p['prev_y'] = p['y']
-
-            noise_scale = 0.003 / scale_x
-            angle = py5.noise(p['x'] * noise_scale, p['y'] * noise_scale, sim_time * 0.5) * py5.TWO_PI * 3
-
-            p['x'] += py5.cos(angle) * p['speed']
-            p['y'] += py5.sin(angle) * p['speed']
-            p['life'] -= 1
-
-            # Wrap
-            if p['x'] < 0:
-                p['x'] = export_width
-                p['prev_x'] = p['x']
-            if p['x'] > export_width:
-                p['x'] = 0
-                p['prev_x'] = p['x']
-            if p['y'] < 0:
-                p['y'] = export_height
-                p['prev_y'] = p['y']
-            if p['y'] > export_height:
-                p['y'] = 0
-                p['prev_y'] = p['y']
-
-            # Draw
-            if p['life'] > 0:
-                alpha = py5.remap(p['life'], 0, p['max_life'], 0, 180)
-                col = palette[p['color_idx']]
-                pg.stroke(py5.red(col), py5.green(col), py5.blue(col), alpha)
-                pg.stroke_weight(1.5 * scale_x)
-                pg.line(p['prev_x'], p['prev_y'], p['x'], p['y'])
-
-            # Respawn dead particles
-            if p['life'] <= 0:
-                p['x'] = py5.random(export_width)
-                p['y'] = py5.random(export_height)
-                p['prev_x'] = p['x']
-                p['prev_y'] = p['y']
-                p['life'] = py5.random(100, 300)
-                p['max_life'] = p['life']
+        # Update all particles, then draw the living ones
+        step_particles(perm, xs, ys, prev_xs, prev_ys, speed, life,
+                       noise_scale, sim_time * 0.5, export_width, export_height)
+
+        alive = np.flatnonzero(life > 0)
+        segments = np.column_stack((prev_xs, prev_ys, xs, ys))[alive]
+        pg.stroke_weight(1.5 * scale_x)
+        draw_faded_segments(pg, segments, color_idx[alive], life[alive] / max_life[alive], 16)
+
+        # Respawn dead particles
+        dead = np.flatnonzero(life <= 0)
+        xs[dead] = prev_xs[dead] = hi_res_rng.uniform(0, export_width, len(dead))
+        ys[dead] = prev_ys[dead] = hi_res_rng.uniform(0, export_height, len(dead))
+        life[dead] = max_life[dead] = hi_res_rng.uniform(100, 300, len(dead))
 
         sim_time += 0.008
 
@@ -332,7 +498,7 @@ def save_high_res():
 
 def start_sequence_export():
     """Start exporting frame sequence."""
-    global exporting_sequence, frame_count_export, t, particles
+    global exporting_sequence, frame_count_export, t, particles, rng, noise_perm
 
     exporting_sequence = True
     frame_count_export = 0
@@ -340,11 +506,11 @@ def start_sequence_export():
 
     py5.random_seed(seed_value)
     py5.noise_seed(seed_value)
+    rng = np.random.default_rng(seed_value)
+    noise_perm = seed_noise(rng)
 
     # Reset particles
-    particles = []
-    for _ in range(num_particles):
-        particles.append(Particle(py5.random(py5.width), py5.random(py5.height)))
+    particles = ParticleSystem(num_particles)
 
     py5.background(8, 12, 20)
 
@@ -364,7 +530,7 @@ def stop_sequence_export():
 
 
 def key_pressed():
-    global seed_value, particles, t
+    global seed_value, particles, t, rng, noise_perm
 
     if py5.key == 'p':
         filename = f"export/screen_{seed_value}_{py5.millis()}.png"
@@ -383,12 +549,13 @@ def key_pressed():
         seed_value = int(py5.random(100000))
         py5.random_seed(seed_value)
         py5.noise_seed(seed_value)
+        rng = np.random.default_rng(seed_value)
+        noise_perm = seed_noise(rng)
+        render_ui_panel()
         t = 0
 
         # Reset particles with new seed
-        particles = []
-        for _ in range(num_particles):
-            particles.append(Particle(py5.random(py5.width), py5.random(py5.height)))
+        particles = ParticleSystem(num_particles)
 
         py5.background(8, 12, 20)
         print(f"New seed: {seed_value}")
@@ -19,8 +19,18 @@ Run with: python capstone_py5.py
 """
 
 import py5
+import math
+import numpy as np
 from pathlib import Path
 
+# Try to import numba to compile the particle step
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    print("Numba not available - using NumPy for the particle step")
+
 # Artist profiles (from renoir analysis)
 artists = {}
 current_artist = "monet"
@@ -29,12 +39,24 @@ current_artist = "monet"
 cols = 0
 rows = 0
 scale = 15
-field = []
+field_step = 2  # Noise is sampled every field_step cells, interpolated in between
+field = None  # Angle at each (col, row) sample, a float32 array
+
+# The field moves slowly through z, so it's interpolated between two
+# noise slices field_dz apart, and a new slice is only sampled when
+# z_offset passes the upper one
+field_dz = 0.1
+field_lo = None  # Angles at z = field_z
+field_hi = None  # Angles at z = field_z + field_dz
+field_z = 0
+field_artist = None  # Artist the slices were sampled for
 
 # Particles
-particles = []
+particles = None
 max_particles = 800
 
+rng = np.random.default_rng()
+
 # Animation
 t = 0
 z_offset = 0
@@ -44,92 +66,296 @@ show_field = False
 show_trails = True
 show_info = True
 
-
-class ArtParticle:
-    """A particle that follows the flow field with artist-specific properties."""
-
-    def __init__(self, artist_profile):
-        self.reset(artist_profile)
-
-    def reset(self, artist_profile):
-        self.x = py5.random(py5.width)
-        self.y = py5.random(py5.height)
-        self.prev_x = self.x
-        self.prev_y = self.y
-        self.vx = 0
-        self.vy = 0
-
-        palette = artist_profile["palette"]
-        self.col = palette[int(py5.random(len(palette)))]
-        self.max_speed = py5.random(artist_profile["speed_range"][0],
-                                    artist_profile["speed_range"][1])
-        self.stroke_weight = py5.random(artist_profile["stroke_weight"][0],
-                                        artist_profile["stroke_weight"][1])
-        self.lifespan = py5.random(100, 300)
-        self.age = 0
+# Pre-rendered info panel (created in setup()), and the state it shows
+info_panel = None
+info_panel_key = None
+
+
+def dot_offsets(diameter):
+    """Pixel (dy, dx) offsets covered by a dot of this diameter around its center."""
+    center = (diameter - 1) / 2
+    dy, dx = np.nonzero(np.add.outer((np.arange(diameter) - center) ** 2,
+                                     (np.arange(diameter) - center) ** 2) <= (diameter / 2) ** 2)
+    return dy - diameter // 2, dx - diameter // 2
+
+
+# Dots (shown when trails are off) are twice the stroke weight across,
+# 2-12 pixels; their pixel offsets per diameter
+DOT_OFFSETS = {d: dot_offsets(d) for d in range(2, 13)}
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def step_particles(x, y, prev_x, prev_y, vx, vy, age, max_speed, field, spacing, w, h):
+        """Follow the field, move and wrap every particle, in place.
+
+        Does the same as ArtParticles.follow() and update() in one pass
+        per particle, with no temporary arrays; the particles are
+        updated in parallel.
+        """
+        cols, rows = field.shape
+        for i in prange(len(x)):
+            # Field samples around the particle, clamped to field bounds
+            u = min(max(x[i] / spacing, 0.0), cols - 1.0)
+            v = min(max(y[i] / spacing, 0.0), rows - 1.0)
+            col_idx = min(int(u), cols - 2)
+            row_idx = min(int(v), rows - 2)
+            fu = u - col_idx
+            fv = v - row_idx
+            angle = ((field[col_idx, row_idx] * (1 - fu) + field[col_idx + 1, row_idx] * fu) * (1 - fv)
+                     + (field[col_idx, row_idx + 1] * (1 - fu) + field[col_idx + 1, row_idx + 1] * fu) * fv)
+
+            vx[i] = math.cos(angle) * max_speed[i]
+            vy[i] = math.sin(angle) * max_speed[i]
+
+            prev_x[i] = x[i]
+            prev_y[i] = y[i]
+            x[i] += vx[i]
+            y[i] += vy[i]
+            age[i] += 1
+
+            # Wrap around edges
+            if x[i] < 0:
+                x[i] = w
+                prev_x[i] = x[i]
+            elif x[i] > w:
+                x[i] = 0
+                prev_x[i] = x[i]
+            if y[i] < 0:
+                y[i] = h
+                prev_y[i] = y[i]
+            elif y[i] > h:
+                y[i] = 0
+                prev_y[i] = y[i]
+
+
+class ArtParticles:
+    """All the particles that follow the flow field, as NumPy arrays.
+
+    Particle i is at (x[i], y[i]), was at (prev_x[i], prev_y[i]) last
+    frame, moves at velocity (vx[i], vy[i]) with speed max_speed[i],
+    and is drawn with weight stroke_weight[i] in the artist's palette
+    color col[i], fading out as age[i] approaches lifespan[i]. Following
+    the field, moving, wrapping and respawning are a few array
+    operations for all particles at once.
+    """
+
+    def __init__(self, count, artist_profile):
+        self.x = np.zeros(count)
+        self.y = np.zeros(count)
+        self.prev_x = np.zeros(count)
+        self.prev_y = np.zeros(count)
+        self.vx = np.zeros(count)
+        self.vy = np.zeros(count)
+        self.col = np.zeros(count, int)
+        self.max_speed = np.zeros(count)
+        self.stroke_weight = np.zeros(count)
+        self.lifespan = np.zeros(count)
+        self.age = np.zeros(count)
+        self.reset(np.arange(count), artist_profile)
+
+    def __len__(self):
+        return len(self.x)
+
+    def reset(self, idx, artist_profile):
+        """Start the particles at the indices idx afresh."""
+        n = len(idx)
+        self.x[idx] = rng.uniform(0, py5.width, n)
+        self.y[idx] = rng.uniform(0, py5.height, n)
+        self.prev_x[idx] = self.x[idx]
+        self.prev_y[idx] = self.y[idx]
+        self.vx[idx] = 0
+        self.vy[idx] = 0
+
+        self.col[idx] = rng.integers(len(artist_profile["palette"]), size=n)
+        self.max_speed[idx] = rng.uniform(*artist_profile["speed_range"], n)
+        self.stroke_weight[idx] = rng.uniform(*artist_profile["stroke_weight"], n)
+        self.lifespan[idx] = rng.uniform(100, 300, n)
+        self.age[idx] = 0
+
+    def step(self, field):
+        """Follow the field and move, compiled with numba when available."""
+        if NUMBA_AVAILABLE:
+            step_particles(self.x, self.y, self.prev_x, self.prev_y, self.vx, self.vy,
+                           self.age, self.max_speed, field, scale * field_step, py5.width, py5.height)
+        else:
+            self.follow(field)
+            self.update()
 
     def follow(self, field):
-        col_idx = int(self.x / scale)
-        row_idx = int(self.y / scale)
-
-        col_idx = py5.constrain(col_idx, 0, cols - 1)
-        row_idx = py5.constrain(row_idx, 0, rows - 1)
+        # Interpolate the angle between the four field samples around
+        # each particle, clamped to field bounds
+        u = np.clip(self.x / (scale * field_step), 0, cols - 1)
+        v = np.clip(self.y / (scale * field_step), 0, rows - 1)
+        col_idx = np.minimum(u.astype(int), cols - 2)
+        row_idx = np.minimum(v.astype(int), rows - 2)
+        fu = u - col_idx
+        fv = v - row_idx
 
-        angle = field[col_idx][row_idx]
+        angle = ((field[col_idx, row_idx] * (1 - fu) + field[col_idx + 1, row_idx] * fu) * (1 - fv)
+                 + (field[col_idx, row_idx + 1] * (1 - fu) + field[col_idx + 1, row_idx + 1] * fu) * fv)
 
-        self.vx = py5.cos(angle) * self.max_speed
-        self.vy = py5.sin(angle) * self.max_speed
+        self.vx = np.cos(angle) * self.max_speed
+        self.vy = np.sin(angle) * self.max_speed
 
     def update(self):
-        self.prev_x = self.x
-        self.prev_y = self.y
+        self.prev_x[:] = self.x
+        self.prev_y[:] = self.y
 
         self.x += self.vx
         self.y += self.vy
         self.age += 1
 
-        if self.x < 0:
-            self.x = py5.width
-            self.prev_x = self.x
-        if self.x > py5.width:
-            self.x = 0
-            self.prev_x = self.x
-        if self.y < 0:
-            self.y = py5.height
-            self.prev_y = self.y
-        if self.y > py5.height:
-            self.y = 0
-            self.prev_y = self.y
+        # Wrap around edges
+        left, right = self.x < 0, self.x > py5.width
+        self.x[left] = py5.width
+        self.x[right] = 0
+        wrapped = left | right
+        self.prev_x[wrapped] = self.x[wrapped]
 
-    def display(self, artist_profile):
-        life_ratio = 1 - (self.age / self.lifespan)
-        alpha = life_ratio * artist_profile["opacity"]
+        top, bottom = self.y < 0, self.y > py5.height
+        self.y[top] = py5.height
+        self.y[bottom] = 0
+        wrapped = top | bottom
+        self.prev_y[wrapped] = self.y[wrapped]
 
+    def display(self, artist_profile):
         if show_trails:
-            py5.stroke(py5.red(self.col), py5.green(self.col), py5.blue(self.col), alpha)
-            py5.stroke_weight(self.stroke_weight)
-            py5.line(self.prev_x, self.prev_y, self.x, self.y)
+            self.display_trails(artist_profile)
         else:
-            py5.no_stroke()
-            py5.fill(py5.red(self.col), py5.green(self.col), py5.blue(self.col), alpha)
-            py5.ellipse(self.x, self.y, self.stroke_weight * 2, self.stroke_weight * 2)
-
-    def is_dead(self):
-        return self.age >= self.lifespan
+            self.display_dots(artist_profile)
+
+    def display_dots(self, artist_profile):
+        """Blend every particle's dot straight into the canvas pixels.
+
+        All the dots' pixels are painted with a few NumPy blends instead
+        of one ellipse() call per particle. Each blend covers each pixel
+        at most once, so where dots overlap they build up in particle
+        order, as drawn ellipses would. Pixels and colors are handled as
+        packed 32-bit ARGB, blending two channels at a time with integer
+        arithmetic.
+        """
+        argb = artist_profile["palette_argb"][self.col]
+        # Alpha as a 0-256 weight, so the blend can shift by 8 bits
+        alphas = np.clip((1 - self.age / self.lifespan) * (artist_profile["opacity"] + 1), 0, 256).astype(np.uint32)
+        diameters = np.clip(np.rint(self.stroke_weight * 2).astype(int), 2, 12)
+        cx = np.rint(self.x).astype(int)
+        cy = np.rint(self.y).astype(int)
+
+        py5.load_np_pixels()
+        canvas = py5.np_pixels.view(np.uint32).reshape(-1)
+        h, w = py5.np_pixels.shape[:2]
+
+        # Every covered pixel of every dot, per diameter
+        pixels, owners = [], []
+        for diameter, (dy, dx) in DOT_OFFSETS.items():
+            sel = np.flatnonzero(diameters == diameter)
+            if len(sel) == 0:
+                continue
+            px = (cx[sel, np.newaxis] + dx).ravel()
+            py = (cy[sel, np.newaxis] + dy).ravel()
+            owner = np.repeat(sel, len(dx))
+            # Drop those off the canvas
+            inside = (px >= 0) & (px < w) & (py >= 0) & (py < h)
+            pixels.append(py[inside] * w + px[inside])
+            owners.append(owner[inside])
+        if not pixels:
+            py5.update_np_pixels()
+            return
+
+        # In particle order, so overlapping dots stack like drawn ones
+        owner = np.concatenate(owners)
+        order = np.argsort(owner, kind='stable')
+        pixel = np.concatenate(pixels)[order]
+        owner = owner[order]
+
+        while len(pixel):
+            # Each pixel's earliest remaining dot, blended in one pass
+            _, first = np.unique(pixel, return_index=True)
+            p = pixel[first]
+            a = alphas[owner[first]]
+            src = argb[owner[first]]
+            dst = canvas[p]
+            # Blend alternate bytes (two channels) per multiply; each
+            # 16-bit lane holds at most 255 * 256, so nothing overflows
+            even = ((src & 0x00FF00FF) * a + (dst & 0x00FF00FF) * (256 - a)) >> 8 & 0x00FF00FF
+            odd = ((src >> 8 & 0x00FF00FF) * a + (dst >> 8 & 0x00FF00FF) * (256 - a)) & 0xFF00FF00
+            canvas[p] = even | odd
+
+            rest = np.ones(len(pixel), bool)
+            rest[first] = False
+            pixel, owner = pixel[rest], owner[rest]
+        py5.update_np_pixels()
+
+    def display_trails(self, artist_profile):
+        """Draw this frame's trail segments, grouped into LINES shapes.
+
+        Segments are grouped by palette color, stroke weight (4 levels
+        across the artist's range) and fade (8 alpha levels), and each
+        group is one shape drawn from a single vertex array.
+        """
+        palette_rgb = artist_profile["palette_rgb"].tolist()
+        opacity = artist_profile["opacity"]
+        w_min, w_max = artist_profile["stroke_weight"]
+
+        # Particles at the end of their life are invisible, leave them out
+        live = np.flatnonzero(self.age < self.lifespan)
+        w_level = np.clip(((self.stroke_weight[live] - w_min) / (w_max - w_min) * 4).astype(int), 0, 3)
+        a_level = np.clip(((1 - self.age[live] / self.lifespan[live]) * 8).astype(int), 0, 7)
+        keys = (self.col[live] * 4 + w_level) * 8 + a_level
+
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        live = live[order]
+
+        # Both ends of every segment, one after the other
+        points = np.empty((2 * len(live), 2), np.float32)
+        points[0::2, 0] = self.prev_x[live]
+        points[0::2, 1] = self.prev_y[live]
+        points[1::2, 0] = self.x[live]
+        points[1::2, 1] = self.y[live]
+
+        starts = np.flatnonzero(np.diff(keys, prepend=-1))
+        ends = np.append(starts[1:], len(keys))
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            key = int(keys[start])
+            r, g, b = palette_rgb[key // 32]
+            w_level = key // 8 % 4
+            a_level = key % 8
+
+            py5.stroke(r, g, b, (a_level + 0.5) / 8 * opacity)
+            py5.stroke_weight(w_min + (w_level + 0.5) / 4 * (w_max - w_min))
+            py5.begin_shape(py5.LINES)
+            py5.vertices(points[2 * start:2 * end])
+            py5.end_shape()
+
+    def respawn_dead(self, artist_profile):
+        """Restart the particles that have reached their lifespan."""
+        self.reset(np.flatnonzero(self.age >= self.lifespan), artist_profile)
 
 
 def setup():
-    global cols, rows, field, particles
+    global cols, rows, field, particles, info_panel
 
     py5.size(1200, 800)
 
     init_artists()
 
-    cols = int(py5.width / scale) + 1
-    rows = int(py5.height / scale) + 1
-    field = [[0 for _ in range(rows)] for _ in range(cols)]
+    # One sample every field_step cells, plus one past each edge to
+    # interpolate towards
+    cols = int(py5.width / (scale * field_step)) + 2
+    rows = int(py5.height / (scale * field_step)) + 2
+    field = np.zeros((cols, rows), dtype=np.float32)
 
-    particles = [ArtParticle(artists[current_artist]) for _ in range(max_particles)]
+    # Noise x/y coordinates of each sample depend only on the artist's
+    # flow scale, so each artist gets its grids once
+    for a in artists.values():
+        a["noise_i"], a["noise_j"] = np.meshgrid(np.arange(cols) * field_step * a["flow_scale"] * 10,
+                                                 np.arange(rows) * field_step * a["flow_scale"] * 10,
+                                                 indexing='ij')
+
+    particles = ArtParticles(max_particles, artists[current_artist])
+    info_panel = py5.create_graphics(280, 130)
 
     Path("export").mkdir(exist_ok=True)
 
@@ -221,6 +447,18 @@ def init_artists():
         "flow_multiplier": 2
     }
 
+    # Unpacked (r, g, b) of the palette and background, so drawing
+    # doesn't split the colors again every frame
+    for a in artists.values():
+        a["palette_rgb"] = np.array([(py5.red(c), py5.green(c), py5.blue(c)) for c in a["palette"]],
+                                    dtype=np.float32)
+        # The same colors packed like a canvas pixel (A, R, G, B bytes)
+        argb = np.full((len(a["palette"]), 4), 255, np.uint8)
+        argb[:, 1:] = a["palette_rgb"]
+        a["palette_argb"] = argb.view(np.uint32)[:, 0]
+        c = a["background"]
+        a["background_rgb"] = (py5.red(c), py5.green(c), py5.blue(c))
+
 
 def draw():
     global z_offset, t
@@ -229,9 +467,8 @@ def draw():
 
     if show_trails:
         py5.no_stroke()
-        py5.fill(py5.red(artist["background"]),
-                 py5.green(artist["background"]),
-                 py5.blue(artist["background"]), 10)
+        r, g, b = artist["background_rgb"]
+        py5.fill(r, g, b, 10)
         py5.rect(0, 0, py5.width, py5.height)
     else:
         py5.background(artist["background"])
@@ -241,14 +478,9 @@ def draw():
     if show_field:
         draw_field()
 
-    for i in range(len(particles) - 1, -1, -1):
-        p = particles[i]
-        p.follow(field)
-        p.update()
-        p.display(artist)
-
-        if p.is_dead():
-            particles[i] = ArtParticle(artist)
+    particles.step(field)
+    particles.display(artist)
+    particles.respawn_dead(artist)
 
     z_offset += 0.002
     t += 0.01
@@ -259,63 +491,100 @@ def draw():
 
 def update_field(artist):
     """Update flow field based on artist style."""
-    flow_scale = artist["flow_scale"]
+    global field_lo, field_hi, field_z, field_artist
+
+    if field_artist is not artist or not field_z <= z_offset < field_z + 2 * field_dz:
+        # New artist (or z jumped): sample both slices afresh
+        field_z = z_offset
+        field_lo = noise_slice(artist, field_z)
+        field_hi = noise_slice(artist, field_z + field_dz)
+        field_artist = artist
+    elif z_offset >= field_z + field_dz:
+        # Moved past the upper slice: it becomes the lower one
+        field_z += field_dz
+        field_lo = field_hi
+        field_hi = noise_slice(artist, field_z + field_dz)
+
+    # Blend between the slices, written in place into the field
+    tz = (z_offset - field_z) / field_dz
+    np.subtract(field_hi, field_lo, out=field)
+    np.multiply(field, tz, out=field)
+    np.add(field, field_lo, out=field)
+
+
+def noise_slice(artist, z):
+    """Field angles for every sample at noise depth z, as a float32 array."""
+    # Noise for every sample at once
     multiplier = artist["flow_multiplier"]
-
-    for i in range(cols):
-        for j in range(rows):
-            angle = py5.noise(i * flow_scale * 10, j * flow_scale * 10, z_offset)
-            angle = angle * py5.TWO_PI * multiplier
-            field[i][j] = angle
+    return (py5.noise(artist["noise_i"], artist["noise_j"], z) * (py5.TWO_PI * multiplier)).astype(np.float32)
 
 
 def draw_field():
     """Visualize the flow field."""
-    for i in range(0, cols, 2):
-        for j in range(0, rows, 2):
-            x = i * scale
-            y = j * scale
-            angle = field[i][j]
+    # Every field sample's position, and its vector rotated by the
+    # sample's angle, worked out for all samples at once
+    angle = field
+    cx = (np.arange(cols) * scale * field_step)[:, np.newaxis]
+    cy = (np.arange(rows) * scale * field_step)[np.newaxis, :]
+
+    segments = np.empty(angle.shape + (4,))
+    segments[..., 0] = cx
+    segments[..., 1] = cy
+    segments[..., 2] = cx + np.cos(angle) * scale * 0.6
+    segments[..., 3] = cy + np.sin(angle) * scale * 0.6
 
-            py5.stroke(0, 30)
-            py5.stroke_weight(1)
-            py5.push_matrix()
-            py5.translate(x + scale/2, y + scale/2)
-            py5.rotate(angle)
-            py5.line(0, 0, scale * 0.6, 0)
-            py5.pop_matrix()
+    py5.stroke(0, 30)
+    py5.stroke_weight(1)
+    py5.lines(segments.reshape(-1, 4))
 
 
 def draw_info_panel():
-    """Draw artist info panel."""
+    """Draw artist info panel (pre-rendered by render_info_panel())."""
+    global info_panel_key
+
+    # Redraw the panel only when something it shows has changed
+    key = (current_artist, show_trails, show_field, len(particles))
+    if key != info_panel_key:
+        render_info_panel()
+        info_panel_key = key
+
+    py5.image(info_panel, 15, 15)
+
+
+def render_info_panel():
+    """Render the artist info panel for the current state into info_panel."""
     artist = artists[current_artist]
 
-    py5.fill(255, 220)
-    py5.no_stroke()
-    py5.rect(15, 15, 280, 130, 8)
+    panel = info_panel
+    panel.begin_draw()
+    panel.clear()
+    panel.fill(255, 220)
+    panel.no_stroke()
+    panel.rect(0, 0, 280, 130, 8)
 
-    py5.fill(0)
-    py5.text_size(18)
-    py5.text(artist["name"], 25, 42)
+    panel.fill(0)
+    panel.text_size(18)
+    panel.text(artist["name"], 10, 27)
 
-    py5.fill(100)
-    py5.text_size(12)
-    py5.text(artist["movement"], 25, 60)
+    panel.fill(100)
+    panel.text_size(12)
+    panel.text(artist["movement"], 10, 45)
 
-    py5.text_size(11)
-    py5.text(f"Particles: {len(particles)}", 25, 85)
-    py5.text(f"Trails: {'ON' if show_trails else 'OFF'}", 130, 85)
-    py5.text(f"Flow: {'VISIBLE' if show_field else 'HIDDEN'}", 200, 85)
+    panel.text_size(11)
+    panel.text(f"Particles: {len(particles)}", 10, 70)
+    panel.text(f"Trails: {'ON' if show_trails else 'OFF'}", 115, 70)
+    panel.text(f"Flow: {'VISIBLE' if show_field else 'HIDDEN'}", 185, 70)
 
-    py5.text("Palette:", 25, 110)
+    panel.text("Palette:", 10, 95)
     for i, c in enumerate(artist["palette"]):
-        py5.fill(c)
-        py5.no_stroke()
-        py5.rect(75 + i * 25, 98, 20, 15, 3)
+        panel.fill(c)
+        panel.no_stroke()
+        panel.rect(60 + i * 25, 83, 20, 15, 3)
 
-    py5.fill(120)
-    py5.text_size(10)
-    py5.text("Keys: 1-4 artists | f field | t trails | s save", 25, 135)
+    panel.fill(120)
+    panel.text_size(10)
+    panel.text("Keys: 1-4 artists | f field | t trails | s save", 10, 120)
+    panel.end_draw()
 
 
 def key_pressed():
@@ -337,7 +606,7 @@ def key_pressed():
     elif py5.key == 'i':
         show_info = not show_info
     elif py5.key == 'r':
-        particles = [ArtParticle(artists[current_artist]) for _ in range(max_particles)]
+        particles = ArtParticles(max_particles, artists[current_artist])
     elif py5.key == ' ':
         py5.background(artists[current_artist]["background"])
     elif py5.key == 's':
@@ -349,7 +618,7 @@ def switch_artist(artist_id):
     current_artist = artist_id
     artist = artists[current_artist]
     py5.background(artist["background"])
-    particles = [ArtParticle(artist) for _ in range(max_particles)]
+    particles = ArtParticles(max_particles, artist)
     print(f"Artist: {artist['name']}")
 
 
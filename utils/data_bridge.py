@@ -14,9 +14,15 @@ Exports include:
 """
 
 import json
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+
 try:
     from renoir import ArtistAnalyzer
     from renoir.color import ColorExtractor, ColorAnalyzer, ColorNamer
@@ -24,6 +30,85 @@ try:
 except ImportError:
     RENOIR_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _write_json(data, output_path):
+    """Write data as indented JSON, using orjson's C serializer when installed."""
+    if ORJSON_AVAILABLE:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        Path(output_path).write_bytes(orjson.dumps(data, option=options))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
+# Dominant colors per (image hash, n_colors). The statistics, temporal and
+# movement comparison exporters all ask for 5 colors, so running them on the
+# same artist clusters each image once (the movement comparison's threads
+# fill the same cache). The harmony analysis asks for 6 and keeps its own
+# entries.
+PALETTE_CACHE_SIZE = 4096
+_palette_cache = {}
+_palette_cache_lock = threading.Lock()
+_tools = threading.local()
+
+
+def _shared_tools():
+    """Return this thread's ColorExtractor and ColorAnalyzer, creating them once."""
+    if not hasattr(_tools, 'extractor'):
+        _tools.extractor = ColorExtractor()
+        _tools.color_analyzer = ColorAnalyzer()
+    return _tools.extractor, _tools.color_analyzer
+
+
+def _image_key(work):
+    """Hash identifying a work's image, using renoir's hash when it has one.
+
+    Otherwise the pixels are hashed, which is far cheaper than clustering
+    them again.
+    """
+    if work.get('image_hash'):
+        return work['image_hash']
+    pixels = np.asarray(work['image'])
+    digest = hashlib.blake2b(pixels.tobytes(), digest_size=8)
+    digest.update(str(pixels.shape).encode())
+    return digest.digest()
+
+
+def _dominant_colors(work, n_colors):
+    """extract_dominant_colors() for a work, cached by image hash."""
+    key = (_image_key(work), n_colors)
+    colors = _palette_cache.get(key)
+    if colors is None:
+        extractor, _ = _shared_tools()
+        colors = extractor.extract_dominant_colors(work['image'], n_colors=n_colors)
+        with _palette_cache_lock:
+            if len(_palette_cache) >= PALETTE_CACHE_SIZE:
+                # Drop the oldest entry (dicts keep insertion order)
+                del _palette_cache[next(iter(_palette_cache))]
+            _palette_cache[key] = colors
+    return colors
+
+
+def _palette_statistics(colors):
+    """Return (stats, temperature, diversity) for a palette, cached."""
+    return _palette_statistics_cached(tuple(tuple(int(v) for v in c) for c in colors))
+
+
+@lru_cache(maxsize=PALETTE_CACHE_SIZE)
+def _palette_statistics_cached(colors):
+    _, color_analyzer = _shared_tools()
+    colors = list(colors)
+    stats = color_analyzer.analyze_palette_statistics(colors)
+    temp = color_analyzer.analyze_color_temperature_distribution(colors)
+    diversity = color_analyzer.calculate_color_diversity(colors)
+    return stats, temp, diversity
+
 
 def export_artist_statistics(artist_id, output_path):
     """
@@ -50,14 +135,10 @@ def export_artist_statistics(artist_id, output_path):
     styles = analyzer.analyze_styles(works)
 
     # Extract color statistics from sample works
-    extractor = ColorExtractor()
-    color_analyzer = ColorAnalyzer()
-
     color_stats = []
     for work in works[:20]:  # Sample 20 works
-        colors = extractor.extract_dominant_colors(work['image'], n_colors=5)
-        stats = color_analyzer.analyze_palette_statistics(colors)
-        temp = color_analyzer.analyze_color_temperature_distribution(colors)
+        colors = _dominant_colors(work, 5)
+        stats, temp, diversity = _palette_statistics(colors)
 
         color_stats.append({
             'title': work.get('title', 'Untitled'),
@@ -65,7 +146,7 @@ def export_artist_statistics(artist_id, output_path):
             'mean_brightness': stats['mean_value'],
             'warm_ratio': temp['warm_percentage'] / 100,
             'cool_ratio': temp['cool_percentage'] / 100,
-            'diversity': color_analyzer.calculate_color_diversity(colors)
+            'diversity': diversity
         })
 
     # Aggregate statistics
@@ -93,8 +174,7 @@ def export_artist_statistics(artist_id, output_path):
         'exported_at': datetime.now().isoformat()
     }
 
-    with open(output_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    _write_json(data, output_path)
 
     print(f"Artist statistics exported to: {output_path}")
     return data
@@ -117,9 +197,11 @@ def export_movement_comparison(movement_artists, output_path):
     if not RENOIR_AVAILABLE:
         raise ImportError("renoir package required")
 
-    analyzer = ArtistAnalyzer()
-    extractor = ColorExtractor()
-    color_analyzer = ColorAnalyzer()
+    # Every artist is analyzed independently, mostly waiting on downloads,
+    # so they are spread over threads; map() keeps the results in order
+    artist_ids = [a for artists in movement_artists.values() for a in artists]
+    with ThreadPoolExecutor() as executor:
+        results = iter(list(executor.map(_movement_artist_data, artist_ids)))
 
     movements_data = {}
 
@@ -130,46 +212,62 @@ def export_movement_comparison(movement_artists, output_path):
         }
 
         for artist_id in artists:
-            print(f"Processing {artist_id}...")
-            try:
-                works = analyzer.extract_artist_works(artist_id, limit=10)
-                if not works:
-                    continue
-
-                # Get representative palette
-                all_colors = []
-                for work in works[:5]:
-                    colors = extractor.extract_dominant_colors(work['image'], n_colors=5)
-                    all_colors.extend(colors)
-
-                # Analyze colors
-                if all_colors:
-                    stats = color_analyzer.analyze_palette_statistics(all_colors[:20])
-                    temp = color_analyzer.analyze_color_temperature_distribution(all_colors[:20])
-
-                    artist_data = {
-                        'id': artist_id,
-                        'name': artist_id.replace('-', ' ').title(),
-                        'works_count': len(works),
-                        'avg_saturation': stats['mean_saturation'],
-                        'avg_brightness': stats['mean_value'],
-                        'warm_ratio': temp['warm_percentage'] / 100,
-                        'palette': [list(c) for c in all_colors[:5]]
-                    }
-                    movement_data['artists'].append(artist_data)
-
-            except Exception as e:
-                print(f"  Error processing {artist_id}: {e}")
+            artist_data = next(results)
+            if artist_data is not None:
+                movement_data['artists'].append(artist_data)
 
         movements_data[movement] = movement_data
 
-    with open(output_path, 'w') as f:
-        json.dump(movements_data, f, indent=2)
+    _write_json(movements_data, output_path)
 
     print(f"Movement comparison exported to: {output_path}")
     return movements_data
 
 
+def _movement_artist_data(artist_id):
+    """
+    Thread worker for export_movement_comparison: one artist's summary.
+
+    Returns:
+        dict with the artist's palette statistics, or None if the artist
+        has no works or couldn't be processed
+    """
+    print(f"Processing {artist_id}...")
+    try:
+        # Made in the worker, so threads don't share one analyzer
+        analyzer = ArtistAnalyzer()
+
+        works = analyzer.extract_artist_works(artist_id, limit=10)
+        if not works:
+            return None
+
+        # Get representative palette
+        all_colors = []
+        for work in works[:5]:
+            colors = _dominant_colors(work, 5)
+            all_colors.extend(colors)
+
+        # Analyze colors
+        if not all_colors:
+            return None
+
+        stats, temp, _ = _palette_statistics(all_colors[:20])
+
+        return {
+            'id': artist_id,
+            'name': artist_id.replace('-', ' ').title(),
+            'works_count': len(works),
+            'avg_saturation': stats['mean_saturation'],
+            'avg_brightness': stats['mean_value'],
+            'warm_ratio': temp['warm_percentage'] / 100,
+            'palette': [list(c) for c in all_colors[:5]]
+        }
+
+    except Exception as e:
+        print(f"  Error processing {artist_id}: {e}")
+        return None
+
+
 def export_temporal_data(artist_id, output_path):
     """
     Export temporal color evolution data for an artist.
@@ -182,9 +280,6 @@ def export_temporal_data(artist_id, output_path):
         raise ImportError("renoir package required")
 
     analyzer = ArtistAnalyzer()
-    extractor = ColorExtractor()
-    color_analyzer = ColorAnalyzer()
-
     works = analyzer.extract_artist_works(artist_id)
 
     if not works:
@@ -199,9 +294,8 @@ def export_temporal_data(artist_id, output_path):
             continue
 
         try:
-            colors = extractor.extract_dominant_colors(work['image'], n_colors=5)
-            stats = color_analyzer.analyze_palette_statistics(colors)
-            temp = color_analyzer.analyze_color_temperature_distribution(colors)
+            colors = _dominant_colors(work, 5)
+            stats, temp, diversity = _palette_statistics(colors)
 
             temporal_data.append({
                 'year': int(year),
@@ -209,7 +303,7 @@ def export_temporal_data(artist_id, output_path):
                 'saturation': stats['mean_saturation'],
                 'brightness': stats['mean_value'],
                 'warm_ratio': temp['warm_percentage'] / 100,
-                'diversity': color_analyzer.calculate_color_diversity(colors),
+                'diversity': diversity,
                 'palette': [list(c) for c in colors]
             })
         except Exception as e:
@@ -229,8 +323,7 @@ def export_temporal_data(artist_id, output_path):
         'exported_at': datetime.now().isoformat()
     }
 
-    with open(output_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    _write_json(data, output_path)
 
     print(f"Temporal data exported to: {output_path}")
     return data
@@ -248,8 +341,7 @@ def export_harmony_analysis(artist_id, output_path):
         raise ImportError("renoir package required")
 
     analyzer = ArtistAnalyzer()
-    extractor = ColorExtractor()
-    color_analyzer = ColorAnalyzer()
+    _, color_analyzer = _shared_tools()
 
     works = analyzer.extract_artist_works(artist_id, limit=20)
 
@@ -260,7 +352,7 @@ def export_harmony_analysis(artist_id, output_path):
 
     for work in works:
         try:
-            colors = extractor.extract_dominant_colors(work['image'], n_colors=6)
+            colors = _dominant_colors(work, 6)
             harmony = color_analyzer.analyze_color_harmony(colors)
 
             harmony_data.append({
@@ -289,8 +381,7 @@ def export_harmony_analysis(artist_id, output_path):
         'exported_at': datetime.now().isoformat()
     }
 
-    with open(output_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    _write_json(data, output_path)
 
     print(f"Harmony analysis exported to: {output_path}")
     return data
@@ -311,8 +402,7 @@ def create_processing_palette_file(colors, output_path, name="palette"):
         'hex': ['#{:02x}{:02x}{:02x}'.format(c[0], c[1], c[2]) for c in colors]
     }
 
-    with open(output_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    _write_json(data, output_path)
 
     print(f"Palette saved to: {output_path}")
     return data
@@ -12,6 +12,7 @@ Usage:
 
 import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 try:
@@ -22,8 +23,12 @@ except ImportError:
     RENOIR_AVAILABLE = False
     print("Warning: renoir package not installed. Install with: pip install renoir-wikiart")
 
+# Extracted palettes are kept here, so exporting the same artist again
+# doesn't download and cluster its works again
+CACHE_DIR = Path.home() / '.cache' / 'encre' / 'palettes'
 
-def extract_artist_palette(artist_id, n_colors=5, n_works=10):
+
+def extract_artist_palette(artist_id, n_colors=5, n_works=10, use_cache=True):
     """
     Extract a representative color palette from an artist's works.
 
@@ -31,10 +36,16 @@ def extract_artist_palette(artist_id, n_colors=5, n_works=10):
         artist_id: WikiArt artist identifier (e.g., 'claude-monet')
         n_colors: Number of colors to extract per work
         n_works: Number of works to sample
+        use_cache: Reuse (and store) the result in CACHE_DIR
 
     Returns:
         dict with palette data
     """
+    cache_path = CACHE_DIR / f"{artist_id}_{n_colors}_{n_works}.json"
+    if use_cache and cache_path.exists():
+        with open(cache_path) as f:
+            return json.load(f)
+
     if not RENOIR_AVAILABLE:
         raise ImportError("renoir package required. Install with: pip install renoir-wikiart")
 
@@ -63,12 +74,13 @@ def extract_artist_palette(artist_id, n_colors=5, n_works=10):
 
     # Extract overall dominant palette
     if len(all_colors) > n_colors:
-        # Re-cluster all colors to get representative palette
-        from sklearn.cluster import KMeans
+        # Re-cluster all colors to get representative palette (a few
+        # dozen RGB points, so mini-batches and 3 restarts are plenty)
+        from sklearn.cluster import MiniBatchKMeans
         import numpy as np
 
-        kmeans = KMeans(n_clusters=n_colors, random_state=42, n_init=10)
-        kmeans.fit(all_colors)
+        kmeans = MiniBatchKMeans(n_clusters=n_colors, random_state=42, n_init=3, batch_size=256)
+        kmeans.fit(np.asarray(all_colors, dtype=np.float32))
         dominant_colors = kmeans.cluster_centers_.astype(int).tolist()
     else:
         dominant_colors = [list(c) for c in all_colors[:n_colors]]
@@ -84,7 +96,7 @@ def extract_artist_palette(artist_id, n_colors=5, n_works=10):
             'family': name_data['family']
         })
 
-    return {
+    palette_data = {
         'artist': artist_id,
         'artist_display': artist_id.replace('-', ' ').title(),
         'n_works_sampled': len(works),
@@ -93,6 +105,13 @@ def extract_artist_palette(artist_id, n_colors=5, n_works=10):
         'work_palettes': work_palettes
     }
 
+    if use_cache:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, 'w') as f:
+            json.dump(palette_data, f)
+
+    return palette_data
+
 
 def export_palette_json(palette_data, output_path):
     """Export palette data to JSON file."""
@@ -101,7 +120,7 @@ def export_palette_json(palette_data, output_path):
     print(f"Palette exported to: {output_path}")
 
 
-def export_multiple_artists(artists, output_dir, n_colors=5, n_works=10):
+def export_multiple_artists(artists, output_dir, n_colors=5, n_works=10, use_cache=True):
     """
     Export palettes for multiple artists.
 
@@ -110,26 +129,40 @@ def export_multiple_artists(artists, output_dir, n_colors=5, n_works=10):
         output_dir: Directory to save JSON files
         n_colors: Colors per palette
         n_works: Works to sample per artist
+        use_cache: Reuse previously extracted palettes
     """
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
     results = {}
 
-    for artist_id in artists:
-        print(f"Extracting palette for {artist_id}...")
-        try:
-            palette = extract_artist_palette(artist_id, n_colors, n_works)
-            output_path = output_dir / f"{artist_id.replace('-', '_')}.json"
-            export_palette_json(palette, output_path)
-            results[artist_id] = 'success'
-        except Exception as e:
-            print(f"  Error: {e}")
-            results[artist_id] = f'error: {e}'
+    # Artists are independent and mostly waiting on downloads, so they
+    # are extracted in threads, saved as each one finishes
+    with ThreadPoolExecutor() as executor:
+        futures = [executor.submit(_extract_one, artist_id, n_colors, n_works, use_cache)
+                   for artist_id in artists]
+        for future in as_completed(futures):
+            artist_id, palette, error = future.result()
+            if error is None:
+                output_path = output_dir / f"{artist_id.replace('-', '_')}.json"
+                export_palette_json(palette, output_path)
+                results[artist_id] = 'success'
+            else:
+                print(f"  Error ({artist_id}): {error}")
+                results[artist_id] = f'error: {error}'
 
     return results
 
 
+def _extract_one(artist_id, n_colors, n_works, use_cache):
+    """Thread worker: extract one artist's palette, returning (artist_id, palette, error)."""
+    print(f"Extracting palette for {artist_id}...")
+    try:
+        return artist_id, extract_artist_palette(artist_id, n_colors, n_works, use_cache), None
+    except Exception as e:
+        return artist_id, None, str(e)
+
+
 # Pre-defined artist collections for common use cases
 IMPRESSIONISTS = [
     'claude-monet',
@@ -191,6 +224,11 @@ def main():
         default=10,
         help='Number of works to sample (default: 10)'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Extract palettes again instead of reusing cached ones'
+    )
 
     args = parser.parse_args()
 
@@ -202,9 +240,11 @@ def main():
             'abstract': ABSTRACT
         }
         artists = groups[args.group]
-        export_multiple_artists(artists, args.output, args.colors, args.works)
+        export_multiple_artists(artists, args.output, args.colors, args.works,
+                                use_cache=not args.no_cache)
     elif args.artist:
-        palette = extract_artist_palette(args.artist, args.colors, args.works)
+        palette = extract_artist_palette(args.artist, args.colors, args.works,
+                                         use_cache=not args.no_cache)
         export_palette_json(palette, args.output)
     else:
         parser.print_help()